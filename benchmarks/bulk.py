@@ -0,0 +1,69 @@
+"""
+Throughput of the process pool bulk engine with 1, 2, 4 and 8 workers.
+
+    python -m benchmarks.bulk [--output results.json] [--records 500000] [--chunk-size 5000]
+"""
+
+import argparse
+import os
+from time import perf_counter
+from typing import Iterator
+
+from benchmarks.common import write_results
+from oddrn_generator.bulk import OddrnRecord, generate_oddrn_chunks
+
+WORKERS = (1, 2, 4, 8)
+
+
+def records(count: int) -> Iterator[OddrnRecord]:
+    """
+    S3 keys and Postgres columns of a few servers, half of each.
+    """
+    for i in range(count):
+        if i % 2:
+            yield OddrnRecord(
+                "s3", {}, "keys", {"buckets": f"bucket{i % 4}", "keys": f"data/{i}.csv"}
+            )
+        else:
+            yield OddrnRecord(
+                "postgresql",
+                {"host_settings": f"db{i % 8}.local:5432"},
+                "tables_columns",
+                {
+                    "databases": "db",
+                    "schemas": f"schema{i % 10}",
+                    "tables": f"table{i % 1000}",
+                    "tables_columns": f"column{i}",
+                },
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="json file for results, stdout by default")
+    parser.add_argument("--records", type=int, default=500_000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = {"cpus": os.cpu_count(), "workers": {}}
+    for workers in WORKERS:
+        start = perf_counter()
+        count = sum(
+            len(chunk)
+            for chunk in generate_oddrn_chunks(
+                records(args.records), workers=workers, chunk_size=args.chunk_size
+            )
+        )
+        seconds = perf_counter() - start
+        results["workers"][workers] = {
+            "records_per_sec": round(count / seconds, 1),
+            "seconds": round(seconds, 3),
+        }
+    single = results["workers"][1]["records_per_sec"]
+    for result in results["workers"].values():
+        result["speedup"] = round(result["records_per_sec"] / single, 2)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
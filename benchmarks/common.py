@@ -0,0 +1,138 @@
+"""
+Helpers shared by the benchmarks: timing, allocation tracking, generator settings.
+"""
+
+import json
+import statistics
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Callable, Optional, Type
+
+import oddrn_generator
+from oddrn_generator.generators import Generator
+from oddrn_generator.server_models import (
+    AWSCloudModel,
+    AzureDomainCloudModel,
+    BlobStorageCloudModel,
+    GCPCloudModel,
+    HostnameModel,
+    S3CustomModel,
+)
+from tests.params import parameters_cloud, parameters_host
+
+# file for SQLitePathsModel.path, which must exist on disk
+SQLITE_FILE = "benchmark.sqlite"
+
+SERVER_SETTINGS = {
+    HostnameModel: {"host_settings": "127.0.0.1:5432"},
+    AWSCloudModel: {"cloud_settings": {"account": "123456789012", "region": "eu"}},
+    AzureDomainCloudModel: {"azure_cloud_settings": {"domain": "domain"}},
+    BlobStorageCloudModel: {
+        "azure_cloud_settings": {"account": "account", "container": "container"}
+    },
+    S3CustomModel: {"endpoint": "http://localhost:9000"},
+    GCPCloudModel: {"google_cloud_settings": {"project": "project"}},
+}
+
+
+def exported_generators() -> list[Type[Generator]]:
+    return [
+        getattr(oddrn_generator, name)
+        for name in sorted(oddrn_generator.__all__)
+        if name.endswith("Generator") and name != "Generator"
+    ]
+
+
+def server_settings(generator_cls: Type[Generator]) -> dict:
+    return SERVER_SETTINGS.get(generator_cls.server_model, {})
+
+
+def path_values(generator_cls: Type[Generator]) -> dict:
+    """
+    Path values from tests/params.py, or "some_<field>" for every field of the
+    paths model when the generator has no parameters there.
+    """
+    for cls, settings in parameters_host + parameters_cloud:
+        if cls is generator_cls:
+            return dict(settings["paths"])
+    paths_model = generator_cls.paths_model
+    return {
+        field: SQLITE_FILE if field == "path" else f"some_{field}"
+        for field in paths_model.model_fields
+        if field in paths_model.dependencies_map
+        # an alias equal to another field's name can't be populated by name
+        and paths_model.aliases.get(field) not in paths_model.model_fields
+    }
+
+
+def generator_kwargs(generator_cls: Type[Generator]) -> dict:
+    return {**server_settings(generator_cls), **path_values(generator_cls)}
+
+
+def reachable_paths(generator: Generator) -> list[str]:
+    """Available paths a fully filled generator can build an oddrn for."""
+    paths = []
+    for path in generator.available_paths:
+        try:
+            generator.get_oddrn_by_path(path)
+        except Exception:
+            continue
+        paths.append(path)
+    return paths
+
+
+def measure(func: Callable[[], object], number: int = 100, repeat: int = 100) -> dict:
+    """
+    Time ``repeat`` batches of ``number`` calls; percentiles are over batch means.
+    """
+    for _ in range(number):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        for _ in range(number):
+            func()
+        samples.append((perf_counter_ns() - start) / number)
+
+    samples.sort()
+    p50 = statistics.median(samples)
+    return {
+        "ops_per_sec": round(1e9 / p50, 1),
+        "p50_ns": round(p50, 1),
+        "p99_ns": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 1),
+        **allocations(func),
+    }
+
+
+def allocations(func: Callable[[], object], number: int = 100) -> dict:
+    """Allocated blocks per call and peak traced bytes of a single call."""
+    tracemalloc.start()
+    try:
+        func()
+        before = tracemalloc.take_snapshot()
+        for _ in range(number):
+            func()
+        after = tracemalloc.take_snapshot()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "retained_blocks_per_op": round(blocks / number, 2),
+        "peak_bytes_per_op": peak - current,
+    }
+
+
+def write_results(results: dict, output: Optional[str]) -> None:
+    data = json.dumps(results, indent=2)
+    if output:
+        Path(output).write_text(data)
+    else:
+        sys.stdout.write(data + "\n")
@@ -0,0 +1,71 @@
+"""
+Generator construction cost for every server model type, with server objects
+reused from the cache (warm) and built through ServerModelConfig (cold).
+
+    python -m benchmarks.construction [--output results.json]
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import (
+    SQLITE_FILE,
+    exported_generators,
+    generator_kwargs,
+    measure,
+    write_results,
+)
+from oddrn_generator import server_models
+
+
+def cold(generator_cls, kwargs):
+    def construct():
+        server_models._servers.clear()
+        return generator_cls(**kwargs)
+
+    return construct
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="json file for results, stdout by default")
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output) if args.output else None
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            Path(SQLITE_FILE).touch()
+            for generator_cls in exported_generators():
+                server_model = generator_cls.server_model.__name__
+                if server_model in results:
+                    continue
+                kwargs = generator_kwargs(generator_cls)
+                warm = measure(
+                    lambda: generator_cls(**kwargs), args.number, args.repeat
+                )
+                results[server_model] = {
+                    "generator": generator_cls.__name__,
+                    "warm": warm,
+                    "cold": measure(
+                        cold(generator_cls, kwargs), args.number, args.repeat
+                    ),
+                }
+        finally:
+            os.chdir(cwd)
+
+    for result in results.values():
+        result["speedup"] = round(
+            result["cold"]["p50_ns"] / result["warm"]["p50_ns"], 2
+        )
+    write_results(results, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Escaping cost: a per-value escape loop against escape_many for batches of
+plain names and of object storage keys full of slashes, and the generator
+calls built on it for S3, GCS and filesystem keys.
+
+    python -m benchmarks.escape [--output results.json] [--size 1000]
+"""
+
+import argparse
+
+from benchmarks.common import measure, write_results
+from oddrn_generator.generators import (
+    FilesystemGenerator,
+    GCSGenerator,
+    PostgresqlGenerator,
+    S3Generator,
+)
+from oddrn_generator.utils import escape, escape_many, unescape, unescape_many
+
+
+def key(index: int) -> str:
+    return (
+        f"warehouse/events/year=2024/month=01/day={index % 28:02}/part-{index}.parquet"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="json file for results, stdout by default")
+    parser.add_argument("--size", type=int, default=1000, help="values per batch")
+    parser.add_argument("--number", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    batches = {
+        "names": [f"column_{i}" for i in range(args.size)],
+        "keys": [key(i) for i in range(args.size)],
+    }
+    results = {}
+    for name, values in batches.items():
+        escaped = escape_many(values)
+        results[f"{name}_escape"] = {
+            "loop": measure(
+                lambda: [escape(v) for v in values], args.number, args.repeat
+            ),
+            "escape_many": measure(
+                lambda: escape_many(values), args.number, args.repeat
+            ),
+        }
+        results[f"{name}_unescape"] = {
+            "loop": measure(
+                lambda: [unescape(v) for v in escaped], args.number, args.repeat
+            ),
+            "unescape_many": measure(
+                lambda: unescape_many(escaped), args.number, args.repeat
+            ),
+        }
+    for result in results.values():
+        loop, batch = (r["p50_ns"] for r in result.values())
+        result["speedup"] = round(loop / batch, 2)
+
+    keys = batches["keys"]
+    s3 = S3Generator(buckets="bucket")
+    postgres = PostgresqlGenerator(
+        host_settings="localhost", databases="db", schemas="public", tables="events"
+    )
+    gcp = {"google_cloud_settings": {"project": "project"}}
+    calls = {
+        "s3_construct": lambda: S3Generator(buckets="bucket", keys=keys[0]),
+        "gcs_construct": lambda: GCSGenerator(**gcp, buckets="bucket", keys=keys[0]),
+        "filesystem_construct": lambda: FilesystemGenerator(
+            host_settings="localhost", path=f"/mnt/{keys[0]}"
+        ),
+        "s3_get_oddrns_by_path_keys": lambda: s3.get_oddrns_by_path("keys", keys),
+        "postgres_get_oddrns_by_path_columns": lambda: postgres.get_oddrns_by_path(
+            "tables_columns", batches["names"]
+        ),
+    }
+    for name, call in calls.items():
+        results[name] = measure(call, args.number, args.repeat)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Hot path benchmark for every generator exported from oddrn_generator:
+construction, get_oddrn_by_path for each available path, set_oddrn_paths and
+get_data_source_oddrn.
+
+    python -m benchmarks.hot_paths [--output results.json] [--only Postgresql]
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import (
+    SQLITE_FILE,
+    exported_generators,
+    generator_kwargs,
+    measure,
+    path_values,
+    reachable_paths,
+    write_results,
+)
+
+
+def benchmark_generator(generator_cls, number: int, repeat: int) -> dict:
+    kwargs = generator_kwargs(generator_cls)
+    paths = path_values(generator_cls)
+    generator = generator_cls(**kwargs)
+
+    results = {
+        "construct": measure(lambda: generator_cls(**kwargs), number, repeat),
+        "set_oddrn_paths": measure(
+            lambda: generator.set_oddrn_paths(**paths), number, repeat
+        ),
+    }
+    for path in reachable_paths(generator):
+        results[f"get_oddrn_by_path[{path}]"] = measure(
+            lambda: generator.get_oddrn_by_path(path), number, repeat
+        )
+    try:
+        generator.get_data_source_oddrn()
+    except Exception:
+        pass
+    else:
+        results["get_data_source_oddrn"] = measure(
+            generator.get_data_source_oddrn, number, repeat
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="json file for results, stdout by default")
+    parser.add_argument("--only", help="benchmark generators containing this name")
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output) if args.output else None
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            Path(SQLITE_FILE).touch()
+            for generator_cls in exported_generators():
+                if args.only and args.only not in generator_cls.__name__:
+                    continue
+                results[generator_cls.__name__] = benchmark_generator(
+                    generator_cls, args.number, args.repeat
+                )
+        finally:
+            os.chdir(cwd)
+    write_results(results, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Cold-start benchmark: every scenario runs in a fresh interpreter.
+
+    python -m benchmarks.import_time [--runs 20] [--json]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = {
+    "import pydantic": "import pydantic.main",
+    "import oddrn_generator": "import oddrn_generator",
+    "import one generator": "from oddrn_generator import PostgresqlGenerator",
+    "first oddrn": (
+        "from oddrn_generator import PostgresqlGenerator\n"
+        "PostgresqlGenerator(host_settings='localhost', databases='db')"
+        ".get_oddrn_by_path('databases')"
+    ),
+    "first oddrn of every generator": (
+        "import oddrn_generator\n"
+        "from tests.params import parameters_host\n"
+        "for cls, settings in parameters_host:\n"
+        "    cls(host_settings=settings['host_settings'], **settings['paths'])"
+    ),
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str, runs: int) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(statement=statement)],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print results as json")
+    args = parser.parse_args()
+
+    results = {}
+    for name, statement in SCENARIOS.items():
+        timings = measure(statement, args.runs)
+        results[name] = {
+            "median_ms": round(statistics.median(timings), 2),
+            "min_ms": round(min(timings), 2),
+            "runs": args.runs,
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, result in results.items():
+        print(
+            f"{name:<32} median {result['median_ms']:>8.2f} ms"
+            f"   min {result['min_ms']:>8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
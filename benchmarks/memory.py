@@ -0,0 +1,97 @@
+"""
+Retained memory per generator for every generator exported from oddrn_generator,
+measured with tracemalloc. Path values are shared between instances, so only the
+generator's own structures are counted: right after construction, after building
+its data source oddrn and after building oddrns of all its reachable paths.
+
+Whole generators are measured, so results of two revisions are comparable, e.g.
+run it in a worktree of the older one with the same arguments.
+
+    python -m benchmarks.memory [--output results.json] [--number 2000]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.common import (
+    SQLITE_FILE,
+    exported_generators,
+    generator_kwargs,
+    reachable_paths,
+    write_results,
+)
+
+
+def retained_bytes(factory: Callable[[], object], number: int) -> float:
+    """Bytes per object kept alive by number objects built with factory."""
+    factory()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        objects = [factory() for _ in range(number)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    # the list holding the objects is not part of them
+    size -= objects.__sizeof__()
+    return round(size / number, 1)
+
+
+def benchmark_generator(generator_cls, number: int) -> dict:
+    kwargs = generator_kwargs(generator_cls)
+    paths = reachable_paths(generator_cls(**kwargs))
+
+    def generator_with_data_source_oddrn():
+        generator = generator_cls(**kwargs)
+        generator.get_data_source_oddrn()
+        return generator
+
+    def generator_with_oddrns():
+        generator = generator_cls(**kwargs)
+        for path in paths:
+            generator.get_oddrn_by_path(path)
+        return generator
+
+    return {
+        "generator": retained_bytes(lambda: generator_cls(**kwargs), number),
+        "generator_with_data_source_oddrn": retained_bytes(
+            generator_with_data_source_oddrn, number
+        ),
+        "generator_with_oddrns": retained_bytes(generator_with_oddrns, number),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="json file for results, stdout by default")
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output) if args.output else None
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            Path(SQLITE_FILE).touch()
+            for generator_cls in exported_generators():
+                try:
+                    results[generator_cls.__name__] = benchmark_generator(
+                        generator_cls, args.number
+                    )
+                except Exception as e:
+                    results[generator_cls.__name__] = {"error": repr(e)}
+        finally:
+            os.chdir(cwd)
+    write_results(results, output)
+
+
+if __name__ == "__main__":
+    main()
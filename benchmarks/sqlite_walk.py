@@ -0,0 +1,106 @@
+"""
+Table and column walk over one SQLite file with every file check policy of
+SQLitePathsModel, with a generator per column (constructor) and with one
+generator moved along by set_oddrn_paths. Times are per column oddrn, file
+checks (Path.is_file calls) are counted per walk: on network storage each
+of them is a round trip.
+
+    python -m benchmarks.sqlite_walk [--output results.json] [--tables 50]
+"""
+
+import argparse
+import os
+import tempfile
+from pathlib import Path
+from time import perf_counter_ns
+
+from benchmarks.common import SQLITE_FILE, write_results
+from oddrn_generator.generators import SQLiteGenerator
+from oddrn_generator.path_models import FILE_CHECKS, SQLitePathsModel
+
+
+def constructor_walk(tables: list[str], columns: list[str]):
+    def walk():
+        for table in tables:
+            for column in columns:
+                SQLiteGenerator(
+                    path=SQLITE_FILE, tables=table, tables_columns=column
+                ).get_oddrn_by_path("tables_columns")
+
+    return walk
+
+
+def set_paths_walk(tables: list[str], columns: list[str]):
+    generator = SQLiteGenerator(path=SQLITE_FILE)
+
+    def walk():
+        for table in tables:
+            generator.set_oddrn_paths(path=SQLITE_FILE, tables=table)
+            for column in columns:
+                generator.set_oddrn_paths(tables_columns=column)
+                generator.get_oddrn_by_path("tables_columns")
+
+    return walk
+
+
+def run_walk(walk, oddrns: int, repeat: int) -> dict:
+    """Best time per column oddrn and file checks per walk."""
+    calls = []
+    is_file = Path.is_file
+
+    def counting_is_file(path):
+        calls.append(path)
+        return is_file(path)
+
+    walk()
+    timings = []
+    Path.is_file = counting_is_file
+    try:
+        for _ in range(repeat):
+            start = perf_counter_ns()
+            walk()
+            timings.append(perf_counter_ns() - start)
+    finally:
+        Path.is_file = is_file
+    return {
+        "best_ns_per_oddrn": round(min(timings) / oddrns, 1),
+        "file_checks_per_walk": len(calls) / repeat,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="json file for results, stdout by default")
+    parser.add_argument("--tables", type=int, default=50)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output) if args.output else None
+    tables = [f"table_{i}" for i in range(args.tables)]
+    columns = [f"column_{i}" for i in range(args.columns)]
+    oddrns = args.tables * args.columns
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            Path(SQLITE_FILE).touch()
+            for file_check in FILE_CHECKS:
+                with SQLitePathsModel.file_check(file_check):
+                    results[file_check] = {
+                        "constructor": run_walk(
+                            constructor_walk(tables, columns), oddrns, args.repeat
+                        ),
+                        "set_oddrn_paths": run_walk(
+                            set_paths_walk(tables, columns), oddrns, args.repeat
+                        ),
+                    }
+        finally:
+            os.chdir(cwd)
+    write_results(results, output)
+
+
+if __name__ == "__main__":
+    main()
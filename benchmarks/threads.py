@@ -0,0 +1,65 @@
+"""
+Throughput of the stateless Generator.oddrn from 1, 2, 4 and 8 threads.
+Scaling is only expected on free-threaded CPython builds.
+
+    python -m benchmarks.threads [--output results.json] [--calls 200000]
+"""
+
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from benchmarks.common import write_results
+from oddrn_generator import PostgresqlGenerator
+
+WORKERS = (1, 2, 4, 8)
+
+
+def build(start: int, stop: int) -> None:
+    for i in range(start, stop):
+        PostgresqlGenerator.oddrn(
+            "tables_columns",
+            host_settings="localhost:5432",
+            databases="db",
+            schemas=f"schema{i % 10}",
+            tables=f"table{i % 1000}",
+            tables_columns=f"column{i}",
+        )
+
+
+def run(workers: int, calls: int) -> float:
+    chunk = calls // workers
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        start = perf_counter()
+        futures = [
+            executor.submit(build, i * chunk, (i + 1) * chunk) for i in range(workers)
+        ]
+        for future in futures:
+            future.result()
+        return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="json file for results, stdout by default")
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    build(0, 1000)
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)
+    results = {"gil_enabled": is_gil_enabled(), "workers": {}}
+    for workers in WORKERS:
+        seconds = run(workers, args.calls)
+        results["workers"][workers] = {
+            "ops_per_sec": round(args.calls / seconds, 1),
+            "seconds": round(seconds, 3),
+        }
+    single = results["workers"][1]["ops_per_sec"]
+    for result in results["workers"].values():
+        result["speedup"] = round(result["ops_per_sec"] / single, 2)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+OddrnTrie against a plain set of oddrn strings: retained memory (tracemalloc),
+add and lookup time per oddrn, and listing the columns of one table.
+
+Oddrns are built fresh while a structure is filled, the way a dedup layer
+receives them, so the set owns its strings and the trie only its segments.
+
+    python -m benchmarks.trie [--output results.json] [--tables 2000]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from time import perf_counter_ns
+from typing import Callable, Iterator
+
+from benchmarks.common import write_results
+from oddrn_generator.trie import OddrnTrie
+
+HOST = "//postgresql/host/db.example.com:5432/databases/warehouse"
+
+
+def oddrns(schemas: int, tables: int, columns: int) -> Iterator[str]:
+    for schema in range(schemas):
+        for table in range(tables):
+            prefix = f"{HOST}/schemas/schema_{schema}/tables/table_{table}"
+            yield prefix
+            for column in range(columns):
+                yield f"{prefix}/columns/column_{column}"
+
+
+def retained(build: Callable[[], object]) -> tuple[object, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        structure = build()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    return structure, sum(s.size_diff for s in after.compare_to(before, "filename"))
+
+
+def per_item_ns(func: Callable[[], object], items: int, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        func()
+        timings.append(perf_counter_ns() - start)
+    return round(min(timings) / items, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", help="json file for results, stdout by default")
+    parser.add_argument("--schemas", type=int, default=10)
+    parser.add_argument("--tables", type=int, default=200)
+    parser.add_argument("--columns", type=int, default=25)
+    args = parser.parse_args()
+
+    shape = (args.schemas, args.tables, args.columns)
+    count = sum(1 for _ in oddrns(*shape))
+    oddrns_set, set_bytes = retained(lambda: set(oddrns(*shape)))
+    trie, trie_bytes = retained(lambda: OddrnTrie(oddrns(*shape)))
+
+    lookups = list(oddrns(*shape))
+    misses = [f"{oddrn}_missing" for oddrn in lookups]
+    table = f"{HOST}/schemas/schema_0/tables/table_0"
+    columns = f"{table}/"
+
+    results = {
+        "oddrns": count,
+        "set": {
+            "retained_bytes": set_bytes,
+            "bytes_per_oddrn": round(set_bytes / count, 1),
+            "add_ns": per_item_ns(lambda: set(oddrns(*shape)), count),
+            "contains_ns": per_item_ns(
+                lambda: [o in oddrns_set for o in lookups], count
+            ),
+            "contains_miss_ns": per_item_ns(
+                lambda: [o in oddrns_set for o in misses], count
+            ),
+            "table_columns_ns": per_item_ns(
+                lambda: [o for o in oddrns_set if o.startswith(columns) or o == table],
+                1,
+            ),
+        },
+        "trie": {
+            "retained_bytes": trie_bytes,
+            "bytes_per_oddrn": round(trie_bytes / count, 1),
+            "memory_usage": trie.memory_usage(),
+            "add_ns": per_item_ns(lambda: OddrnTrie(oddrns(*shape)), count),
+            "contains_ns": per_item_ns(lambda: [o in trie for o in lookups], count),
+            "contains_miss_ns": per_item_ns(lambda: [o in trie for o in misses], count),
+            "table_columns_ns": per_item_ns(lambda: list(trie.iter_prefix(table)), 1),
+        },
+    }
+    results["memory_ratio"] = round(set_bytes / trie_bytes, 2)
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
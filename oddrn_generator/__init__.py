@@ -1,66 +1,77 @@
-from oddrn_generator.generators import (
-    AirbyteGenerator,
-    AirflowGenerator,
-    ApiGenerator,
-    AthenaGenerator,
-    AzureBlobStorageGenerator,
-    AzureDataFactoryGenerator,
-    AzureSQLGenerator,
-    BigQueryStorageGenerator,
-    BigTableGenerator,
-    CassandraGenerator,
-    CKANGenerator,
-    ClickHouseGenerator,
-    CouchbaseGenerator,
-    CubeJsGenerator,
-    DatabricksFeatureStoreGenerator,
-    DatabricksLakehouseGenerator,
-    DatabricksUnityCatalogGenerator,
-    DbtGenerator,
-    DmsGenerator,
-    DuckDBGenerator,
-    DynamodbGenerator,
-    ElasticSearchGenerator,
-    FeastGenerator,
-    FilesystemGenerator,
-    FivetranGenerator,
-    GCSGenerator,
-    Generator,
-    GlueGenerator,
-    GreatExpectationsGenerator,
-    HiveGenerator,
-    KafkaConnectGenerator,
-    KafkaGenerator,
-    KinesisGenerator,
-    KubeflowGenerator,
-    LambdaGenerator,
-    MetabaseGenerator,
-    MongoGenerator,
-    MssqlGenerator,
-    MysqlGenerator,
-    Neo4jGenerator,
-    OdbcGenerator,
-    OracleGenerator,
-    PostgresqlGenerator,
-    PowerBiGenerator,
-    PrefectGenerator,
-    PrestoGenerator,
-    QuicksightGenerator,
-    RedashGenerator,
-    RedshiftGenerator,
-    S3CustomGenerator,
-    S3Generator,
-    SagemakerGenerator,
-    ScyllaDBGenerator,
-    SingleStoreGenerator,
-    SnowflakeGenerator,
-    SQLiteGenerator,
-    SupersetGenerator,
-    TableauGenerator,
-    TarantoolGenerator,
-    TrinoGenerator,
-    VerticaGenerator,
-)
+"""
+Generators are imported lazily: ``import oddrn_generator`` only loads this module,
+and ``oddrn_generator.generators`` with all the generator classes is imported on
+first access to any of them.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from oddrn_generator.generators import (
+        AirbyteGenerator,
+        AirflowGenerator,
+        ApiGenerator,
+        AthenaGenerator,
+        AzureBlobStorageGenerator,
+        AzureDataFactoryGenerator,
+        AzureSQLGenerator,
+        BigQueryStorageGenerator,
+        BigTableGenerator,
+        CassandraGenerator,
+        CKANGenerator,
+        ClickHouseGenerator,
+        CouchbaseGenerator,
+        CubeJsGenerator,
+        DatabricksFeatureStoreGenerator,
+        DatabricksLakehouseGenerator,
+        DatabricksUnityCatalogGenerator,
+        DbtGenerator,
+        DmsGenerator,
+        DuckDBGenerator,
+        DynamodbGenerator,
+        ElasticSearchGenerator,
+        FeastGenerator,
+        FilesystemGenerator,
+        FivetranGenerator,
+        GCSGenerator,
+        Generator,
+        GlueGenerator,
+        GreatExpectationsGenerator,
+        HiveGenerator,
+        KafkaConnectGenerator,
+        KafkaGenerator,
+        KinesisGenerator,
+        KubeflowGenerator,
+        LambdaGenerator,
+        MetabaseGenerator,
+        MongoGenerator,
+        MssqlGenerator,
+        MysqlGenerator,
+        Neo4jGenerator,
+        OdbcGenerator,
+        OracleGenerator,
+        PostgresqlGenerator,
+        PowerBiGenerator,
+        PrefectGenerator,
+        PrestoGenerator,
+        QuicksightGenerator,
+        RedashGenerator,
+        RedshiftGenerator,
+        S3CustomGenerator,
+        S3Generator,
+        SagemakerGenerator,
+        ScyllaDBGenerator,
+        SingleStoreGenerator,
+        SnowflakeGenerator,
+        SQLiteGenerator,
+        SupersetGenerator,
+        TableauGenerator,
+        TarantoolGenerator,
+        TrinoGenerator,
+        VerticaGenerator,
+    )
+    from oddrn_generator.parser import parse, parse_many
 
 __all__ = [
     "AirbyteGenerator",
@@ -124,4 +135,38 @@ __all__ = [
     "CKANGenerator",
     "AzureDataFactoryGenerator",
     "ApiGenerator",
+    "parse",
+    "parse_many",
 ]
+
+_LAZY_MODULES = {"parse": "parser", "parse_many": "parser"}
+_SUBMODULES = {
+    "arrays",
+    "bulk",
+    "catalog",
+    "cli",
+    "exceptions",
+    "generators",
+    "parser",
+    "path_models",
+    "scope",
+    "server_models",
+    "trie",
+    "utils",
+}
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return import_module(f"{__name__}.{name}")
+    if name not in __all__:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    module = import_module(f"{__name__}.{_LAZY_MODULES.get(name, 'generators')}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
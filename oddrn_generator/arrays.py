@@ -0,0 +1,163 @@
+"""
+Oddrns for whole columns of path values, from NumPy or PyArrow string arrays.
+
+Values are escaped with one vectorized replace per array and oddrns are
+concatenated array-wise, no Python objects are created per row. NumPy and
+PyArrow are not dependencies of the package, they are imported on first use.
+"""
+
+from functools import reduce
+from typing import Any, Iterable
+
+from oddrn_generator.exceptions import EmptyPathValueException
+from oddrn_generator.generators import Generator
+from oddrn_generator.utils import DELIMITER, ESCAPED_DELIMITER
+
+# stands in for array values while dependencies are validated
+PLACEHOLDER = "value"
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "numpy is required for array oddrns, install it with pip install numpy"
+        ) from e
+    return numpy
+
+
+def _import_arrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+    except ImportError as e:
+        raise ImportError(
+            "pyarrow is required for arrow oddrns, install it with pip install pyarrow"
+        ) from e
+    return pyarrow, pyarrow.compute
+
+
+def _is_arrow(values: Any) -> bool:
+    return type(values).__module__.startswith("pyarrow")
+
+
+def _compile_parts(
+    generator: Generator, path: str, names: Iterable[str]
+) -> tuple[list[tuple[str, str]], str]:
+    """
+    Oddrn of path as (literal, array name) pairs and a literal tail, in output
+    order. Dependencies are validated as if every array value was set.
+    """
+    paths_model = generator.paths_model
+    names = set(names)
+    values = generator.paths_obj.model_dump(exclude_none=True)
+    values.update(dict.fromkeys(names, PLACEHOLDER))
+    template = paths_model.get_template(path)
+    paths_model.check_dependencies(path, values)
+
+    if names.isdisjoint(template.fields):
+        raise ValueError(f"No array is given for the paths of '{path}'")
+    segments, literal = [], f"{generator.base_oddrn}/"
+    for field, key in zip(template.fields, template.keys):
+        if field in names:
+            segments.append((f"{literal}{key}/", field))
+            literal = "/"
+        elif values.get(field) is not None:
+            # generator values are escaped already
+            literal = f"{literal}{key}/{values[field]}/"
+    return segments, literal[:-1]
+
+
+def _join(segments: list[tuple[str, str]], tail: str, columns: dict) -> list:
+    parts = [part for literal, name in segments for part in (literal, columns[name])]
+    if tail:
+        parts.append(tail)
+    return parts
+
+
+def get_oddrns_by_arrays(generator: Generator, path: str, **arrays) -> Any:
+    """
+    Get oddrns of path for columns of raw path values, one array per path.
+
+    Paths without an array are taken from the generator. Arrays must have the
+    same length and contain non-empty strings only. PyArrow arrays give a
+    pyarrow large_string array, anything else is read with numpy.asarray and
+    gives a NumPy str array. Each oddrn is the same as get_oddrn_by_path(path)
+    of a generator with the row's values.
+    """
+    if not arrays:
+        raise ValueError("At least one array of path values is required")
+    segments, tail = _compile_parts(generator, path, arrays)
+    if any(map(_is_arrow, arrays.values())):
+        return _arrow_oddrns(segments, tail, arrays)
+    return _numpy_oddrns(segments, tail, arrays)
+
+
+def _check_lengths(columns: dict) -> int:
+    lengths = {name: len(column) for name, column in columns.items()}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"Arrays must have the same length, got {lengths}")
+    return next(iter(lengths.values()))
+
+
+def _numpy_oddrns(segments: list, tail: str, arrays: dict):
+    np = _import_numpy()
+    columns = {name: _numpy_column(np, name, values) for name, values in arrays.items()}
+    if not _check_lengths(columns):
+        # numpy's string functions fail on empty arrays
+        return np.array([], dtype=str)
+    return reduce(np.char.add, _join(segments, tail, columns))
+
+
+def _numpy_column(np, name: str, values: Any):
+    array = np.asarray(values)
+    if array.ndim != 1:
+        raise ValueError(f"Array of '{name}' must be one-dimensional")
+    if not array.size:
+        # empty lists have no dtype to check
+        return array
+    if array.dtype.kind == "O":
+        is_str = np.frompyfunc(isinstance, 2, 1)(array, str).astype(bool)
+        if not is_str.all():
+            if np.equal(array, None).any():
+                raise EmptyPathValueException(f"Path '{name}' has empty values")
+            raise ValueError(f"Array of '{name}' must contain strings")
+        array = array.astype(str)
+    elif array.dtype.kind != "U":
+        raise ValueError(f"Array of '{name}' must contain strings")
+    if (array == "").any():
+        raise EmptyPathValueException(f"Path '{name}' has empty values")
+    # replace keeps the fixed width of its input, room for every value escaped
+    width = array.dtype.itemsize // np.dtype("U1").itemsize
+    array = array.astype(f"U{len(ESCAPED_DELIMITER) * max(width, 1)}")
+    return np.char.replace(array, DELIMITER, ESCAPED_DELIMITER)
+
+
+def _arrow_oddrns(segments: list, tail: str, arrays: dict):
+    pa, pc = _import_arrow()
+    columns = {
+        name: _arrow_column(pa, pc, name, values) for name, values in arrays.items()
+    }
+    _check_lengths(columns)
+    parts = [
+        pa.scalar(part, pa.large_string()) if isinstance(part, str) else part
+        for part in _join(segments, tail, columns)
+    ]
+    # the last argument is the separator
+    return pc.binary_join_element_wise(*parts, pa.scalar("", pa.large_string()))
+
+
+def _arrow_column(pa, pc, name: str, values: Any):
+    array = values if _is_arrow(values) else pa.array(values)
+    if isinstance(array, pa.ChunkedArray):
+        array = array.combine_chunks()
+    if not len(array):
+        # empty lists have no type to check
+        return array.cast(pa.large_string())
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        raise ValueError(f"Array of '{name}' must contain strings")
+    array = array.cast(pa.large_string())
+    if array.null_count or pc.any(pc.equal(array, pa.scalar("", array.type))).as_py():
+        raise EmptyPathValueException(f"Path '{name}' has empty values")
+    return pc.replace_substring(array, DELIMITER, ESCAPED_DELIMITER)
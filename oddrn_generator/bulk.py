@@ -0,0 +1,152 @@
+"""
+Bulk oddrn generation across worker processes.
+
+Records are split into chunks, every chunk is built by one worker with
+Generator.oddrn, and results come back chunk by chunk. Server objects and
+prefixes are cached per worker process, so each distinct server is set up
+once per worker.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Mapping, NamedTuple, Optional
+
+from oddrn_generator.generators import Generator
+
+# server settings given as dicts, the others are strings
+MAPPING_SETTINGS = ("cloud_settings", "azure_cloud_settings", "google_cloud_settings")
+
+
+class OddrnRecord(NamedTuple):
+    """
+    Arguments of one Generator.oddrn call: generator source, server settings
+    keyword arguments (e.g. {"host_settings": "localhost"}), path and path values.
+    """
+
+    source: str
+    settings: dict
+    path: str
+    paths: dict
+
+
+def oddrn_arguments(settings: Mapping, paths: Mapping) -> dict:
+    """
+    Keyword arguments of Generator.oddrn for record settings and paths.
+    Raises ValueError for records that can't be passed as keyword arguments.
+    """
+    if not isinstance(settings, Mapping) or not isinstance(paths, Mapping):
+        raise ValueError("Record settings and paths must be mappings")
+    for name in MAPPING_SETTINGS:
+        value = settings.get(name)
+        if value and not isinstance(value, Mapping):
+            raise ValueError(f"Server setting '{name}' must be a mapping")
+    if not settings.keys().isdisjoint(paths):
+        name = next(name for name in paths if name in settings)
+        raise ValueError(f"'{name}' is given in both settings and paths")
+    arguments = {**settings, **paths}
+    if not all(isinstance(name, str) for name in arguments):
+        raise ValueError("Record settings and paths names must be strings")
+    return arguments
+
+
+def build_chunk(records: list[OddrnRecord]) -> list[str]:
+    """
+    Build oddrns of one chunk, runs in worker processes.
+    """
+    generators = {}
+    oddrns = []
+    for source, settings, path, paths in records:
+        generator = generators.get(source)
+        if generator is None:
+            generator = generators[source] = Generator.for_source(source)
+        oddrns.append(generator.oddrn(path, **oddrn_arguments(settings, paths)))
+    return oddrns
+
+
+def _chunks(records: Iterable, chunk_size: int) -> Iterator[list]:
+    records = iter(records)
+    while chunk := list(islice(records, chunk_size)):
+        yield chunk
+
+
+def process_chunks(
+    func: Callable[[list], list],
+    items: Iterable,
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    ordered: bool = True,
+) -> Iterator[list]:
+    """
+    Apply func to chunks of items in worker processes and yield its results.
+
+    Items are read lazily, at most two chunks per worker are in flight.
+    Results are yielded in input order, or as soon as they are done with
+    ordered=False. Workers defaults to the number of CPUs, with one worker
+    everything runs in the current process. Func must be picklable.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunks(items, chunk_size)
+    if workers == 1:
+        yield from map(func, chunks)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _run(executor, func, chunks, 2 * workers, ordered)
+
+
+def _run(
+    executor: Executor,
+    func: Callable[[list], list],
+    chunks: Iterator[list],
+    window: int,
+    ordered: bool,
+) -> Iterator[list]:
+    pending = deque(executor.submit(func, c) for c in islice(chunks, window))
+    try:
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [f for f in pending if f in finished]
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                results = future.result()
+                # keep workers busy while the caller handles the result
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.append(executor.submit(func, chunk))
+                yield results
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def generate_oddrn_chunks(
+    records: Iterable[OddrnRecord],
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+    ordered: bool = True,
+) -> Iterator[list[str]]:
+    """
+    Build oddrns for records in worker processes and yield them chunk by chunk,
+    see process_chunks.
+    """
+    return process_chunks(build_chunk, records, workers, chunk_size, ordered)
+
+
+def generate_oddrns(
+    records: Iterable[OddrnRecord],
+    workers: Optional[int] = None,
+    chunk_size: int = 1000,
+) -> Iterator[str]:
+    """
+    Build oddrns for records in worker processes, yielded in input order.
+    """
+    for chunk in generate_oddrn_chunks(records, workers, chunk_size):
+        yield from chunk
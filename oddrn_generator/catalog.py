@@ -0,0 +1,94 @@
+"""
+Table and column oddrns streamed from a DB-API cursor over catalog rows.
+
+Rows are (catalog, schema, table, column) tuples, as selected from
+information_schema.columns ordered by catalog, schema and table. The cursor
+is read with fetchmany, so only one batch of rows is held in memory.
+"""
+
+from typing import Iterator, NamedTuple, Optional, Protocol, Sequence, Type
+
+from oddrn_generator.generators import (
+    Generator,
+    MssqlGenerator,
+    PostgresqlGenerator,
+    RedshiftGenerator,
+    SnowflakeGenerator,
+    SQLiteGenerator,
+    VerticaGenerator,
+)
+from oddrn_generator.scope import Scope
+from oddrn_generator.utils import escape_many
+
+SQL_PATHS = ("databases", "schemas", "tables", "tables_columns")
+
+# Paths the catalog, schema, table and column of a row are set to,
+# None for row values a generator doesn't use
+CATALOG_PATHS = {
+    PostgresqlGenerator: SQL_PATHS,
+    MssqlGenerator: SQL_PATHS,
+    RedshiftGenerator: SQL_PATHS,
+    VerticaGenerator: SQL_PATHS,
+    SnowflakeGenerator: SQL_PATHS,
+    SQLiteGenerator: ("path", None, "tables", "tables_columns"),
+}
+
+
+class Cursor(Protocol):
+    def fetchmany(self, size: int = ...) -> Sequence[Sequence]: ...
+
+
+class CatalogOddrn(NamedTuple):
+    """
+    Oddrns of one row, column is None for rows without a column.
+    Consecutive rows of the same table share the table oddrn string.
+    """
+
+    table: str
+    column: Optional[str]
+
+
+def get_catalog_paths(generator_cls: Type[Generator]) -> tuple:
+    for cls in generator_cls.__mro__:
+        paths = CATALOG_PATHS.get(cls)
+        if paths:
+            return paths
+    raise ValueError(f"{generator_cls.__name__} doesn't support catalog rows")
+
+
+def iter_catalog_oddrns(
+    generator: Generator, cursor: Cursor, batch_size: int = 1000
+) -> Iterator[CatalogOddrn]:
+    """
+    Yield table and column oddrns for every row of cursor, built from the
+    generator's server only. Row values are escaped, the schema and table scopes
+    and the columns prefix are built once per run of rows that share them.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be positive")
+    catalog_path, schema_path, table_path, column_path = get_catalog_paths(
+        type(generator)
+    )
+    root = Scope(generator.paths_model, generator.base_oddrn)
+
+    schema_key = table_key = None
+    schema_scope = table_scope = None
+    columns_prefix = ""
+    while rows := cursor.fetchmany(batch_size):
+        # columns are escaped batch by batch
+        columns = escape_many([row[3] for row in rows])
+        for (catalog, schema, table, _), column in zip(rows, columns):
+            if (catalog, schema) != schema_key:
+                paths = {catalog_path: catalog}
+                if schema_path:
+                    paths[schema_path] = schema
+                schema_scope = root.scope(**paths)
+                schema_key, table_key = (catalog, schema), None
+            if table != table_key:
+                table_scope = schema_scope.scope(**{table_path: table})
+                columns_prefix = table_scope.child_prefix(column_path)
+                table_key = table
+            yield CatalogOddrn(
+                table_scope.oddrn,
+                f"{columns_prefix}{column}" if column else None,
+            )
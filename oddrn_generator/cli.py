@@ -0,0 +1,155 @@
+"""
+Convert JSONL or CSV records to oddrns.
+
+JSONL lines look like
+{"source": "postgresql", "settings": {"host_settings": "localhost"},
+ "path": "tables", "paths": {"databases": "db", "schemas": "public", "tables": "users"}}
+and are written back as {"oddrn": ..., "error": ...} lines.
+
+CSV files have a "source" column, an "oddrn_path" column with the path to get
+the oddrn for, server settings columns (host_settings, cloud_settings, ... with
+dicts as JSON) and a column per path named like the path, e.g. "tables" or
+"path" of sqlite and filesystem; empty cells are skipped. They are written back
+as "oddrn,error" rows.
+
+Failed records get an empty oddrn and the error message, the stream goes on.
+"""
+
+import argparse
+import csv
+import json
+import sys
+from typing import Iterable, Iterator, Optional, TextIO
+
+from oddrn_generator.bulk import oddrn_arguments, process_chunks
+from oddrn_generator.exceptions import (
+    EmptyPathValueException,
+    PathDoesntExistException,
+    WrongPathOrderException,
+)
+from oddrn_generator.generators import SERVER_SETTINGS, Generator
+
+# ValueError covers unknown sources, invalid settings and malformed records
+RECORD_ERRORS = (
+    WrongPathOrderException,
+    EmptyPathValueException,
+    PathDoesntExistException,
+    ValueError,
+)
+
+
+def build_oddrn(record: dict) -> tuple[str, str]:
+    """
+    Get (oddrn, error) for one record, error is empty on success.
+    """
+    try:
+        source, path = record.get("source"), record.get("path")
+        settings, paths = record.get("settings") or {}, record.get("paths") or {}
+        if not isinstance(source, str) or not isinstance(path, str):
+            raise ValueError("Record must have 'source' and 'path' strings")
+        if not isinstance(settings, dict) or not isinstance(paths, dict):
+            raise ValueError("Record 'settings' and 'paths' must be objects")
+        arguments = oddrn_arguments(settings, paths)
+        return Generator.for_source(source).oddrn(path, **arguments), ""
+    except RECORD_ERRORS as e:
+        return "", _error(e)
+
+
+def _error(e: Exception) -> str:
+    return f"{type(e).__name__}: {e}"
+
+
+def convert_jsonl(lines: list[str]) -> list[str]:
+    output = []
+    for line in lines:
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("Record must be an object")
+        except ValueError as e:
+            oddrn, error = "", _error(e)
+        else:
+            oddrn, error = build_oddrn(record)
+        output.append(json.dumps({"oddrn": oddrn or None, "error": error or None}))
+    return output
+
+
+def convert_csv(rows: list[dict]) -> list[tuple[str, str]]:
+    output = []
+    for row in rows:
+        try:
+            record = _csv_record(row)
+        except ValueError as e:
+            output.append(("", _error(e)))
+        else:
+            output.append(build_oddrn(record))
+    return output
+
+
+def _csv_record(row: dict) -> dict:
+    record = {"source": row.get("source"), "path": row.get("oddrn_path")}
+    settings, paths = {}, {}
+    for name, value in row.items():
+        # cells past the header have no name
+        if not value or name is None or name in ("source", "oddrn_path"):
+            continue
+        if name in SERVER_SETTINGS:
+            settings[name] = json.loads(value) if value.startswith("{") else value
+        else:
+            paths[name] = value
+    record["settings"], record["paths"] = settings, paths
+    return record
+
+
+def _read_jsonl(stream: TextIO) -> Iterator[str]:
+    return (line for line in stream if line.strip())
+
+
+def run(
+    stream: TextIO,
+    output: TextIO,
+    input_format: str,
+    workers: int = 1,
+    chunk_size: int = 1000,
+) -> None:
+    if input_format == "csv":
+        writer = csv.writer(output)
+        writer.writerow(("oddrn", "error"))
+        for rows in process_chunks(
+            convert_csv, csv.DictReader(stream), workers, chunk_size
+        ):
+            writer.writerows(rows)
+    else:
+        for lines in process_chunks(
+            convert_jsonl, _read_jsonl(stream), workers, chunk_size
+        ):
+            output.write("\n".join(lines))
+            output.write("\n")
+
+
+def main(argv: Optional[Iterable[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="oddrn",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("file", nargs="?", default="-", help="input file, - for stdin")
+    parser.add_argument(
+        "--format", choices=("jsonl", "csv"), help="input format, by file extension"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="worker processes, 0 for all CPUs"
+    )
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    input_format = args.format or ("csv" if args.file.endswith(".csv") else "jsonl")
+    if args.file == "-":
+        run(sys.stdin, sys.stdout, input_format, args.workers, args.chunk_size)
+        return
+    with open(args.file, newline="" if input_format == "csv" else None) as stream:
+        run(stream, sys.stdout, input_format, args.workers, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,3 +8,7 @@ class PathDoesntExistException(Exception):
 
 class EmptyPathValueException(Exception):
     pass
+
+
+class InvalidOddrnException(Exception):
+    pass
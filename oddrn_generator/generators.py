@@ -1,6 +1,12 @@
-from typing import Type
+import sys
+from types import MappingProxyType
+from typing import Iterable, Iterator, Mapping, Optional, Type
 from urllib.parse import urlparse
 
+from oddrn_generator.exceptions import (
+    EmptyPathValueException,
+    PathDoesntExistException,
+)
 from oddrn_generator.path_models import (
     AirbytePathsModel,
     AirflowPathsModel,
@@ -44,6 +50,8 @@ from oddrn_generator.path_models import (
     Neo4jPathsModel,
     OdbcPathsModel,
     OraclePathsModel,
+    PathState,
+    PathTemplate,
     PostgresqlPathsModel,
     PowerBiPathModel,
     PrefectPathsModel,
@@ -62,24 +70,21 @@ from oddrn_generator.path_models import (
     TarantoolPathsModel,
     VerticaPathsModel,
 )
+from oddrn_generator.scope import Scope
 from oddrn_generator.server_models import (
     AbstractServerModel,
     AWSCloudModel,
-    AzureCloudSettings,
     AzureDomainCloudModel,
     BlobStorageCloudModel,
-    CloudSettings,
     GCPCloudModel,
-    GoogleCloudSettings,
     HostnameModel,
-    HostSettings,
     S3CloudModel,
     S3CustomModel,
-    S3CustomSettings,
-    ServerModelConfig,
     SQLiteModel,
+    create_server,
+    get_server_prefix,
 )
-from oddrn_generator.utils import escape
+from oddrn_generator.utils import escape, escape_many, escape_paths
 
 
 def parse_url(url: str) -> dict:
@@ -87,20 +92,59 @@ def parse_url(url: str) -> dict:
     return {k: v for k, v in parsed._asdict().items() if v}
 
 
+# constructor arguments passed to create_server
+SERVER_SETTINGS = (
+    "cloud_settings",
+    "azure_cloud_settings",
+    "host_settings",
+    "endpoint",
+    "google_cloud_settings",
+)
+
+
 class Generator:
+    __slots__ = ("server_obj", "_base_oddrn", "_paths", "_validated")
+
     source: str = None
     server_model: Type[AbstractServerModel] = None
     paths_model: Type[BasePathsModel] = None
 
+    # every generator class that defines its own source,
+    # filled in by __init_subclass__
+    _registry: dict[str, Type["Generator"]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # subclasses that only inherit source don't replace their parent
+        if "source" not in cls.__dict__ or not cls.source:
+            return
+        # neither do subclasses repeating it, other generators of a source
+        # replace the registered one, the last definition wins
+        registered = Generator._registry.get(cls.source)
+        if registered is not None and issubclass(cls, registered):
+            return
+        Generator._registry[cls.source] = cls
+
+    @classmethod
+    def for_source(cls, source: str) -> Type["Generator"]:
+        """
+        Get generator class by its source name, nested subclasses included.
+        """
+        generator = Generator._registry.get(source)
+        if not generator:
+            raise ValueError(f"Generator for source '{source}' doesn't exist")
+        return generator
+
+    @classmethod
+    def registry(cls) -> Mapping[str, Type["Generator"]]:
+        return MappingProxyType(Generator._registry)
+
     def __new__(cls, *args, **kwargs):
         # TODO: didn't find any case when kwargs has data_source
         if not kwargs.get("data_source"):
             return super(Generator, cls).__new__(cls)
 
-        # TODO: looks like useless statement
-        subclass = {subclass.source: subclass for subclass in cls.__subclasses__()}.get(
-            kwargs["data_source"]
-        )
+        subclass = Generator._registry.get(kwargs["data_source"])
 
         if not subclass:
             raise ValueError("data_source is invalid")
@@ -118,215 +162,413 @@ class Generator:
         google_cloud_settings: dict = None,
         **paths,
     ):
-        config = ServerModelConfig(
-            cloud_settings=CloudSettings(**cloud_settings) if cloud_settings else None,
-            azure_cloud_settings=(
-                AzureCloudSettings(**azure_cloud_settings)
-                if azure_cloud_settings
-                else None
-            ),
-            host_settings=HostSettings(host=host_settings) if host_settings else None,
-            s3_custom_cloud_settings=(
-                S3CustomSettings(endpoint=endpoint) if endpoint else None
-            ),
-            google_cloud_settings=(
-                GoogleCloudSettings(**google_cloud_settings)
-                if google_cloud_settings
-                else None
-            ),
+        self.server_obj: AbstractServerModel = create_server(
+            self.server_model,
+            cloud_settings=cloud_settings,
+            azure_cloud_settings=azure_cloud_settings,
+            host_settings=host_settings,
+            endpoint=endpoint,
+            google_cloud_settings=google_cloud_settings,
+        )
+        self._base_oddrn = sys.intern(
+            f"//{self.source}/{get_server_prefix(self.server_obj)}"
         )
+        self._paths: PathState = self.__build_paths(**paths)
+        # False once paths are set without validating and escaping all of them,
+        # set_oddrn_paths rebuilds them from scratch then
+        self._validated = True
 
-        self.server_obj: AbstractServerModel = self.server_model.create(config)
-        self.paths_obj: BasePathsModel = self.__build_paths(**paths)
+    def __build_paths(self, **paths) -> PathState:
+        path_obj: BasePathsModel = self.paths_model(**escape_paths(paths))
+        path_obj.validate_all_paths()
+        return path_obj.to_state()
 
-    def __build_paths(self, **paths) -> BasePathsModel:
-        escaped = {k: escape(v) for k, v in paths.items()}
+    @property
+    def paths_obj(self) -> BasePathsModel:
+        """
+        Read-only paths model with the generator's values, built on every access.
+        Use set_oddrn_paths to change them.
+        """
+        return self.paths_model.from_state(self._paths, read_only=True)
+
+    @paths_obj.setter
+    def paths_obj(self, paths_obj: BasePathsModel) -> None:
+        self._paths = paths_obj.to_state()
+        self._validated = False
 
-        path_obj: BasePathsModel = self.paths_model(**escaped)
-        path_obj.validate_all_paths()
-        return path_obj
+    @classmethod
+    def oddrn(cls, path: str, /, **kwargs) -> str:
+        """
+        Get oddrn for path from the same keyword arguments as the constructor,
+        without creating a generator, they are validated the same way. Nothing
+        is stored between calls, so it is safe to call from many threads at once.
+        """
+        settings = {
+            name: kwargs.pop(name) for name in SERVER_SETTINGS if name in kwargs
+        }
+        server_prefix = get_server_prefix(create_server(cls.server_model, **settings))
+        return f"//{cls.source}/{server_prefix}/{cls.paths_model.render_path(path, kwargs)}"
 
     @property
     def base_oddrn(self) -> str:
-        return f"//{self.source}/{self.server_obj}"
+        return self._base_oddrn
 
     @property
     def available_paths(self) -> tuple:
-        return tuple(self.paths_obj.dependencies_map.keys())
+        return tuple(self.paths_model.dependencies_map.keys())
 
     def get_oddrn_by_path(self, path: str, new_value: str = None) -> str:
-        dependency = self.paths_obj.get_dependency(path)
+        template = self.paths_model.get_template(path)
         if new_value:
-            self.paths_obj.set_path_value(path, new_value)
-        else:
-            self.paths_obj.check_if_path_is_set(path)
-        paths_dict = self.paths_obj.model_dump(
-            include=set(dependency), exclude_none=True, by_alias=True
-        )
-        return (
-            f"{self.base_oddrn}/{'/'.join([f'{k}/{v}' for k, v in paths_dict.items()])}"
-        )
+            # the value is kept unescaped and only its own dependencies are checked
+            self._validated = False
+            self.paths_model.set_state_value(self._paths, path, new_value)
+        elif not getattr(self._paths, path, None):
+            raise EmptyPathValueException(f"Path '{path}' is not set up")
+        return self.__render(template)
+
+    def __render(self, template: PathTemplate) -> str:
+        return f"{self.base_oddrn}/{template.render(template.values(self._paths))}"
+
+    def try_get_oddrn_by_path(self, path: str) -> Optional[str]:
+        """
+        Same as get_oddrn_by_path(path), but None is returned instead of raising
+        when the path doesn't exist or is not set up.
+        """
+        template = self.paths_model.path_templates.get(path)
+        if template is None or not getattr(self._paths, path, None):
+            return None
+        return self.__render(template)
+
+    def get_oddrns_by_path(self, path: str, values: Iterable[str]) -> list[str]:
+        """
+        Get oddrns for many values of one path at once.
+        Values are escaped, the generator's paths are left untouched.
+        """
+        prefix, tail = self.__leaf_parts(path)
+        values = list(values)
+        if not all(values):
+            raise EmptyPathValueException(f"Path '{path}' is not set up")
+        return [f"{prefix}{value}{tail}" for value in escape_many(values)]
+
+    def iter_oddrns_by_path(self, path: str, values: Iterable[str]) -> Iterator[str]:
+        """
+        Lazy version of get_oddrns_by_path. The parent paths are validated on call.
+        """
+        prefix, tail = self.__leaf_parts(path)
+        return self.__iter_leaves(path, prefix, tail, values)
+
+    def __leaf_parts(self, path: str) -> tuple[str, str]:
+        template = self.paths_model.get_template(path)
+        self.paths_model.check_parents(path, self._paths)
+        head, tail = template.split(template.values(self._paths), path)
+        return f"{self.base_oddrn}/{head}", tail
+
+    def try_get_oddrns_by_path(
+        self, path: str, values: Iterable[Optional[str]]
+    ) -> list[Optional[str]]:
+        """
+        Same as get_oddrns_by_path, but empty values get None instead of raising.
+        All values get None when the path doesn't exist or its parents are not set.
+        """
+        template = self.paths_model.path_templates.get(path)
+        if template is None or not self.paths_model.has_parents(path, self._paths):
+            return [None for _ in values]
+        head, tail = template.split(template.values(self._paths), path)
+        prefix = f"{self.base_oddrn}/{head}"
+        return [
+            f"{prefix}{value}{tail}" if value else None for value in escape_many(values)
+        ]
+
+    @staticmethod
+    def __iter_leaves(
+        path: str, prefix: str, tail: str, values: Iterable[str]
+    ) -> Iterator[str]:
+        for value in values:
+            if not value:
+                raise EmptyPathValueException(f"Path '{path}' is not set up")
+            yield f"{prefix}{escape(value)}{tail}"
+
+    def scope(self, **paths) -> Scope:
+        """
+        Get immutable scope with given paths on top of the generator's server.
+        The generator's own paths are not used and not changed.
+        """
+        return Scope(self.paths_model, self.base_oddrn).scope(**paths)
+
+    def walk(self, tree: Mapping) -> Iterator[tuple[str, tuple, str]]:
+        """
+        Walk nested metadata depth-first and yield (path, values, oddrn) for each node.
+
+        Tree maps path names to {value: subtree} mappings or to plain iterables of
+        leaf values, e.g. {"databases": {"db": {"schemas": {"public": {"tables":
+        ["users", "orders"]}}}}}. Values holds the raw values from the root down.
+        Oddrns are built from the generator's server only, its paths are not used.
+        """
+        paths_model = self.paths_model
+        parent_paths = paths_model.parent_paths
+        aliases = paths_model.aliases
+
+        # (path, values, oddrn, children) of every node on the way down
+        stack = [(None, (), self.base_oddrn, self.__walk_children(tree))]
+        while stack:
+            field, values, prefix, children = stack[-1]
+            for path, value, subtree in children:
+                parents = parent_paths.get(path)
+                if parents is None:
+                    raise PathDoesntExistException(
+                        f"Path '{path}' doesn't exist in generator"
+                    )
+                if field not in parents:
+                    paths_model.raise_wrong_order(path, [node[0] for node in stack[1:]])
+                if not value:
+                    raise EmptyPathValueException(f"Path '{path}' is not set up")
+
+                oddrn = f"{prefix}/{aliases.get(path, path)}/{escape(value)}"
+                node_values = (*values, value)
+                yield path, node_values, oddrn
+                if subtree:
+                    stack.append(
+                        (path, node_values, oddrn, self.__walk_children(subtree))
+                    )
+                    break
+            else:
+                stack.pop()
+
+    @staticmethod
+    def __walk_children(tree: Mapping) -> Iterator[tuple[str, str, Mapping]]:
+        for path, nodes in tree.items():
+            if isinstance(nodes, Mapping):
+                for value, subtree in nodes.items():
+                    yield path, value, subtree
+            else:
+                for value in nodes:
+                    yield path, value, None
 
     def set_oddrn_paths(self, **new_paths) -> None:
+        dependent_paths = self.paths_model.dependent_paths
+        if (
+            self._validated
+            and new_paths.keys() <= dependent_paths.keys()
+            and new_paths.keys().isdisjoint(self.paths_model.aliases.values())
+        ):
+            # the other paths are valid already, only the new values and
+            # the paths depending on them are validated
+            self._paths = self.paths_model.update_state(
+                self._paths, **escape_paths(new_paths)
+            )
+            return
+
         old_paths = {
             k: v
             for k, v in self.paths_obj.model_dump(exclude_none=True).items()
             if k not in list(new_paths.keys())
         }
 
-        self.paths_obj = self.__build_paths(**old_paths, **new_paths)
+        self._paths = self.__build_paths(**old_paths, **new_paths)
+        self._validated = True
 
     def get_data_source_oddrn(self):
         return (
-            self.get_oddrn_by_path(self.paths_obj.data_source_path)
-            if self.paths_obj.data_source_path
+            self.get_oddrn_by_path(self.paths_model.data_source_path)
+            if self.paths_model.data_source_path
             else self.base_oddrn
         )
 
 
 class PostgresqlGenerator(Generator):
+    __slots__ = ()
+
     source = "postgresql"
     paths_model = PostgresqlPathsModel
     server_model = HostnameModel
 
 
 class GlueGenerator(Generator):
+    __slots__ = ()
+
     source = "glue"
     paths_model = GluePathsModel
     server_model = AWSCloudModel
 
 
 class MysqlGenerator(Generator):
+    __slots__ = ()
+
     source = "mysql"
     paths_model = MysqlPathsModel
     server_model = HostnameModel
 
 
 class KafkaGenerator(Generator):
+    __slots__ = ()
+
     source = "kafka"
     paths_model = KafkaPathsModel
     server_model = HostnameModel
 
 
 class KafkaConnectGenerator(Generator):
+    __slots__ = ()
+
     source = "kafkaconnect"
     paths_model = KafkaConnectorPathsModel
     server_model = HostnameModel
 
 
 class SnowflakeGenerator(Generator):
+    __slots__ = ()
+
     source = "snowflake"
     paths_model = SnowflakePathsModel
     server_model = HostnameModel
 
 
 class AirflowGenerator(Generator):
+    __slots__ = ()
+
     source = "airflow"
     paths_model = AirflowPathsModel
     server_model = HostnameModel
 
 
 class HiveGenerator(Generator):
+    __slots__ = ()
+
     source = "hive"
     paths_model = HivePathsModel
     server_model = HostnameModel
 
 
 class ElasticSearchGenerator(Generator):
+    __slots__ = ()
+
     source = "elasticsearch"
     paths_model = ElasticSearchPathsModel
     server_model = HostnameModel
 
 
 class FeastGenerator(Generator):
+    __slots__ = ()
+
     source = "feast"
     paths_model = FeastPathsModel
     server_model = HostnameModel
 
 
 class DynamodbGenerator(Generator):
+    __slots__ = ()
+
     source = "dynamodb"
     paths_model = DynamodbPathsModel
     server_model = AWSCloudModel
 
 
 class OdbcGenerator(Generator):
+    __slots__ = ()
+
     source = "odbc"
     paths_model = OdbcPathsModel
     server_model = HostnameModel
 
 
 class MssqlGenerator(Generator):
+    __slots__ = ()
+
     source = "mssql"
     paths_model = MssqlPathsModel
     server_model = HostnameModel
 
 
 class OracleGenerator(Generator):
+    __slots__ = ()
+
     source = "oracle"
     paths_model = OraclePathsModel
     server_model = HostnameModel
 
 
 class PrestoGenerator(Generator):
+    __slots__ = ()
+
     source = "presto"
     paths_model = PrestoPathsModel
     server_model = HostnameModel
 
 
 class TrinoGenerator(PrestoGenerator):
+    __slots__ = ()
+
     source = "trino"
 
 
 class RedshiftGenerator(Generator):
+    __slots__ = ()
+
     source = "redshift"
     paths_model = RedshiftPathsModel
     server_model = HostnameModel
 
 
 class ClickHouseGenerator(Generator):
+    __slots__ = ()
+
     source = "clickhouse"
     paths_model = ClickHousePathsModel
     server_model = HostnameModel
 
 
 class AthenaGenerator(Generator):
+    __slots__ = ()
+
     source = "athena"
     paths_model = AthenaPathsModel
     server_model = AWSCloudModel
 
 
 class QuicksightGenerator(Generator):
+    __slots__ = ()
+
     source = "quicksight"
     paths_model = QuicksightPathsModel
     server_model = AWSCloudModel
 
 
 class DbtGenerator(Generator):
+    __slots__ = ()
+
     source = "dbt"
     paths_model = DbtPathsModel
     server_model = HostnameModel
 
 
 class TableauGenerator(Generator):
+    __slots__ = ()
+
     source = "tableau"
     paths_model = TableauPathsModel
     server_model = HostnameModel
 
 
 class PrefectGenerator(Generator):
+    __slots__ = ()
+
     source = "prefect"
     paths_model = PrefectPathsModel
     server_model = HostnameModel
 
 
 class Neo4jGenerator(Generator):
+    __slots__ = ()
+
     source = "neo4j"
     paths_model = Neo4jPathsModel
     server_model = HostnameModel
 
 
 class S3Generator(Generator):
+    __slots__ = ()
+
     source = "s3"
     paths_model = S3PathsModel
     server_model = S3CloudModel
@@ -344,148 +586,198 @@ class S3Generator(Generator):
 
 
 class S3CustomGenerator(Generator):
+    __slots__ = ()
+
     source = "s3-custom"
     paths_model = S3CustomPathsModel
     server_model = S3CustomModel
 
 
 class CassandraGenerator(Generator):
+    __slots__ = ()
+
     source = "cassandra"
     paths_model = CassandraPathsModel
     server_model = HostnameModel
 
 
 class ScyllaDBGenerator(CassandraGenerator):
+    __slots__ = ()
+
     source = "scylladb"
 
 
 class SagemakerGenerator(Generator):
+    __slots__ = ()
+
     source = "sagemaker"
     paths_model = SagemakerPathsModel
     server_model = AWSCloudModel
 
 
 class KinesisGenerator(Generator):
+    __slots__ = ()
+
     source = "kinesis"
     paths_model = KinesisPathsModel
     server_model = AWSCloudModel
 
 
 class KubeflowGenerator(Generator):
+    __slots__ = ()
+
     source = "kubeflow"
     paths_model = KubeflowPathsModel
     server_model = HostnameModel
 
 
 class TarantoolGenerator(Generator):
+    __slots__ = ()
+
     source = "tarantool"
     paths_model = TarantoolPathsModel
     server_model = HostnameModel
 
 
 class MongoGenerator(Generator):
+    __slots__ = ()
+
     source = "mongo"
     paths_model = MongoPathsModel
     server_model = HostnameModel
 
 
 class VerticaGenerator(Generator):
+    __slots__ = ()
+
     source = "vertica"
     paths_model = VerticaPathsModel
     server_model = HostnameModel
 
 
 class CubeJsGenerator(Generator):
+    __slots__ = ()
+
     source = "cubejs"
     paths_model = CubeJsPathModel
     server_model = HostnameModel
 
 
 class SupersetGenerator(Generator):
+    __slots__ = ()
+
     source = "superset"
     paths_model = SupersetPathsModel
     server_model = HostnameModel
 
 
 class MetabaseGenerator(Generator):
+    __slots__ = ()
+
     source = "metabase"
     paths_model = MetabasePathModel
     server_model = HostnameModel
 
 
 class DmsGenerator(Generator):
+    __slots__ = ()
+
     source = "dms"
     paths_model = DmsPathsModel
     server_model = AWSCloudModel
 
 
 class PowerBiGenerator(Generator):
+    __slots__ = ()
+
     source = "powerbi"
     paths_model = PowerBiPathModel
     server_model = AzureDomainCloudModel
 
 
 class RedashGenerator(Generator):
+    __slots__ = ()
+
     source = "redash"
     paths_model = RedashPathsModel
     server_model = HostnameModel
 
 
 class AirbyteGenerator(Generator):
+    __slots__ = ()
+
     source = "airbyte"
     paths_model = AirbytePathsModel
     server_model = HostnameModel
 
 
 class FilesystemGenerator(Generator):
+    __slots__ = ()
+
     source = "filesystem"
     paths_model = FilesystemPathModel
     server_model = HostnameModel
 
 
 class GreatExpectationsGenerator(Generator):
+    __slots__ = ()
+
     source = "great_expectations"
     paths_model = GreatExpectationsPathsModel
     server_model = HostnameModel
 
 
 class DatabricksLakehouseGenerator(Generator):
+    __slots__ = ()
+
     source = "databricks_lakehouse"
     paths_model = DatabricksLakehousePathModel
     server_model = HostnameModel
 
 
 class DatabricksUnityCatalogGenerator(Generator):
+    __slots__ = ()
+
     source = "databricks_unity_catalog"
     paths_model = DatabricksUnityCatalogPathModel
     server_model = HostnameModel
 
 
 class DatabricksFeatureStoreGenerator(Generator):
+    __slots__ = ()
+
     source = "databricks_feature_store"
     paths_model = DatabricksFeatureStorePathModel
     server_model = HostnameModel
 
 
 class SingleStoreGenerator(Generator):
+    __slots__ = ()
+
     source = "singlestore"
     paths_model = SingleStorePathsModel
     server_model = HostnameModel
 
 
 class AzureSQLGenerator(Generator):
+    __slots__ = ()
+
     source = "azure"
     paths_model = AzureSQLPathsModel
     server_model = HostnameModel
 
 
 class FivetranGenerator(Generator):
+    __slots__ = ()
+
     source = "fivetran"
     paths_model = FivetranPathsModel
     server_model = HostnameModel
 
 
 class LambdaGenerator(Generator):
+    __slots__ = ()
+
     source = "lambda"
     paths_model = LambdaPathsModel
     server_model = AWSCloudModel
@@ -500,60 +792,80 @@ class LambdaGenerator(Generator):
 
 
 class CouchbaseGenerator(Generator):
+    __slots__ = ()
+
     source = "couchbase"
     paths_model = CouchbasePathsModel
     server_model = HostnameModel
 
 
 class SQLiteGenerator(Generator):
+    __slots__ = ()
+
     source = "sqlite"
     paths_model = SQLitePathsModel
     server_model = SQLiteModel
 
 
 class BigTableGenerator(Generator):
+    __slots__ = ()
+
     source = "bigtable"
     paths_model = BigTablePathsModel
     server_model = GCPCloudModel
 
 
 class DuckDBGenerator(Generator):
+    __slots__ = ()
+
     source = "duckdb"
     paths_model = DuckDBPathsModel
     server_model = HostnameModel
 
 
 class GCSGenerator(Generator):
+    __slots__ = ()
+
     source = "gcs"
     paths_model = GCSPathsModel
     server_model = GCPCloudModel
 
 
 class AzureBlobStorageGenerator(Generator):
+    __slots__ = ()
+
     source = "blob_storage"
     paths_model = BlobPathsModel
     server_model = BlobStorageCloudModel
 
 
 class BigQueryStorageGenerator(Generator):
+    __slots__ = ()
+
     source = "bigquery_storage"
     paths_model = BigQueryStoragePathsModel
     server_model = GCPCloudModel
 
 
 class CKANGenerator(Generator):
+    __slots__ = ()
+
     source = "ckan"
     paths_model = CKANPathsModel
     server_model = HostnameModel
 
 
 class AzureDataFactoryGenerator(Generator):
+    __slots__ = ()
+
     source = "azure_data_factory"
     paths_model = AzureDataFactoryPathsModel
     server_model = AzureDomainCloudModel
 
 
 class ApiGenerator(Generator):
+    __slots__ = ()
+
     source = "api"
     paths_model = ApiPathsModel
     server_model = HostnameModel
@@ -0,0 +1,139 @@
+from typing import Iterable, NamedTuple, Optional, Type
+
+from oddrn_generator.exceptions import InvalidOddrnException
+from oddrn_generator.generators import Generator
+from oddrn_generator.server_models import (
+    AWSCloudModel,
+    AzureDomainCloudModel,
+    BlobStorageCloudModel,
+    GCPCloudModel,
+    HostnameModel,
+    S3CloudModel,
+    S3CustomModel,
+    SQLiteModel,
+)
+from oddrn_generator.utils import unescape_many
+
+# Static segments each server model writes before its "key/value" pairs
+SERVER_PREFIXES = {
+    HostnameModel: (),
+    AWSCloudModel: ("cloud", "aws"),
+    AzureDomainCloudModel: ("cloud", "azure"),
+    BlobStorageCloudModel: ("cloud", "azure"),
+    S3CustomModel: (),
+    S3CloudModel: ("cloud", "aws"),
+    SQLiteModel: ("",),
+    GCPCloudModel: ("cloud", "gcp"),
+}
+
+
+class ParsedOddrn(NamedTuple):
+    generator: Type[Generator]
+    server: dict
+    path: Optional[str]
+    paths: dict
+
+    @property
+    def source(self) -> str:
+        return self.generator.source
+
+
+class OddrnGrammar:
+    """
+    Reverse of a generator's output, compiled once per generator class.
+
+    Server segments are matched by position, path segments by the sequence
+    of keys they contain.
+    """
+
+    __slots__ = ("generator", "server_prefix", "server_fields", "paths")
+
+    def __init__(self, generator: Type[Generator]):
+        self.generator = generator
+        self.server_prefix = SERVER_PREFIXES[generator.server_model]
+        self.server_fields = tuple(generator.server_model.model_fields)
+
+        paths_model = generator.paths_model
+        self.paths = {}
+        for path, template in paths_model.path_templates.items():
+            self.paths.setdefault(template.keys, (path, template.fields))
+            # allowed nulls are skipped in the output, so they may be absent
+            omitted = paths_model.allows_null.intersection(template.fields) - {path}
+            if omitted:
+                fields = tuple(f for f in template.fields if f not in omitted)
+                keys = tuple(
+                    k
+                    for f, k in zip(template.fields, template.keys)
+                    if f not in omitted
+                )
+                self.paths.setdefault(keys, (path, fields))
+
+    def parse(self, oddrn: str, parts: list[str]) -> ParsedOddrn:
+        offset = 1
+        for literal in self.server_prefix:
+            if offset >= len(parts) or parts[offset] != literal:
+                raise InvalidOddrnException(f"Oddrn '{oddrn}' has invalid server part")
+            offset += 1
+
+        server = {}
+        for field in self.server_fields:
+            if offset + 1 >= len(parts) or parts[offset] != field:
+                raise InvalidOddrnException(f"Oddrn '{oddrn}' has invalid server part")
+            server[field] = parts[offset + 1]
+            offset += 2
+
+        segments = parts[offset:]
+        if not segments:
+            return ParsedOddrn(self.generator, server, None, {})
+        if len(segments) % 2:
+            raise InvalidOddrnException(f"Oddrn '{oddrn}' has unpaired path segments")
+
+        match = self.paths.get(tuple(segments[0::2]))
+        if not match:
+            raise InvalidOddrnException(
+                f"Oddrn '{oddrn}' doesn't match any path of {self.generator.__name__}"
+            )
+        path, fields = match
+        paths = dict(zip(fields, unescape_many(segments[1::2])))
+        return ParsedOddrn(self.generator, server, path, paths)
+
+
+_grammars: dict[str, OddrnGrammar] = {}
+
+
+def get_grammar(source: str) -> OddrnGrammar:
+    grammar = _grammars.get(source)
+    if grammar is None:
+        generator = Generator.registry().get(source)
+        if generator is None:
+            raise InvalidOddrnException(f"Unknown oddrn source '{source}'")
+        grammar = _grammars[source] = OddrnGrammar(generator)
+    return grammar
+
+
+def parse(oddrn: str) -> ParsedOddrn:
+    """
+    Parse oddrn built by any generator back into its generator class,
+    server settings and unescaped path values.
+    """
+    if not oddrn.startswith("//"):
+        raise InvalidOddrnException(f"Oddrn '{oddrn}' must start with '//'")
+    parts = oddrn[2:].split("/")
+    return get_grammar(parts[0]).parse(oddrn, parts)
+
+
+def parse_many(oddrns: Iterable[str]) -> list[ParsedOddrn]:
+    """
+    Parse many oddrns in one pass, grammars are looked up once per source.
+    """
+    grammars = {}
+    result = []
+    for oddrn in oddrns:
+        if not oddrn.startswith("//"):
+            raise InvalidOddrnException(f"Oddrn '{oddrn}' must start with '//'")
+        parts = oddrn[2:].split("/")
+        grammar = grammars.get(parts[0])
+        if grammar is None:
+            grammar = grammars[parts[0]] = get_grammar(parts[0])
+        result.append(grammar.parse(oddrn, parts))
+    return result
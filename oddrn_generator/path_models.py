@@ -1,50 +1,387 @@
-from typing import Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    ClassVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    NoReturn,
+    Optional,
+    Sequence,
+    Type,
+)
 
-from pydantic import BaseModel, ConfigDict, Field, FilePath
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic.fields import FieldInfo
+from pydantic_core import PydanticCustomError
 
 from oddrn_generator.exceptions import (
     EmptyPathValueException,
     PathDoesntExistException,
     WrongPathOrderException,
 )
+from oddrn_generator.utils import escape_many
 
 DependenciesMap = dict[str, tuple[str, ...]]
 
 
+class PathTemplate:
+    """
+    Output template of a single path, compiled once per paths model.
+
+    Holds the fields of the path's dependency chain in emit order together with
+    their output names (aliases), so rendering is a single ``str.format`` call.
+    """
+
+    __slots__ = ("fields", "keys", "_format", "_getter")
+
+    def __init__(self, fields: tuple[str, ...], keys: tuple[str, ...]):
+        self.fields = fields
+        self.keys = keys
+        self._format = "/".join(f"{key}/{{}}" for key in keys)
+        if len(fields) == 1:
+            name = fields[0]
+            self._getter = lambda obj: (getattr(obj, name),)
+        else:
+            self._getter = attrgetter(*fields)
+
+    def values(self, paths_obj: "BasePathsModel") -> tuple:
+        return self._getter(paths_obj)
+
+    def split(self, values: tuple, field: str) -> tuple[str, str]:
+        """
+        Render everything around ``field``: the ODDRN of this path for a value v
+        is ``head + v + tail``.
+        """
+        index = self.fields.index(field)
+        head = "".join(
+            f"{key}/{value}/"
+            for key, value in zip(self.keys[:index], values[:index])
+            if value is not None
+        )
+        tail = "".join(
+            f"/{key}/{value}"
+            for key, value in zip(self.keys[index + 1 :], values[index + 1 :])
+            if value is not None
+        )
+        return f"{head}{self.keys[index]}/", tail
+
+    def render(self, values: tuple) -> str:
+        # None values are skipped, as model_dump(exclude_none=True) used to do
+        if None in values:
+            return "/".join(
+                f"{key}/{value}"
+                for key, value in zip(self.keys, values)
+                if value is not None
+            )
+        return self._format.format(*values)
+
+
+class ValidationPlan:
+    """
+    Dependency checks of a paths model compiled to bit masks once per model.
+
+    Every field and dependency name gets a bit, and each path gets a sequence of
+    (required mask, nullable bit) steps: the required bits must be set, and the
+    rest of the chain is skipped when the allowed null value is None. It is the
+    same walk as the attribute by attribute check, done with integer operations.
+    """
+
+    __slots__ = ("bits", "steps", "masks")
+
+    def __init__(
+        self,
+        fields: Iterable[str],
+        dependencies_map: Mapping[str, tuple[str, ...]],
+        allows_null: frozenset[str],
+    ):
+        names = list(fields)
+        for dependency in dependencies_map.values():
+            names.extend(deps for deps in dependency if deps not in names)
+        self.bits = {name: 1 << index for index, name in enumerate(names)}
+
+        self.steps = {}
+        for path, dependency in dependencies_map.items():
+            steps, mask = [], 0
+            for deps in reversed(dependency):
+                if deps in allows_null:
+                    steps.append((mask, self.bits[deps]))
+                    mask = 0
+                mask |= self.bits[deps]
+            steps.append((mask, 0))
+            self.steps[path] = tuple(steps)
+        # paths without allowed nulls in their chain are checked by one mask
+        self.masks = {
+            path: steps[0][0] for path, steps in self.steps.items() if len(steps) == 1
+        }
+
+    def invalid_fields(self, values: Mapping, fields: Iterable[str]) -> list[str]:
+        """
+        Fields that fail the dependency check for values, in the order of fields.
+        Fields without a plan are returned too, the full check decides for them.
+        """
+        bits = self.bits
+        set_mask = not_none_mask = 0
+        for name, value in values.items():
+            if value is not None:
+                bit = bits.get(name, 0)
+                not_none_mask |= bit
+                if value:
+                    set_mask |= bit
+
+        masks = self.masks
+        required = 0
+        for field in fields:
+            mask = masks.get(field)
+            if mask is None:
+                break
+            required |= mask
+        else:
+            if not required & ~set_mask:
+                return []
+
+        invalid = []
+        for field in fields:
+            for mask, nullable in self.steps.get(field, ((-1, 0),)):
+                if mask & ~set_mask:
+                    invalid.append(field)
+                    break
+                if nullable & ~not_none_mask:
+                    break
+        return invalid
+
+
+class PathState:
+    """
+    Compact path values of a generator, one slot per paths model field.
+
+    Paths models validate input, generators keep their values in the model's
+    ``state_class`` afterwards: no instance dict and no fields set, unset paths
+    are None. Like a mapping, ``get`` returns a value by field name.
+    """
+
+    __slots__ = ()
+    paths_model: ClassVar[Type["BasePathsModel"]]
+
+    def __init__(self, values: Iterable[Optional[str]]):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return getattr(self, name, default)
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={value!r}"
+            for name in self.__slots__
+            if (value := getattr(self, name)) is not None
+        )
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        values = tuple(getattr(self, name) for name in self.__slots__)
+        return _restore_state, (self.paths_model, values)
+
+
+def _restore_state(paths_model: Type["BasePathsModel"], values: tuple) -> PathState:
+    return paths_model.state_class(values)
+
+
+# class level metadata of paths models, it is not a path
+METADATA_FIELDS = ("dependencies_map", "data_source_path", "allows_null")
+
+
 class BasePathsModel(BaseModel):
-    model_config = ConfigDict(extra="forbid", populate_by_name=True)
-    dependencies_map: DependenciesMap = {}
-    data_source_path: str = None
-    allows_null: list = []
+    """
+    Path values of a generator.
+
+    Dependency metadata is shared by all instances of a model: subclasses declare
+    it with ``_dependencies_map_factory``, ``data_source_path`` and ``allows_null``,
+    and it is frozen into class level mappings when the class is created.
+    """
+
+    model_config = ConfigDict(extra="forbid", populate_by_name=True, defer_build=True)
+
+    dependencies_map: ClassVar[Mapping[str, tuple[str, ...]]] = MappingProxyType({})
+    data_source_path: ClassVar[Optional[str]] = None
+    allows_null: ClassVar[frozenset[str]] = frozenset()
+    aliases: ClassVar[Mapping[str, str]] = MappingProxyType({})
+    required_fields: ClassVar[frozenset[str]] = frozenset()
+    dependent_paths: ClassVar[Mapping[str, frozenset[str]]] = MappingProxyType({})
+    parent_paths: ClassVar[Mapping[str, frozenset[Optional[str]]]] = MappingProxyType(
+        {}
+    )
+    path_templates: ClassVar[Mapping[str, PathTemplate]] = MappingProxyType({})
+    str_fields: ClassVar[frozenset[str]] = frozenset()
+    validation_plan: ClassVar["ValidationPlan"]
+    state_class: ClassVar[Type["PathState"]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        # models used to declare metadata as fields (data_source_path: str = ...),
+        # they are made class variables before pydantic collects the fields
+        annotations = cls.__dict__.get("__annotations__", {})
+        for name in METADATA_FIELDS:
+            if name in annotations:
+                annotations[name] = ClassVar
+        super().__init_subclass__(**kwargs)
 
-    def __validate_path(self, field) -> None:
-        for deps in reversed(self.dependencies_map.get(field)):
-            deps_value = getattr(self, deps, None)
-            # allow dependency null if it is in allow_null list
-            if deps_value is None and deps in self.allows_null:
-                return
-            if not deps_value:
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # read-only models of from_state share the metadata of their paths model
+        if cls.model_config.get("frozen"):
+            return
+        factory = getattr(cls, "_dependencies_map_factory", None)
+        for name in METADATA_FIELDS:
+            value = cls.__dict__.get(name)
+            # dependencies_map fields called the factory from their default_factory
+            if isinstance(value, FieldInfo) and not (
+                name == "dependencies_map" and factory
+            ):
+                setattr(cls, name, value.get_default(call_default_factory=True))
+        dependencies_map = factory() if factory else cls.dependencies_map
+
+        cls.dependencies_map = MappingProxyType(
+            {path: tuple(dependency) for path, dependency in dependencies_map.items()}
+        )
+        cls.allows_null = frozenset(cls.allows_null)
+        cls.aliases = MappingProxyType(
+            {
+                name: field.alias
+                for name, field in cls.model_fields.items()
+                if field.alias
+            }
+        )
+        cls.required_fields = frozenset(
+            name for name, field in cls.model_fields.items() if field.is_required()
+        )
+        # any str is a valid value of these, pydantic is not needed to set them;
+        # a field named like an alias of other fields sets those fields too
+        cls.str_fields = frozenset(
+            name
+            for name, field in cls.model_fields.items()
+            if field.annotation in (str, Optional[str])
+            and not field.metadata
+            and name not in cls.aliases.values()
+        )
+        cls.dependent_paths = MappingProxyType(
+            {
+                field: frozenset(
+                    path
+                    for path, dependency in cls.dependencies_map.items()
+                    if field in dependency
+                )
+                for field in cls.model_fields
+            }
+        )
+        cls.parent_paths = MappingProxyType(
+            {
+                path: cls._parent_paths(path, dependency)
+                for path, dependency in cls.dependencies_map.items()
+            }
+        )
+        cls.path_templates = MappingProxyType(cls._compile_templates())
+        cls.validation_plan = ValidationPlan(
+            cls.model_fields, cls.dependencies_map, cls.allows_null
+        )
+        cls.state_class = type(
+            f"{cls.__name__}State",
+            (PathState,),
+            {
+                "__slots__": tuple(cls.model_fields),
+                "__module__": cls.__module__,
+                "paths_model": cls,
+            },
+        )
+
+    @classmethod
+    def _parent_paths(cls, path: str, dependency: tuple) -> frozenset[Optional[str]]:
+        """
+        Paths that may directly precede ``path`` in an oddrn, None stands for none.
+        An allowed null parent may be skipped together with everything before it.
+        """
+        ancestors = tuple(deps for deps in dependency if deps != path)
+        if not ancestors:
+            return frozenset({None})
+        if ancestors[-1] in cls.allows_null:
+            return frozenset({None, *ancestors})
+        return frozenset({ancestors[-1]})
+
+    @classmethod
+    def _compile_templates(cls) -> dict[str, PathTemplate]:
+        fields = list(cls.model_fields)
+
+        def position(name: str) -> int:
+            return fields.index(name) if name in fields else len(fields)
+
+        templates = {}
+        for path, dependency in cls.dependencies_map.items():
+            if not dependency:
+                continue
+            # segments are emitted in the model's field order, aliases as keys
+            ordered = tuple(sorted(dependency, key=position))
+            keys = tuple(cls.aliases.get(name, name) for name in ordered)
+            templates[path] = PathTemplate(ordered, keys)
+        return templates
+
+    @classmethod
+    def raise_wrong_order(cls, path: str, fields: Sequence[str]) -> NoReturn:
+        """
+        Raise WrongPathOrderException for path following the chain of fields.
+        """
+        for deps in reversed(cls.dependencies_map[path]):
+            if deps != path and deps not in fields:
                 raise WrongPathOrderException(
-                    f"'{field}' can not be without '{deps}' attribute"
+                    f"'{path}' can not be without '{deps}' attribute"
                 )
+        raise WrongPathOrderException(
+            f"'{path}' can not be set after '{fields[-1]}' attribute"
+        )
 
-    def validate_all_paths(self) -> None:
-        # hotfix to ignore BasePathsModel's attributes that don't belong to path dependency objects
-        model_fields_to_ignore_set = {
-            "dependencies_map",
-            "data_source_path",
-            "allows_null",
-        }
+    @classmethod
+    def render_path(cls, path: str, paths: Mapping[str, str]) -> str:
+        """
+        Render path from plain values without creating a generator.
+        Values are escaped and validated the same way as constructor paths:
+        pydantic runs unless all of them are strings of plain str fields,
+        then dependencies are checked.
+        """
+        template = cls.get_template(path)
+        values = dict(zip(paths, escape_many(paths.values())))
+        if not (
+            values.keys() <= cls.str_fields
+            and cls.required_fields <= values.keys()
+            and all(type(value) is str for value in values.values())
+        ):
+            model = cls.model_validate(values)
+            values = {name: model.__dict__[name] for name in model.model_fields_set}
+        cls.check_dependencies(path, values)
+        return template.render(tuple(values.get(f) for f in template.fields))
 
-        model_fields_set = self.model_fields_set - model_fields_to_ignore_set
-        for field in model_fields_set:
-            self.__validate_path(field)
+    @classmethod
+    def check_dependencies(cls, path: str, values: Mapping[str, str]) -> None:
+        """
+        Check that values of fields are valid together and path has a value,
+        values themselves are not validated.
+        """
+        given = [field for field, value in values.items() if value is not None]
+        for field in cls.validation_plan.invalid_fields(values, given):
+            if field not in cls.dependent_paths:
+                raise PathDoesntExistException(
+                    f"Path '{field}' doesn't exist in generator"
+                )
+            deps = cls.__missing_dependency(cls.dependencies_map.get(field, ()), values)
+            if deps is not None:
+                raise WrongPathOrderException(
+                    f"'{field}' can not be without '{deps}' attribute"
+                )
 
-    def get_dependency(self, field) -> tuple:
-        dependency = self.dependencies_map.get(field)
-        if not dependency:
-            raise PathDoesntExistException(f"Path '{field}' doesn't exist in generator")
-        return dependency
+        if not values.get(path):
+            raise EmptyPathValueException(f"Path '{path}' is not set up")
 
     def check_if_path_is_set(self, path: str) -> None:
         if not getattr(self, path, None):
@@ -54,6 +391,161 @@ class BasePathsModel(BaseModel):
         setattr(self, path, value)
         self.__validate_path(path)
 
+    def __validate_path(self, field) -> None:
+        # fields that are not paths, e.g. set through an alias, have no dependency
+        self.__validate_dependency(
+            field, self.dependencies_map.get(field, ()), self.__dict__
+        )
+
+    @classmethod
+    def __validate_dependency(
+        cls, field, dependency: tuple, values: Mapping[str, str]
+    ) -> None:
+        deps = cls.__missing_dependency(dependency, values)
+        if deps is not None:
+            raise WrongPathOrderException(
+                f"'{field}' can not be without '{deps}' attribute"
+            )
+
+    @classmethod
+    def __missing_dependency(
+        cls, dependency: tuple, values: Mapping[str, str]
+    ) -> Optional[str]:
+        for deps in reversed(dependency):
+            deps_value = values.get(deps)
+            # allow dependency null if it is in allow_null list
+            if deps_value is None and deps in cls.allows_null:
+                return None
+            if not deps_value:
+                return deps
+        return None
+
+    def validate_all_paths(self) -> None:
+        # the plan finds suspects, the full check raises with the usual message
+        fields = self.model_fields_set
+        for field in self.validation_plan.invalid_fields(self.__dict__, fields):
+            self.__validate_path(field)
+
+    @classmethod
+    def get_dependency(cls, field) -> tuple:
+        dependency = cls.dependencies_map.get(field)
+        if not dependency:
+            raise PathDoesntExistException(f"Path '{field}' doesn't exist in generator")
+        return dependency
+
+    @classmethod
+    def get_template(cls, field) -> PathTemplate:
+        template = cls.path_templates.get(field)
+        if not template:
+            raise PathDoesntExistException(f"Path '{field}' doesn't exist in generator")
+        return template
+
+    @classmethod
+    def set_state_value(cls, state: "PathState", path: str, value: str) -> None:
+        """
+        Set path value of a compact state and check the path's dependencies,
+        the value is kept on error as well.
+        """
+        if path not in cls.dependent_paths:
+            raise ValueError(f'"{cls.__name__}" object has no field "{path}"')
+        setattr(state, path, value)
+        cls.__validate_dependency(path, cls.dependencies_map.get(path), state)
+
+    @classmethod
+    def check_parents(cls, path: str, values: Mapping[str, str]) -> None:
+        dependency = cls.get_dependency(path)
+        parents = tuple(d for d in dependency if d != path)
+        cls.__validate_dependency(path, parents, values)
+
+    @classmethod
+    def has_parents(cls, path: str, values: Mapping[str, str]) -> bool:
+        dependency = cls.dependencies_map.get(path)
+        if not dependency:
+            return False
+        parents = tuple(d for d in dependency if d != path)
+        return cls.__missing_dependency(parents, values) is None
+
+    def to_state(self) -> "PathState":
+        return self.state_class(self.__dict__.values())
+
+    @classmethod
+    def from_state(
+        cls, state: "PathState", read_only: bool = False
+    ) -> "BasePathsModel":
+        """
+        Paths model with the values of state, they are not validated again.
+        Setting values of a read_only model raises ValidationError, otherwise
+        it is equal to and behaves like the paths model.
+        """
+        values = {name: getattr(state, name) for name in state.__slots__}
+        fields_set = {name for name, value in values.items() if value is not None}
+        model_class = _read_only_model(cls) if read_only else cls
+        return model_class.__from_values(values, fields_set)
+
+    @classmethod
+    def __from_values(cls, values: dict, fields_set: set) -> "BasePathsModel":
+        # set up the way model_construct does it, without its per-field work
+        model = cls.__new__(cls)
+        object.__setattr__(model, "__dict__", values)
+        object.__setattr__(model, "__pydantic_fields_set__", fields_set)
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+        return model
+
+    @classmethod
+    def update_state(cls, state: "PathState", **paths) -> "PathState":
+        """
+        Validate and set only the given path values, then check dependencies of
+        them and of the set paths that depend on them. The updated values are
+        returned as a new state, state itself is not changed, also on error.
+        """
+        values = {name: getattr(state, name) for name in state.__slots__}
+        for name, value in paths.items():
+            if type(value) is str and name in cls.str_fields:
+                values[name] = value
+                continue
+            model = cls.__from_values(values, set())
+            cls.__pydantic_validator__.validate_assignment(model, name, value)
+            values = model.__dict__
+
+        affected = set(paths)
+        for name in paths:
+            affected.update(
+                path
+                for path in cls.dependent_paths[name]
+                if values.get(path) is not None
+            )
+        for field in cls.validation_plan.invalid_fields(values, affected):
+            cls.__validate_dependency(field, cls.dependencies_map.get(field), values)
+        return cls.state_class(values.values())
+
+
+def _read_only_eq(self: BasePathsModel, other: object) -> bool:
+    # models of one state class are equal regardless of being read-only
+    if isinstance(other, BasePathsModel) and other.state_class is self.state_class:
+        return self.__dict__ == other.__dict__
+    return NotImplemented
+
+
+def _read_only_reduce(self: BasePathsModel):
+    return self.state_class.paths_model.from_state, (self.to_state(), True)
+
+
+@lru_cache(maxsize=None)
+def _read_only_model(paths_model: Type[BasePathsModel]) -> Type[BasePathsModel]:
+    """Frozen subclass of paths_model, created once per paths model."""
+    return type(paths_model)(
+        paths_model.__name__,
+        (paths_model,),
+        {
+            "__module__": paths_model.__module__,
+            "__qualname__": paths_model.__qualname__,
+            "model_config": ConfigDict(frozen=True),
+            "__eq__": _read_only_eq,
+            "__reduce__": _read_only_reduce,
+        },
+    )
+
 
 class PostgresqlPathsModel(BasePathsModel):
     databases: str
@@ -76,10 +568,7 @@ class PostgresqlPathsModel(BasePathsModel):
             "relationships": ("databases", "schemas", "tables", "relationships"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: PostgresqlPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class MysqlPathsModel(BasePathsModel):
@@ -99,10 +588,7 @@ class MysqlPathsModel(BasePathsModel):
             "views_columns": ("databases", "views", "views_columns"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: MysqlPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class KafkaPathsModel(BasePathsModel):
@@ -112,10 +598,6 @@ class KafkaPathsModel(BasePathsModel):
     def _dependencies_map_factory(cls):
         return {"topics": ("topics",)}
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: KafkaPathsModel._dependencies_map_factory()
-    )
-
 
 class KafkaConnectorPathsModel(BasePathsModel):
     connectors: str
@@ -124,10 +606,6 @@ class KafkaConnectorPathsModel(BasePathsModel):
     def _dependencies_map_factory(cls):
         return {"connectors": ("connectors",)}
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: KafkaConnectorPathsModel._dependencies_map_factory()
-    )
-
 
 class GluePathsModel(BasePathsModel):
     databases: Optional[str] = None
@@ -148,10 +626,6 @@ class GluePathsModel(BasePathsModel):
             "runs": ("jobs", "runs"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: GluePathsModel._dependencies_map_factory()
-    )
-
 
 class SnowflakePathsModel(BasePathsModel):
     databases: str
@@ -176,10 +650,7 @@ class SnowflakePathsModel(BasePathsModel):
             "relationships": ("databases", "schemas", "tables", "relationships"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: SnowflakePathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class AirflowPathsModel(BasePathsModel):
@@ -195,10 +666,6 @@ class AirflowPathsModel(BasePathsModel):
             "runs": ("dags", "tasks", "runs"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: AirflowPathsModel._dependencies_map_factory()
-    )
-
 
 class HivePathsModel(BasePathsModel):
     databases: Optional[str] = None
@@ -219,10 +686,7 @@ class HivePathsModel(BasePathsModel):
             "owners": ("owners",),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: HivePathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class ElasticSearchPathsModel(BasePathsModel):
@@ -243,10 +707,6 @@ class ElasticSearchPathsModel(BasePathsModel):
             "templates_fields": ("templates", "templates_fields"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: ElasticSearchPathsModel._dependencies_map_factory()
-    )
-
 
 class FeastPathsModel(BasePathsModel):
     featureviews: Optional[str] = None
@@ -261,10 +721,6 @@ class FeastPathsModel(BasePathsModel):
             "subfeatures": ("featureviews", "features", "subfeatures"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: FeastPathsModel._dependencies_map_factory()
-    )
-
 
 class DynamodbPathsModel(BasePathsModel):
     tables: Optional[str] = None
@@ -274,10 +730,6 @@ class DynamodbPathsModel(BasePathsModel):
     def _dependencies_map_factory(cls):
         return {"tables": ("tables",), "columns": ("tables", "columns")}
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: DynamodbPathsModel._dependencies_map_factory()
-    )
-
 
 class OdbcPathsModel(BasePathsModel):
     databases: str
@@ -298,10 +750,7 @@ class OdbcPathsModel(BasePathsModel):
             "views_columns": ("databases", "schemas", "views", "views_columns"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: OdbcPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class MssqlPathsModel(BasePathsModel):
@@ -323,10 +772,7 @@ class MssqlPathsModel(BasePathsModel):
             "views_columns": ("databases", "schemas", "views", "views_columns"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: MssqlPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class OraclePathsModel(BasePathsModel):
@@ -349,10 +795,7 @@ class OraclePathsModel(BasePathsModel):
             "views_columns": ("schemas", "databases", "views", "views_columns"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: OraclePathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class RedshiftPathsModel(BasePathsModel):
@@ -374,10 +817,7 @@ class RedshiftPathsModel(BasePathsModel):
             "views_columns": ("databases", "schemas", "views", "views_columns"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: RedshiftPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class ClickHousePathsModel(BasePathsModel):
@@ -397,10 +837,7 @@ class ClickHousePathsModel(BasePathsModel):
             "views_columns": ("databases", "views", "views_columns"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: ClickHousePathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class AthenaPathsModel(BasePathsModel):
@@ -422,10 +859,6 @@ class AthenaPathsModel(BasePathsModel):
             "views_columns": ("catalogs", "databases", "views", "views_columns"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: AthenaPathsModel._dependencies_map_factory()
-    )
-
 
 class QuicksightPathsModel(BasePathsModel):
     datasets: Optional[str] = None
@@ -442,10 +875,6 @@ class QuicksightPathsModel(BasePathsModel):
             "data_sources": ("data_sources",),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: QuicksightPathsModel._dependencies_map_factory()
-    )
-
 
 class DbtPathsModel(BasePathsModel):
     databases: Optional[str] = None
@@ -474,10 +903,6 @@ class DbtPathsModel(BasePathsModel):
             "seeds": ("seeds",),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: DbtPathsModel._dependencies_map_factory()
-    )
-
 
 class PrefectPathsModel(BasePathsModel):
     flows: str
@@ -492,10 +917,6 @@ class PrefectPathsModel(BasePathsModel):
             "runs": ("flows", "tasks", "runs"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: PrefectPathsModel._dependencies_map_factory()
-    )
-
 
 class TableauPathsModel(BasePathsModel):
     sites: str
@@ -518,11 +939,8 @@ class TableauPathsModel(BasePathsModel):
             "sheets": ("sites", "workbooks", "sheets"),
         }
 
-    allows_null: list = ["schemas"]
-    data_source_path: str = "sites"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: TableauPathsModel._dependencies_map_factory()
-    )
+    allows_null: ClassVar[frozenset[str]] = frozenset({"schemas"})
+    data_source_path: ClassVar[str] = "sites"
 
 
 class Neo4jPathsModel(BasePathsModel):
@@ -540,10 +958,7 @@ class Neo4jPathsModel(BasePathsModel):
             "relationships": ("databases", "nodes", "relationships"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: Neo4jPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class S3PathsModel(BasePathsModel):
@@ -559,10 +974,7 @@ class S3PathsModel(BasePathsModel):
             "columns": ("buckets", "keys", "columns"),
         }
 
-    data_source_path: str = "buckets"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: S3PathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "buckets"
 
 
 class S3CustomPathsModel(BasePathsModel):
@@ -578,10 +990,7 @@ class S3CustomPathsModel(BasePathsModel):
             "columns": ("buckets", "keys", "columns"),
         }
 
-    data_source_path: str = "buckets"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: S3CustomPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "buckets"
 
 
 class CassandraPathsModel(BasePathsModel):
@@ -602,10 +1011,7 @@ class CassandraPathsModel(BasePathsModel):
             "views_columns": ("keyspaces", "views", "views_columns"),
         }
 
-    data_source_path: str = "keyspaces"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: CassandraPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "keyspaces"
 
 
 class SagemakerPathsModel(BasePathsModel):
@@ -623,10 +1029,6 @@ class SagemakerPathsModel(BasePathsModel):
             "artifacts": ("experiments", "trials", "artifacts"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: SagemakerPathsModel._dependencies_map_factory()
-    )
-
 
 class KubeflowPathsModel(BasePathsModel):
     pipelines: Optional[str] = None
@@ -641,10 +1043,6 @@ class KubeflowPathsModel(BasePathsModel):
             "runs": ("experiments", "runs"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: KubeflowPathsModel._dependencies_map_factory()
-    )
-
 
 class TarantoolPathsModel(BasePathsModel):
     spaces: Optional[str] = None
@@ -654,10 +1052,6 @@ class TarantoolPathsModel(BasePathsModel):
     def _dependencies_map_factory(cls):
         return {"spaces": ("spaces",), "columns": ("spaces", "columns")}
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: TarantoolPathsModel._dependencies_map_factory()
-    )
-
 
 class KinesisPathsModel(BasePathsModel):
     streams: Optional[str] = None
@@ -672,10 +1066,6 @@ class KinesisPathsModel(BasePathsModel):
             "data_records": ("streams", "shards", "data_records"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: KinesisPathsModel._dependencies_map_factory()
-    )
-
 
 class MongoPathsModel(BasePathsModel):
     databases: str
@@ -690,10 +1080,7 @@ class MongoPathsModel(BasePathsModel):
             "columns": ("databases", "collections", "columns"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: MongoPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class VerticaPathsModel(BasePathsModel):
@@ -715,10 +1102,7 @@ class VerticaPathsModel(BasePathsModel):
             "views_columns": ("databases", "schemas", "views", "views_columns"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: VerticaPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class PrestoPathsModel(BasePathsModel):
@@ -736,10 +1120,6 @@ class PrestoPathsModel(BasePathsModel):
             "columns": ("catalogs", "schemas", "tables", "columns"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: PrestoPathsModel._dependencies_map_factory()
-    )
-
 
 class SupersetPathsModel(BasePathsModel):
     databases: Optional[str] = None
@@ -758,10 +1138,6 @@ class SupersetPathsModel(BasePathsModel):
             "dashboards": ("dashboards",),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: SupersetPathsModel._dependencies_map_factory()
-    )
-
 
 class CubeJsPathModel(BasePathsModel):
     cubes: str = ""
@@ -770,10 +1146,6 @@ class CubeJsPathModel(BasePathsModel):
     def _dependencies_map_factory(cls):
         return {"cubes": ("cubes",)}
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: CubeJsPathModel._dependencies_map_factory()
-    )
-
 
 class MetabasePathModel(BasePathsModel):
     collections: str = ""
@@ -788,10 +1160,6 @@ class MetabasePathModel(BasePathsModel):
             "cards": ("collections", "cards"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: MetabasePathModel._dependencies_map_factory()
-    )
-
 
 class DmsPathsModel(BasePathsModel):
     tasks: Optional[str] = None
@@ -801,10 +1169,6 @@ class DmsPathsModel(BasePathsModel):
     def _dependencies_map_factory(cls):
         return {"tasks": ("tasks",), "runs": ("tasks", "runs")}
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: DmsPathsModel._dependencies_map_factory()
-    )
-
 
 class PowerBiPathModel(BasePathsModel):
     datasets: Optional[str] = None
@@ -817,10 +1181,6 @@ class PowerBiPathModel(BasePathsModel):
             "dashboards": ("dashboards",),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: PowerBiPathModel._dependencies_map_factory()
-    )
-
 
 class RedashPathsModel(BasePathsModel):
     queries: Optional[str] = None
@@ -834,10 +1194,6 @@ class RedashPathsModel(BasePathsModel):
             "jobs": ("jobs",),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: RedashPathsModel._dependencies_map_factory()
-    )
-
 
 class AirbytePathsModel(BasePathsModel):
     connections: Optional[str] = None
@@ -848,10 +1204,6 @@ class AirbytePathsModel(BasePathsModel):
             "connections": ("connections",),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: AirbytePathsModel._dependencies_map_factory()
-    )
-
 
 class FilesystemPathModel(BasePathsModel):
     path: Optional[str] = None
@@ -861,10 +1213,6 @@ class FilesystemPathModel(BasePathsModel):
     def _dependencies_map_factory(cls):
         return {"path": ("path",), "fields": ("path", "fields")}
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: FilesystemPathModel._dependencies_map_factory()
-    )
-
 
 class GreatExpectationsPathsModel(BasePathsModel):
     suites: Optional[str] = None
@@ -879,10 +1227,6 @@ class GreatExpectationsPathsModel(BasePathsModel):
             "runs": ("suites", "types", "runs"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: GreatExpectationsPathsModel._dependencies_map_factory()
-    )
-
 
 class DatabricksLakehousePathModel(BasePathsModel):
     databases: Optional[str] = None
@@ -897,10 +1241,6 @@ class DatabricksLakehousePathModel(BasePathsModel):
             "columns": ("databases", "tables", "columns"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: DatabricksLakehousePathModel._dependencies_map_factory()
-    )
-
 
 class DatabricksUnityCatalogPathModel(BasePathsModel):
     catalogs: Optional[str] = None
@@ -917,10 +1257,6 @@ class DatabricksUnityCatalogPathModel(BasePathsModel):
             "columns": ("catalogs", "schemas", "tables", "columns"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: DatabricksUnityCatalogPathModel._dependencies_map_factory()
-    )
-
 
 class DatabricksFeatureStorePathModel(BasePathsModel):
     databases: Optional[str] = None
@@ -935,10 +1271,6 @@ class DatabricksFeatureStorePathModel(BasePathsModel):
             "columns": ("databases", "tables", "columns"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: DatabricksFeatureStorePathModel._dependencies_map_factory()
-    )
-
 
 class SingleStorePathsModel(BasePathsModel):
     databases: str
@@ -957,10 +1289,7 @@ class SingleStorePathsModel(BasePathsModel):
             "views_columns": ("databases", "views", "views_columns"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: SingleStorePathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class AzureSQLPathsModel(BasePathsModel):
@@ -983,10 +1312,7 @@ class AzureSQLPathsModel(BasePathsModel):
             "views_columns": ("databases", "schemas", "views", "views_columns"),
         }
 
-    data_source_path: str = "databases"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: AzureSQLPathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "databases"
 
 
 class FivetranPathsModel(BasePathsModel):
@@ -998,10 +1324,6 @@ class FivetranPathsModel(BasePathsModel):
             "transformers": ("transformers",),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: FivetranPathsModel._dependencies_map_factory()
-    )
-
 
 class LambdaPathsModel(BasePathsModel):
     functions: Optional[str] = None
@@ -1012,10 +1334,6 @@ class LambdaPathsModel(BasePathsModel):
             "functions": ("functions",),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: LambdaPathsModel._dependencies_map_factory()
-    )
-
 
 class CouchbasePathsModel(BasePathsModel):
     buckets: str
@@ -1032,20 +1350,62 @@ class CouchbasePathsModel(BasePathsModel):
             "columns": ("buckets", "scopes", "collections", "columns"),
         }
 
-    data_source_path: str = "buckets"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: CouchbasePathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "buckets"
+
+
+# How SQLitePathsModel checks that path is an existing file: "strict" on every
+# validation, "cached" once per distinct path, "skip" never (offline generation)
+FILE_CHECKS = ("strict", "cached", "skip")
+FILE_CHECK_CACHE_SIZE = 1024
+
+# file check of the current thread or task and paths found to be files by it,
+# the cache is None unless the check is "cached"
+_file_check: ContextVar[tuple[str, Optional[dict[Path, None]]]] = ContextVar(
+    "sqlite_file_check", default=("strict", None)
+)
 
 
 class SQLitePathsModel(BasePathsModel):
-    path: Optional[FilePath] = None
+    path: Optional[Path] = None
     tables: Optional[str] = None
     views: Optional[str] = None
     columns: Optional[str] = None
     tables_columns: Optional[str] = Field(None, alias="columns")
     views_columns: Optional[str] = Field(None, alias="columns")
 
+    @classmethod
+    @contextmanager
+    def file_check(cls, file_check: str) -> Iterator[None]:
+        """
+        Check paths validated in the block with file_check, see FILE_CHECKS.
+        It applies to the current thread or task only. "cached" remembers up to
+        FILE_CHECK_CACHE_SIZE found files, until the block ends.
+        """
+        if file_check not in FILE_CHECKS:
+            raise ValueError(f"file_check must be one of {', '.join(FILE_CHECKS)}")
+        token = _file_check.set((file_check, {} if file_check == "cached" else None))
+        try:
+            yield
+        finally:
+            _file_check.reset(token)
+
+    @field_validator("path")
+    @classmethod
+    def path_must_be_file(cls, path: Optional[Path]) -> Optional[Path]:
+        file_check, checked_files = _file_check.get()
+        if path is None or file_check == "skip":
+            return path
+        if checked_files is not None and path in checked_files:
+            return path
+        if not path.is_file():
+            # same error as pydantic's FilePath
+            raise PydanticCustomError("path_not_file", "Path does not point to a file")
+        if checked_files is not None:
+            if len(checked_files) >= FILE_CHECK_CACHE_SIZE:
+                del checked_files[next(iter(checked_files))]
+            checked_files[path] = None
+        return path
+
     @classmethod
     def _dependencies_map_factory(cls):
         return {
@@ -1056,10 +1416,7 @@ class SQLitePathsModel(BasePathsModel):
             "views_columns": ("path", "views", "views_columns"),
         }
 
-    data_source_path: str = "path"
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: SQLitePathsModel._dependencies_map_factory()
-    )
+    data_source_path: ClassVar[str] = "path"
 
 
 class BigTablePathsModel(BasePathsModel):
@@ -1075,10 +1432,6 @@ class BigTablePathsModel(BasePathsModel):
             "columns": ("instances", "tables", "columns"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: BigTablePathsModel._dependencies_map_factory()
-    )
-
 
 class DuckDBPathsModel(BasePathsModel):
     catalogs: Optional[str] = None
@@ -1095,10 +1448,6 @@ class DuckDBPathsModel(BasePathsModel):
             "columns": ("catalogs", "schemas", "tables", "columns"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: DuckDBPathsModel._dependencies_map_factory()
-    )
-
 
 class GCSPathsModel(BasePathsModel):
     buckets: Optional[str] = None
@@ -1113,10 +1462,6 @@ class GCSPathsModel(BasePathsModel):
             "columns": ("buckets", "keys", "columns"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: GCSPathsModel._dependencies_map_factory()
-    )
-
 
 class BlobPathsModel(BasePathsModel):
     keys: Optional[str] = None
@@ -1132,10 +1477,6 @@ class BlobPathsModel(BasePathsModel):
             ),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: BlobPathsModel._dependencies_map_factory()
-    )
-
 
 class BigQueryStoragePathsModel(BasePathsModel):
     datasets: Optional[str] = None
@@ -1150,10 +1491,6 @@ class BigQueryStoragePathsModel(BasePathsModel):
             "columns": ("datasets", "tables", "columns"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: BigQueryStoragePathsModel._dependencies_map_factory()
-    )
-
 
 class CKANPathsModel(BasePathsModel):
     organizations: Optional[str] = None
@@ -1172,10 +1509,6 @@ class CKANPathsModel(BasePathsModel):
             "fields": ("organizations", "datasets", "resources", "fields"),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: CKANPathsModel._dependencies_map_factory()
-    )
-
 
 class AzureDataFactoryPathsModel(BasePathsModel):
     factories: Optional[str] = None
@@ -1201,10 +1534,6 @@ class AzureDataFactoryPathsModel(BasePathsModel):
             ),
         }
 
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: AzureDataFactoryPathsModel._dependencies_map_factory()
-    )
-
 
 class ApiPathsModel(BasePathsModel):
     resources: Optional[str] = None
@@ -1216,7 +1545,3 @@ class ApiPathsModel(BasePathsModel):
             "resources": ("resources",),
             "fields": ("resources", "fields"),
         }
-
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: ApiPathsModel._dependencies_map_factory()
-    )
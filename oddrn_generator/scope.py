@@ -0,0 +1,114 @@
+from typing import Iterable, NoReturn, Optional, Type
+
+from oddrn_generator.exceptions import (
+    EmptyPathValueException,
+    PathDoesntExistException,
+)
+from oddrn_generator.path_models import BasePathsModel
+from oddrn_generator.utils import escape, escape_many
+
+
+class Scope:
+    """
+    Immutable oddrn prefix: a parent scope plus one "key/value" segment.
+
+    Scopes never change after creation, so they can be shared between threads
+    and nested loops. A child reuses its parent's oddrn string and only appends
+    its own segment to it.
+    """
+
+    __slots__ = ("paths_model", "parent", "field", "value", "oddrn")
+
+    def __init__(
+        self,
+        paths_model: Type[BasePathsModel],
+        oddrn: str,
+        parent: Optional["Scope"] = None,
+        field: Optional[str] = None,
+        value: Optional[str] = None,
+    ):
+        self.paths_model = paths_model
+        self.oddrn = oddrn
+        self.parent = parent
+        self.field = field
+        self.value = value
+
+    def __repr__(self) -> str:
+        return f"Scope('{self.oddrn}')"
+
+    def __str__(self) -> str:
+        return self.oddrn
+
+    def scope(self, **paths) -> "Scope":
+        """
+        Get child scope with given paths, they are applied in dependency order.
+        """
+        dependencies_map = self.paths_model.dependencies_map
+        if len(paths) > 1:
+            paths = {
+                path: paths[path]
+                for path in sorted(
+                    paths, key=lambda p: len(dependencies_map.get(p, ()))
+                )
+            }
+        scope = self
+        for path in paths:
+            value = paths[path]
+            scope = Scope(
+                self.paths_model,
+                scope._child_oddrn(path, value),
+                scope,
+                path,
+                value,
+            )
+        return scope
+
+    def get_oddrn_by_path(self, path: str, new_value: str = None) -> str:
+        """
+        Get oddrn of this scope or of its ancestor for path.
+        With new_value get oddrn of a child for it, without creating the child.
+        """
+        if new_value:
+            return self._child_oddrn(path, new_value)
+
+        if path not in self.paths_model.dependencies_map:
+            raise PathDoesntExistException(f"Path '{path}' doesn't exist in generator")
+        scope = self
+        while scope is not None:
+            if scope.field == path:
+                return scope.oddrn
+            scope = scope.parent
+        raise EmptyPathValueException(f"Path '{path}' is not set up")
+
+    def get_oddrns_by_path(self, path: str, values: Iterable[str]) -> list[str]:
+        prefix = self.child_prefix(path)
+        values = list(values)
+        if not all(values):
+            raise EmptyPathValueException(f"Path '{path}' is not set up")
+        return [f"{prefix}{value}" for value in escape_many(values)]
+
+    def _child_oddrn(self, path: str, value: str) -> str:
+        if not value:
+            raise EmptyPathValueException(f"Path '{path}' is not set up")
+        return f"{self.child_prefix(path)}{escape(value)}"
+
+    def child_prefix(self, path: str) -> str:
+        """
+        Get oddrn of a child for path without its value, e.g. for a table scope
+        and "tables_columns" "//postgresql/.../tables/users/columns/".
+        Values appended to it must be escaped.
+        """
+        parents = self.paths_model.parent_paths.get(path)
+        if parents is None:
+            raise PathDoesntExistException(f"Path '{path}' doesn't exist in generator")
+        if self.field not in parents:
+            self._raise_wrong_order(path)
+        return f"{self.oddrn}/{self.paths_model.aliases.get(path, path)}/"
+
+    def _raise_wrong_order(self, path: str) -> NoReturn:
+        fields = []
+        scope = self
+        while scope.parent is not None:
+            fields.append(scope.field)
+            scope = scope.parent
+        self.paths_model.raise_wrong_order(path, fields[::-1])
@@ -1,30 +1,38 @@
+import sys
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import ClassVar, Optional
 from urllib.parse import urlparse
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
-class HostSettings(BaseModel):
+class DeferredModel(BaseModel):
+    """Builds its pydantic schema on first use instead of at import time."""
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class HostSettings(DeferredModel):
     host: str
 
 
-class CloudSettings(BaseModel):
+class CloudSettings(DeferredModel):
     account: str
     region: str
 
 
-class AzureCloudSettings(BaseModel):
+class AzureCloudSettings(DeferredModel):
     domain: Optional[str] = None
     account: Optional[str] = None
     container: Optional[str] = None
 
 
-class GoogleCloudSettings(BaseModel):
+class GoogleCloudSettings(DeferredModel):
     project: str
 
 
-class S3CustomSettings(BaseModel):
+class S3CustomSettings(DeferredModel):
     endpoint: str
 
     @field_validator("endpoint")
@@ -38,7 +46,7 @@ class S3CustomSettings(BaseModel):
             return endpoint
 
 
-class ServerModelConfig(BaseModel):
+class ServerModelConfig(DeferredModel):
     host_settings: Optional[HostSettings] = None
     cloud_settings: Optional[CloudSettings] = None
     azure_cloud_settings: Optional[AzureCloudSettings] = None
@@ -47,6 +55,9 @@ class ServerModelConfig(BaseModel):
 
 
 class AbstractServerModel(ABC):
+    # Generator keyword argument the model is created from
+    settings_keyword: ClassVar[Optional[str]] = None
+
     @abstractmethod
     def __str__(self) -> str:
         raise NotImplementedError
@@ -56,7 +67,8 @@ class AbstractServerModel(ABC):
         raise NotImplementedError
 
 
-class HostnameModel(AbstractServerModel, BaseModel):
+class HostnameModel(AbstractServerModel, DeferredModel):
+    settings_keyword: ClassVar[str] = "host_settings"
     host: str
 
     def __str__(self) -> str:
@@ -72,7 +84,8 @@ class HostnameModel(AbstractServerModel, BaseModel):
             raise ValueError("You must specify host settings")
 
 
-class AWSCloudModel(AbstractServerModel, BaseModel):
+class AWSCloudModel(AbstractServerModel, DeferredModel):
+    settings_keyword: ClassVar[str] = "cloud_settings"
     account: str
     region: str
 
@@ -89,7 +102,8 @@ class AWSCloudModel(AbstractServerModel, BaseModel):
             raise ValueError("You must specify cloud settings")
 
 
-class AzureDomainCloudModel(AbstractServerModel, BaseModel):
+class AzureDomainCloudModel(AbstractServerModel, DeferredModel):
+    settings_keyword: ClassVar[str] = "azure_cloud_settings"
     domain: str
 
     def __str__(self) -> str:
@@ -105,7 +119,8 @@ class AzureDomainCloudModel(AbstractServerModel, BaseModel):
             raise ValueError("You must specify cloud settings")
 
 
-class BlobStorageCloudModel(AbstractServerModel, BaseModel):
+class BlobStorageCloudModel(AbstractServerModel, DeferredModel):
+    settings_keyword: ClassVar[str] = "azure_cloud_settings"
     account: str
     container: str
 
@@ -125,7 +140,8 @@ class BlobStorageCloudModel(AbstractServerModel, BaseModel):
             raise ValueError("You must specify cloud settings")
 
 
-class S3CustomModel(AbstractServerModel, BaseModel):
+class S3CustomModel(AbstractServerModel, DeferredModel):
+    settings_keyword: ClassVar[str] = "endpoint"
     endpoint: str
 
     def __str__(self) -> str:
@@ -136,7 +152,7 @@ class S3CustomModel(AbstractServerModel, BaseModel):
         return cls(endpoint=config.s3_custom_cloud_settings.endpoint)
 
 
-class S3CloudModel(AbstractServerModel, BaseModel):
+class S3CloudModel(AbstractServerModel, DeferredModel):
     """Bucket name is unique across AWS"""
 
     def __str__(self) -> str:
@@ -147,13 +163,14 @@ class S3CloudModel(AbstractServerModel, BaseModel):
         return cls()
 
 
-class SQLiteModel(BaseModel):
+class SQLiteModel(DeferredModel):
     @classmethod
     def create(cls, config):
         return cls()
 
 
-class GCPCloudModel(BaseModel):
+class GCPCloudModel(DeferredModel):
+    settings_keyword: ClassVar[str] = "google_cloud_settings"
     project: str
 
     def __str__(self) -> str:
@@ -167,3 +184,92 @@ class GCPCloudModel(BaseModel):
             return cls(project=gcp_cloud_settings.project)
         else:
             raise ValueError("You must specify cloud settings")
+
+
+def build_server_config(
+    cloud_settings: dict = None,
+    azure_cloud_settings: dict = None,
+    host_settings: str = None,
+    endpoint: str = None,
+    google_cloud_settings: dict = None,
+) -> ServerModelConfig:
+    return ServerModelConfig(
+        cloud_settings=CloudSettings(**cloud_settings) if cloud_settings else None,
+        azure_cloud_settings=(
+            AzureCloudSettings(**azure_cloud_settings) if azure_cloud_settings else None
+        ),
+        host_settings=HostSettings(host=host_settings) if host_settings else None,
+        s3_custom_cloud_settings=(
+            S3CustomSettings(endpoint=endpoint) if endpoint else None
+        ),
+        google_cloud_settings=(
+            GoogleCloudSettings(**google_cloud_settings)
+            if google_cloud_settings
+            else None
+        ),
+    )
+
+
+SERVER_CACHE_SIZE = 1024
+
+# server objects by (server model, settings), oldest are dropped first
+_servers: dict[tuple, BaseModel] = {}
+_servers_lock = threading.Lock()
+
+
+def _freeze(settings):
+    if isinstance(settings, dict):
+        return tuple(sorted(settings.items()))
+    return settings
+
+
+def create_server(server_model, **settings) -> BaseModel:
+    """
+    Get server object for generator's server keyword arguments.
+
+    When only the model's own keyword is given, objects are reused for repeated
+    settings and no ServerModelConfig is built. Anything else, and every first
+    occurrence of settings, goes through ServerModelConfig and server_model.create,
+    so validation errors are the same.
+    """
+    keyword = getattr(server_model, "settings_keyword", None)
+    key = None
+    if all(not value for name, value in settings.items() if name != keyword):
+        try:
+            key = (server_model, _freeze(settings.get(keyword)))
+            server = _servers.get(key)
+        except TypeError:
+            # unhashable settings are never cached
+            key = server = None
+        if server is not None:
+            return server
+
+    server = server_model.create(build_server_config(**settings))
+    if key is not None:
+        with _servers_lock:
+            if len(_servers) >= SERVER_CACHE_SIZE:
+                del _servers[next(iter(_servers))]
+            _servers[key] = server
+    return server
+
+
+# server prefixes by (server model, field values), shared by every generator,
+# oldest are dropped first
+_server_prefixes: dict[tuple, str] = {}
+_server_prefixes_lock = threading.Lock()
+
+
+def get_server_prefix(server_obj: BaseModel) -> str:
+    """
+    Get interned server part of oddrn, it is built once for the same settings
+    while they are among the last SERVER_CACHE_SIZE ones.
+    """
+    key = (type(server_obj), *server_obj.__dict__.values())
+    prefix = _server_prefixes.get(key)
+    if prefix is None:
+        prefix = sys.intern(str(server_obj))
+        with _server_prefixes_lock:
+            if len(_server_prefixes) >= SERVER_CACHE_SIZE:
+                del _server_prefixes[next(iter(_server_prefixes))]
+            _server_prefixes[key] = prefix
+    return prefix
@@ -0,0 +1,199 @@
+"""
+Set of oddrns stored as a trie of interned "key/value" segments.
+
+Oddrns of one server share long prefixes, e.g. every column of a table starts
+with //postgresql/host/<h>/databases/<d>/schemas/<s>/tables/<t>/columns/.
+The trie keeps each prefix once and every segment string once per
+interpreter, so a column costs a dict entry instead of a whole string.
+"""
+
+import sys
+from typing import Iterable, Iterator, Optional
+
+from oddrn_generator.exceptions import InvalidOddrnException
+
+# Key of nodes that are oddrns themselves and have children too,
+# nodes without children are stored as None
+_END = None
+_MISSING = object()
+
+
+def _split(oddrn: str) -> tuple[list[str], Optional[str]]:
+    """
+    Segments of oddrn: its source, then "key/value" pairs of the parts after it,
+    and the last part on its own when the pairs don't cover it.
+    """
+    if not oddrn.startswith("//"):
+        raise InvalidOddrnException(f"Oddrn '{oddrn}' must start with '//'")
+    parts = oddrn[2:].split("/")
+    pairs = iter(parts[1:])
+    segments = [parts[0], *map("/".join, zip(pairs, pairs))]
+    return segments, parts[-1] if len(parts) % 2 == 0 else None
+
+
+def _segments(oddrn: str) -> list[str]:
+    segments, rest = _split(oddrn)
+    if rest is not None:
+        segments.append(rest)
+    return segments
+
+
+def _walk(oddrn: str, node: Optional[dict]) -> Iterator[str]:
+    """Oddrns of node and of all nodes below it, depth first in insertion order."""
+    stack = [(oddrn, node)]
+    while stack:
+        oddrn, node = stack.pop()
+        if node is None:
+            yield oddrn
+            continue
+        if _END in node:
+            yield oddrn
+        stack.extend(
+            (f"{oddrn}/{segment}", child)
+            for segment, child in reversed(node.items())
+            if segment is not _END
+        )
+
+
+class OddrnTrie:
+    """
+    Set of oddrn strings with shared prefixes stored once.
+
+    Supports the set operations a dedup layer needs: add, remove, discard,
+    ``in``, ``len`` and iteration, plus iter_prefix for all oddrns under one
+    oddrn. Oddrns are rebuilt on iteration, so they are equal to the added
+    strings but not the same objects. Any string starting with "//" is accepted.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, oddrns: Iterable[str] = ()):
+        self._root: dict = {}
+        self._size = 0
+        for oddrn in oddrns:
+            self.add(oddrn)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._size} oddrns)"
+
+    def __contains__(self, oddrn: object) -> bool:
+        if not isinstance(oddrn, str) or not oddrn.startswith("//"):
+            return False
+        *segments, last = _segments(oddrn)
+        node = self._root
+        for segment in segments:
+            node = node.get(segment)
+            if node is None:
+                return False
+        child = node.get(last, _MISSING)
+        return child is None or (child is not _MISSING and _END in child)
+
+    def __iter__(self) -> Iterator[str]:
+        for segment, child in self._root.items():
+            yield from _walk(f"//{segment}", child)
+
+    def add(self, oddrn: str) -> None:
+        *segments, last = map(sys.intern, _segments(oddrn))
+        node = self._root
+        for segment in segments:
+            child = node.get(segment, _MISSING)
+            if child is _MISSING:
+                child = node[segment] = {}
+            elif child is None:
+                child = node[segment] = {_END: None}
+            node = child
+
+        child = node.get(last, _MISSING)
+        if child is _MISSING:
+            node[last] = None
+        elif child is None or _END in child:
+            return
+        else:
+            child[_END] = None
+        self._size += 1
+
+    def discard(self, oddrn: str) -> bool:
+        """
+        Remove oddrn if it is present, returns whether it was.
+        Nodes left without oddrns are dropped on the way back up.
+        """
+        if oddrn not in self:
+            return False
+        *segments, last = _segments(oddrn)
+        nodes = [self._root]
+        for segment in segments:
+            nodes.append(nodes[-1][segment])
+
+        node = nodes[-1]
+        if node[last] is None:
+            del node[last]
+        else:
+            del node[last][_END]
+        self._size -= 1
+
+        for parent, segment in zip(reversed(nodes[:-1]), reversed(segments)):
+            child = parent[segment]
+            if not child:
+                del parent[segment]
+            elif len(child) == 1 and _END in child:
+                parent[segment] = None
+            else:
+                break
+        return True
+
+    def remove(self, oddrn: str) -> None:
+        if not self.discard(oddrn):
+            raise KeyError(oddrn)
+
+    def clear(self) -> None:
+        self._root = {}
+        self._size = 0
+
+    def iter_prefix(self, oddrn: str) -> Iterator[str]:
+        """
+        Oddrn itself when it is present and all present oddrns below it,
+        e.g. every column of a table oddrn. Matches whole segments only.
+        """
+        segments, rest = _split(oddrn)
+        node = self._root
+        if rest is None:
+            *segments, last = segments
+        for segment in segments:
+            node = node.get(segment)
+            if node is None:
+                return
+
+        if rest is None:
+            child = node.get(last, _MISSING)
+            if child is not _MISSING:
+                yield from _walk(oddrn, child)
+            return
+        # the last part is the first half of a "key/value" segment
+        base = oddrn[: -len(rest) - 1]
+        for segment, child in node.items():
+            if segment == rest or (
+                segment is not _END and segment.startswith(f"{rest}/")
+            ):
+                yield from _walk(f"{base}/{segment}", child)
+
+    def memory_usage(self) -> int:
+        """
+        Bytes of the trie's dicts plus its segment strings, each string once.
+        Interned segments may be shared with other objects, so it is an upper
+        bound of what dropping the trie frees.
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self._root)
+        seen = set()
+        stack = [self._root]
+        while stack:
+            for segment, child in stack.pop().items():
+                if segment is not _END and id(segment) not in seen:
+                    seen.add(id(segment))
+                    size += sys.getsizeof(segment)
+                if child is not None:
+                    size += sys.getsizeof(child)
+                    stack.append(child)
+        return size
@@ -1,3 +1,5 @@
+from typing import Any, Collection, Iterable, Mapping
+
 ESCAPED_DELIMITER = "\\\\"
 DELIMITER = "/"
 
@@ -11,3 +13,52 @@ def escape(value: any) -> any:
 
 def unescape(value: str) -> str:
     return value.replace(ESCAPED_DELIMITER, DELIMITER)
+
+
+def _contains(values: Collection, part: str) -> bool:
+    # one scan over all strings instead of a replace per value
+    try:
+        joined = "".join(values)
+    except TypeError:
+        joined = "".join([value for value in values if isinstance(value, str)])
+    return part in joined
+
+
+def escape_many(values: Iterable[Any]) -> list:
+    """
+    escape every value. When no value has the delimiter, which is the common
+    case, values are returned after a single scan.
+    """
+    values = list(values)
+    if not _contains(values, DELIMITER):
+        return values
+    return [
+        value.replace(DELIMITER, ESCAPED_DELIMITER) if isinstance(value, str) else value
+        for value in values
+    ]
+
+
+def unescape_many(values: Iterable[str]) -> list[str]:
+    """
+    unescape every value, values without escaped delimiters skip the replace.
+    """
+    values = list(values)
+    if ESCAPED_DELIMITER not in "".join(values):
+        return values
+    return [value.replace(ESCAPED_DELIMITER, DELIMITER) for value in values]
+
+
+def escape_paths(paths: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    escape_many for path values by name, a new dict is returned.
+    """
+    if not _contains(paths.values(), DELIMITER):
+        return dict(paths)
+    return {
+        name: (
+            value.replace(DELIMITER, ESCAPED_DELIMITER)
+            if isinstance(value, str)
+            else value
+        )
+        for name, value in paths.items()
+    }
@@ -1,8 +1,10 @@
+import threading
 from abc import abstractmethod
-from typing import Optional, Type
+from typing import Iterable, Optional, Tuple, Type
 
 from pydantic_settings import BaseSettings
 
+from oddrn_generator.exceptions import EmptyPathValueException
 from oddrn_generator.generators import (
     AthenaGenerator,
     CassandraGenerator,
@@ -22,6 +24,9 @@ from oddrn_generator.generators import (
     TrinoGenerator,
     VerticaGenerator,
 )
+from oddrn_generator.scope import Scope
+
+SCHEMA_SCOPE_CACHE_SIZE = 1024
 
 
 class ExternalGeneratorMappingError(Exception):
@@ -73,6 +78,10 @@ class ExternalDbGenerator:
             db_settings: ExternalDbSettings
         """
         self.db_settings = db_settings
+        self._database_scope: Optional[Scope] = None
+        # scopes by schema name, oldest are dropped first
+        self._schema_scopes: dict[str, Scope] = {}
+        self._schema_scopes_lock = threading.Lock()
 
     generator_cls: Type[Generator]
     database_path_name: str
@@ -135,6 +144,81 @@ class ExternalDbGenerator:
         gen.get_oddrn_by_path(self.table_path_name, table_name)
         return gen
 
+    def get_scope_for_database_lvl(self) -> Scope:
+        """
+        Get scope with predefined database, it is built once per instance.
+
+        Returns
+        -------
+        Scope
+        """
+        if self._database_scope is None:
+            self._database_scope = self.get_generator_for_database_lvl().scope(
+                **{self.database_path_name: self.db_settings.database_name}
+            )
+        return self._database_scope
+
+    @abstractmethod
+    def get_scope_for_schema_lvl(self, schema_name: str) -> Scope:
+        """
+        Get scope with predefined database and schema.
+
+        Parameters
+        ----------
+            schema_name: str
+                schema name for a source
+
+        Returns
+        -------
+        Scope
+        """
+        pass
+
+    def table_oddrn(self, schema_name: str, table_name: str) -> str:
+        """
+        Get table oddrn without creating a generator.
+        Same as get_generator_for_table_lvl(...).get_oddrn_by_path(table_path_name)
+
+        Parameters
+        ----------
+            schema_name: str
+                schema name for a source
+            table_name: str
+                table name for a source
+
+        Returns
+        -------
+        str
+        """
+        return self._child_scope(
+            self.get_scope_for_schema_lvl(schema_name), self.table_path_name, table_name
+        ).oddrn
+
+    def table_oddrns(self, pairs: Iterable[Tuple[str, str]]) -> list[str]:
+        """
+        Get oddrns for many (schema name, table name) pairs.
+
+        Parameters
+        ----------
+            pairs: Iterable[Tuple[str, str]]
+                schema and table names for a source
+
+        Returns
+        -------
+        list[str]
+        """
+        return [self.table_oddrn(schema, table) for schema, table in pairs]
+
+    @staticmethod
+    def _child_scope(scope: Scope, path: str, value: str) -> Scope:
+        # generators keep values passed to get_oddrn_by_path unescaped,
+        # so schema and table names are not escaped here either
+        if not value:
+            raise EmptyPathValueException(f"Path '{path}' is not set up")
+        return Scope(
+            scope.paths_model, f"{scope.child_prefix(path)}{value}", scope, path, value
+        )
+
 
 class ExternalGeneratorBuilder:
     """
@@ -193,6 +277,18 @@ class DeepLvlGenerator(ExternalDbGenerator):
         gen.get_oddrn_by_path(self.schema_path_name, schema_name)
         return gen
 
+    def get_scope_for_schema_lvl(self, schema_name: str) -> Scope:
+        scope = self._schema_scopes.get(schema_name)
+        if scope is None:
+            scope = self._child_scope(
+                self.get_scope_for_database_lvl(), self.schema_path_name, schema_name
+            )
+            with self._schema_scopes_lock:
+                if len(self._schema_scopes) >= SCHEMA_SCOPE_CACHE_SIZE:
+                    del self._schema_scopes[next(iter(self._schema_scopes))]
+                self._schema_scopes[schema_name] = scope
+        return scope
+
 
 class ShallowLvlGenerator(ExternalDbGenerator):
     """
@@ -205,6 +301,9 @@ class ShallowLvlGenerator(ExternalDbGenerator):
     def get_generator_for_schema_lvl(self, schema_name: str) -> Generator:
         return self.get_generator_for_database_lvl()
 
+    def get_scope_for_schema_lvl(self, schema_name: str) -> Scope:
+        return self.get_scope_for_database_lvl()
+
 
 class ExternalPostgresGenerator(DeepLvlGenerator):
     generator_cls = PostgresqlGenerator
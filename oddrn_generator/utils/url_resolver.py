@@ -0,0 +1,115 @@
+from functools import lru_cache
+from typing import Type
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from oddrn_generator.generators import Generator
+from oddrn_generator.utils.external_generators import (
+    ExternalClickHouseGenerator,
+    ExternalDbGenerator,
+    ExternalDbSettings,
+    ExternalGeneratorMappingError,
+    ExternalHiveGenerator,
+    ExternalMssqlGenerator,
+    ExternalMysqlGenerator,
+    ExternalOracleGenerator,
+    ExternalPostgresGenerator,
+    ExternalPrestoGenerator,
+    ExternalRedshiftGenerator,
+    ExternalSnowflakeGenerator,
+    ExternalTrinoGenerator,
+    ExternalVerticaGenerator,
+)
+
+URL_CACHE_SIZE = 1024
+
+# url schemes (without SQLAlchemy driver and "jdbc:" prefix) to external generators
+SCHEMES: dict[str, Type[ExternalDbGenerator]] = {
+    "postgresql": ExternalPostgresGenerator,
+    "postgres": ExternalPostgresGenerator,
+    "mysql": ExternalMysqlGenerator,
+    "mariadb": ExternalMysqlGenerator,
+    "mssql": ExternalMssqlGenerator,
+    "sqlserver": ExternalMssqlGenerator,
+    "oracle": ExternalOracleGenerator,
+    "redshift": ExternalRedshiftGenerator,
+    "clickhouse": ExternalClickHouseGenerator,
+    "vertica": ExternalVerticaGenerator,
+    "snowflake": ExternalSnowflakeGenerator,
+    "presto": ExternalPrestoGenerator,
+    "trino": ExternalTrinoGenerator,
+    "hive": ExternalHiveGenerator,
+    "hive2": ExternalHiveGenerator,
+}
+
+# query and jdbc property names holding database when it is not in url path
+DATABASE_PARAMS = ("database", "databasename", "db", "service_name")
+
+
+def normalize_url(url: str) -> str:
+    """
+    Get url in "scheme://..." form: without "jdbc:" prefix and SQLAlchemy driver,
+    Oracle thin urls are converted to "oracle://host:port/database".
+    """
+    url = url.strip()
+    if url[:5].lower() == "jdbc:":
+        url = url[5:]
+    scheme, separator, rest = url.partition(":")
+    scheme = scheme.lower().split("+", 1)[0]
+    if scheme == "oracle" and "@" in rest and not rest.startswith("//"):
+        # oracle:thin:[user/password]@//host:port/service, @host:port/service
+        # or @host:port:sid
+        address = rest.rsplit("@", 1)[1]
+        if not address.startswith("//"):
+            host, slash, service = address.partition("/")
+            if not slash:
+                host, _, service = address.rpartition(":")
+            address = f"//{host}/{service}"
+        rest = address
+    return f"{scheme}{separator}{rest}"
+
+
+def resolve_url(url: str) -> Generator:
+    """
+    Get generator with host settings and database path set from connection url,
+    e.g. "postgresql://user@host:5432/db" or "jdbc:snowflake://account/?db=db".
+
+    Urls are parsed once per normalized url, but every call returns a new
+    generator, so changing its paths doesn't affect other callers.
+    """
+    return _resolve(normalize_url(url)).get_generator_for_database_lvl()
+
+
+def resolve_external_generator(url: str) -> ExternalDbGenerator:
+    """
+    Get external generator for connection url, it is shared between calls
+    with the same normalized url. It only hands out new generators and
+    immutable scopes, so sharing it doesn't leak paths between callers.
+    """
+    return _resolve(normalize_url(url))
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _resolve(url: str) -> ExternalDbGenerator:
+    url, *properties = url.split(";")
+    parsed = urlsplit(url)
+    external_generator_cls = SCHEMES.get(parsed.scheme)
+    if external_generator_cls is None:
+        raise ExternalGeneratorMappingError(parsed.scheme)
+    if not parsed.hostname:
+        raise ValueError(f"Url '{url}' has no host")
+
+    host = parsed.hostname
+    if parsed.port:
+        host = f"{host}:{parsed.port}"
+    database = unquote(parsed.path.strip("/").split("/", 1)[0])
+    if not database:
+        params = dict(parse_qsl(parsed.query))
+        params.update(p.split("=", 1) for p in properties if "=" in p)
+        params = {k.lower(): v for k, v in params.items()}
+        database = next((params[p] for p in DATABASE_PARAMS if params.get(p)), None)
+    if not database:
+        raise ValueError(f"Url '{url}' has no database")
+
+    return external_generator_cls(
+        ExternalDbSettings(host=host, port=parsed.port, database_name=database)
+    )
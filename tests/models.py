@@ -3,7 +3,7 @@ from typing import Optional
 from pydantic import Field
 
 from oddrn_generator.generators import Generator
-from oddrn_generator.path_models import BasePathsModel, DependenciesMap
+from oddrn_generator.path_models import BasePathsModel
 from oddrn_generator.server_models import HostnameModel
 
 
@@ -26,11 +26,6 @@ class ExamplePathModel(BasePathsModel):
             "field_5_2": ("field_1", "field_2", "field_3", "field_4", "field_5_2"),
         }
 
-    data_source_path: str = Field(default_factory=lambda: None)
-    dependencies_map: DependenciesMap = Field(
-        default_factory=lambda: ExamplePathModel._dependencies_map_factory()
-    )
-
 
 class ExampleGenerator(Generator):
     source = "example_source"
@@ -0,0 +1,154 @@
+import random
+
+import pytest
+
+from oddrn_generator.arrays import get_oddrns_by_arrays
+from oddrn_generator.exceptions import (
+    EmptyPathValueException,
+    PathDoesntExistException,
+    WrongPathOrderException,
+)
+from oddrn_generator.generators import (
+    PostgresqlGenerator,
+    S3Generator,
+    SnowflakeGenerator,
+)
+
+HOST = "//postgresql/host/localhost"
+
+
+def random_values(number, seed):
+    rng = random.Random(seed)
+    alphabet = "ab/\\_ .:"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+        for _ in range(number)
+    ]
+
+
+def scalar_oddrns(generator_cls, path, arrays, **paths):
+    return [
+        generator_cls(
+            host_settings="localhost", **paths, **dict(zip(arrays, map(str, row)))
+        ).get_oddrn_by_path(path)
+        for row in zip(*arrays.values())
+    ]
+
+
+def test_validation_before_import():
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+
+    with pytest.raises(WrongPathOrderException):
+        get_oddrns_by_arrays(generator, "tables", tables=["users"])
+    with pytest.raises(PathDoesntExistException):
+        get_oddrns_by_arrays(generator, "tables", unknown=["users"])
+    with pytest.raises(EmptyPathValueException):
+        get_oddrns_by_arrays(generator, "tables", schemas=["public"])
+    with pytest.raises(ValueError, match="No array is given"):
+        get_oddrns_by_arrays(generator, "databases", schemas=["public"])
+    with pytest.raises(ValueError, match="At least one array"):
+        get_oddrns_by_arrays(generator, "databases")
+
+
+@pytest.mark.parametrize("generator_cls", [PostgresqlGenerator, SnowflakeGenerator])
+def test_numpy_matches_scalar(generator_cls):
+    np = pytest.importorskip("numpy")
+    arrays = {
+        "schemas": np.array(random_values(200, 1)),
+        "tables": random_values(200, 2),
+        "tables_columns": np.array(random_values(200, 3), dtype=object),
+    }
+    generator = generator_cls(host_settings="localhost", databases="d/b")
+
+    oddrns = get_oddrns_by_arrays(generator, "tables_columns", **arrays)
+    assert oddrns.tolist() == scalar_oddrns(
+        generator_cls, "tables_columns", arrays, databases="d/b"
+    )
+
+
+def test_numpy_generator_paths_after_arrays():
+    np = pytest.importorskip("numpy")
+    generator = PostgresqlGenerator(
+        host_settings="localhost", databases="db", schemas="public", tables="users"
+    )
+    oddrns = get_oddrns_by_arrays(generator, "tables", schemas=np.array(["a", "b/c"]))
+    assert oddrns.tolist() == [
+        f"{HOST}/databases/db/schemas/a/tables/users",
+        f"{HOST}/databases/db/schemas/b\\\\c/tables/users",
+    ]
+
+
+def test_numpy_errors():
+    np = pytest.importorskip("numpy")
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+
+    with pytest.raises(EmptyPathValueException):
+        get_oddrns_by_arrays(generator, "schemas", schemas=np.array(["a", ""]))
+    with pytest.raises(EmptyPathValueException):
+        get_oddrns_by_arrays(generator, "schemas", schemas=["a", None])
+    with pytest.raises(ValueError, match="must contain strings"):
+        get_oddrns_by_arrays(generator, "schemas", schemas=np.array([1, 2]))
+    with pytest.raises(ValueError, match="same length"):
+        get_oddrns_by_arrays(generator, "tables", schemas=["a"], tables=["b", "c"])
+
+
+def test_arrow_matches_scalar():
+    pa = pytest.importorskip("pyarrow")
+    arrays = {
+        "schemas": pa.array(random_values(200, 4)),
+        "tables": pa.chunked_array(
+            [random_values(100, 5), random_values(100, 6)], pa.large_string()
+        ),
+        "tables_columns": random_values(200, 7),
+    }
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+
+    oddrns = get_oddrns_by_arrays(generator, "tables_columns", **arrays)
+    assert oddrns.to_pylist() == scalar_oddrns(
+        PostgresqlGenerator,
+        "tables_columns",
+        {
+            name: values if isinstance(values, list) else values.to_pylist()
+            for name, values in arrays.items()
+        },
+        databases="db",
+    )
+
+
+def test_arrow_errors():
+    pa = pytest.importorskip("pyarrow")
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+
+    with pytest.raises(EmptyPathValueException):
+        get_oddrns_by_arrays(generator, "schemas", schemas=pa.array(["a", None]))
+    with pytest.raises(EmptyPathValueException):
+        get_oddrns_by_arrays(generator, "schemas", schemas=pa.array(["a", ""]))
+    with pytest.raises(ValueError, match="must contain strings"):
+        get_oddrns_by_arrays(generator, "schemas", schemas=pa.array([1, 2]))
+
+
+def test_empty_arrays():
+    np = pytest.importorskip("numpy")
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+
+    for schemas in ([], np.array([], dtype=str)):
+        oddrns = get_oddrns_by_arrays(generator, "schemas", schemas=schemas)
+        assert isinstance(oddrns, np.ndarray) and oddrns.tolist() == []
+
+    pa = pytest.importorskip("pyarrow")
+    oddrns = get_oddrns_by_arrays(
+        generator, "tables", schemas=pa.array([], pa.string()), tables=[]
+    )
+    assert oddrns.type == pa.large_string() and oddrns.to_pylist() == []
+
+
+@pytest.mark.parametrize("keys", [["a", "/"], ["/", "/"], ["/"], ["a/", "//"]])
+def test_numpy_escapes_narrow_values(keys):
+    pytest.importorskip("numpy")
+    generator = S3Generator(buckets="bucket")
+
+    oddrns = get_oddrns_by_arrays(generator, "keys", keys=keys)
+    assert oddrns.tolist() == [
+        S3Generator(buckets="bucket", keys=key).get_oddrn_by_path("keys")
+        for key in keys
+    ]
@@ -0,0 +1,84 @@
+import pytest
+
+from oddrn_generator.bulk import (
+    OddrnRecord,
+    generate_oddrn_chunks,
+    generate_oddrns,
+)
+from oddrn_generator.exceptions import EmptyPathValueException
+from oddrn_generator.generators import (
+    PostgresqlGenerator,
+    S3Generator,
+    SQLiteGenerator,
+)
+
+
+def records(count: int):
+    for i in range(count):
+        if i % 2:
+            yield OddrnRecord("s3", {}, "keys", {"buckets": "bucket", "keys": f"k/{i}"})
+        else:
+            yield OddrnRecord(
+                "postgresql",
+                {"host_settings": f"host{i % 3}"},
+                "tables",
+                {"databases": "db", "schemas": "public", "tables": f"table{i}"},
+            )
+
+
+def expected(count: int) -> list[str]:
+    return [
+        (S3Generator if record.source == "s3" else PostgresqlGenerator).oddrn(
+            record.path, **record.settings, **record.paths
+        )
+        for record in records(count)
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_oddrns_keeps_order(workers):
+    oddrns = generate_oddrns(records(1000), workers=workers, chunk_size=64)
+    assert list(oddrns) == expected(1000)
+
+
+def test_generate_oddrn_chunks():
+    chunks = list(generate_oddrn_chunks(records(250), workers=2, chunk_size=100))
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+
+    unordered = generate_oddrn_chunks(
+        records(250), workers=2, chunk_size=100, ordered=False
+    )
+    assert sorted(sum(unordered, [])) == sorted(expected(250))
+
+
+def test_generate_oddrns_errors():
+    bad = [
+        OddrnRecord("postgresql", {"host_settings": "h"}, "schemas", {"databases": "d"})
+    ]
+    with pytest.raises(EmptyPathValueException):
+        list(generate_oddrns(bad, workers=2))
+    with pytest.raises(ValueError):
+        list(generate_oddrns(records(1), chunk_size=0))
+
+
+def test_generate_sqlite_oddrns(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.db").touch()
+    paths = {"path": "data.db", "tables": "users"}
+
+    oddrns = generate_oddrns([OddrnRecord("sqlite", {}, "tables", paths)], workers=1)
+    assert list(oddrns) == [SQLiteGenerator(**paths).get_oddrn_by_path("tables")]
+
+
+@pytest.mark.parametrize(
+    "settings, paths, match",
+    [
+        ({"host_settings": "h", "databases": "a"}, {"databases": "b"}, "both"),
+        ({"cloud_settings": "x"}, {"databases": "db"}, "must be a mapping"),
+        ({"host_settings": "h"}, ["databases"], "must be mappings"),
+    ],
+)
+def test_generate_oddrns_invalid_records(settings, paths, match):
+    bad = [OddrnRecord("postgresql", settings, "databases", paths)]
+    with pytest.raises(ValueError, match=match):
+        list(generate_oddrns(bad, workers=1))
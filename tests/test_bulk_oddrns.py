@@ -0,0 +1,62 @@
+import pytest
+
+from oddrn_generator.exceptions import (
+    EmptyPathValueException,
+    PathDoesntExistException,
+    WrongPathOrderException,
+)
+from oddrn_generator.generators import PostgresqlGenerator, S3Generator
+
+
+def test_get_oddrns_by_path():
+    generator = PostgresqlGenerator(
+        host_settings="127.0.0.1:5432",
+        databases="some_database",
+        schemas="some_schema",
+        tables="some_table",
+    )
+    columns = ["id", "name", "age"]
+
+    assert generator.get_oddrns_by_path("tables_columns", columns) == [
+        generator.get_oddrn_by_path("tables_columns", column) for column in columns
+    ]
+
+
+def test_get_oddrns_by_path_does_not_mutate_generator():
+    generator = PostgresqlGenerator(
+        host_settings="127.0.0.1:5432",
+        databases="some_database",
+        schemas="some_schema",
+        tables="some_table",
+    )
+    generator.get_oddrns_by_path("tables", ["another_table"])
+
+    assert (
+        generator.get_oddrn_by_path("tables")
+        == "//postgresql/host/127.0.0.1:5432/databases/some_database/schemas/some_schema/tables/some_table"
+    )
+    with pytest.raises(EmptyPathValueException):
+        generator.get_oddrn_by_path("tables_columns")
+
+
+def test_iter_oddrns_by_path_escapes_values():
+    generator = S3Generator(buckets="accounts")
+    oddrns = generator.iter_oddrns_by_path("keys", iter(["a.csv", "b/c.csv"]))
+
+    assert next(oddrns) == "//s3/cloud/aws/buckets/accounts/keys/a.csv"
+    assert next(oddrns) == "//s3/cloud/aws/buckets/accounts/keys/b\\\\c.csv"
+    with pytest.raises(StopIteration):
+        next(oddrns)
+
+
+def test_get_oddrns_by_path_errors():
+    generator = PostgresqlGenerator(
+        host_settings="127.0.0.1:5432", databases="some_database"
+    )
+
+    with pytest.raises(WrongPathOrderException):
+        generator.iter_oddrns_by_path("tables", ["some_table"])
+    with pytest.raises(PathDoesntExistException):
+        generator.get_oddrns_by_path("jobs", ["some_job"])
+    with pytest.raises(EmptyPathValueException):
+        generator.get_oddrns_by_path("schemas", ["some_schema", ""])
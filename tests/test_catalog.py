@@ -0,0 +1,130 @@
+import sqlite3
+
+import pytest
+
+from oddrn_generator.catalog import CatalogOddrn, iter_catalog_oddrns
+from oddrn_generator.exceptions import EmptyPathValueException
+from oddrn_generator.generators import (
+    MssqlGenerator,
+    MysqlGenerator,
+    PostgresqlGenerator,
+    SnowflakeGenerator,
+    SQLiteGenerator,
+)
+
+HOST = "//postgresql/host/localhost"
+
+ROWS = [
+    ("db", "public", "users", "id"),
+    ("db", "public", "users", "name"),
+    ("db", "public", "orders", None),
+    ("db", "sales", "users", "id"),
+    ("db", "sales", "a/b", "c/d"),
+]
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute(
+        'CREATE TABLE "columns" '
+        "(table_catalog, table_schema, table_name, column_name, ordinal_position)"
+    )
+    connection.executemany(
+        'INSERT INTO "columns" VALUES (?, ?, ?, ?, ?)',
+        [(*row, position) for position, row in enumerate(ROWS)],
+    )
+    yield connection
+    connection.close()
+
+
+def catalog_cursor(connection):
+    return connection.execute(
+        "SELECT table_catalog, table_schema, table_name, column_name "
+        'FROM "columns" ORDER BY ordinal_position'
+    )
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 1000])
+def test_catalog_oddrns(connection, batch_size):
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+    oddrns = list(
+        iter_catalog_oddrns(generator, catalog_cursor(connection), batch_size)
+    )
+
+    assert oddrns == [
+        CatalogOddrn(
+            f"{HOST}/databases/db/schemas/public/tables/users",
+            f"{HOST}/databases/db/schemas/public/tables/users/columns/id",
+        ),
+        CatalogOddrn(
+            f"{HOST}/databases/db/schemas/public/tables/users",
+            f"{HOST}/databases/db/schemas/public/tables/users/columns/name",
+        ),
+        CatalogOddrn(f"{HOST}/databases/db/schemas/public/tables/orders", None),
+        CatalogOddrn(
+            f"{HOST}/databases/db/schemas/sales/tables/users",
+            f"{HOST}/databases/db/schemas/sales/tables/users/columns/id",
+        ),
+        CatalogOddrn(
+            f"{HOST}/databases/db/schemas/sales/tables/a\\\\b",
+            f"{HOST}/databases/db/schemas/sales/tables/a\\\\b/columns/c\\\\d",
+        ),
+    ]
+    # rows of one table share its oddrn
+    assert oddrns[0].table is oddrns[1].table
+
+
+@pytest.mark.parametrize("generator_cls", [MssqlGenerator, SnowflakeGenerator])
+def test_catalog_oddrns_match_generator(connection, generator_cls):
+    generator = generator_cls(host_settings="localhost", databases="db")
+    for row, oddrn in zip(
+        ROWS, iter_catalog_oddrns(generator, catalog_cursor(connection))
+    ):
+        if row[3] is None:
+            continue
+        expected = generator_cls(
+            host_settings="localhost",
+            databases=row[0],
+            schemas=row[1],
+            tables=row[2],
+            tables_columns=row[3],
+        )
+        assert oddrn.table == expected.get_oddrn_by_path("tables")
+        assert oddrn.column == expected.get_oddrn_by_path("tables_columns")
+
+
+def test_sqlite_catalog(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    connection = sqlite3.connect("data.db")
+    connection.execute("CREATE TABLE users (id, name)")
+    connection.execute("CREATE TABLE orders (id)")
+    cursor = connection.execute(
+        "SELECT 'data.db', NULL, m.name, p.name "
+        "FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p "
+        "WHERE m.type = 'table' ORDER BY m.name, p.cid"
+    )
+
+    oddrns = [oddrn.column for oddrn in iter_catalog_oddrns(SQLiteGenerator(), cursor)]
+    connection.close()
+    assert oddrns == [
+        "//sqlite//path/data.db/tables/orders/columns/id",
+        "//sqlite//path/data.db/tables/users/columns/id",
+        "//sqlite//path/data.db/tables/users/columns/name",
+    ]
+
+
+def test_catalog_errors(connection):
+    connection.execute("INSERT INTO \"columns\" VALUES ('db', NULL, 't', 'c', 9)")
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+    with pytest.raises(EmptyPathValueException):
+        list(iter_catalog_oddrns(generator, catalog_cursor(connection)))
+
+    with pytest.raises(ValueError, match="MysqlGenerator doesn't support"):
+        list(
+            iter_catalog_oddrns(
+                MysqlGenerator(host_settings="localhost", databases="db"), None
+            )
+        )
+    with pytest.raises(ValueError, match="batch_size must be positive"):
+        list(iter_catalog_oddrns(generator, catalog_cursor(connection), 0))
@@ -0,0 +1,114 @@
+import csv
+import io
+import json
+
+import pytest
+
+from oddrn_generator.cli import main, run
+
+RECORDS = [
+    {
+        "source": "postgresql",
+        "settings": {"host_settings": "localhost"},
+        "path": "tables",
+        "paths": {"databases": "db", "schemas": "public", "tables": "users"},
+    },
+    {
+        "source": "postgresql",
+        "settings": {"host_settings": "localhost"},
+        "path": "tables",
+        "paths": {"databases": "db", "tables": "users"},
+    },
+    {"source": "s3", "path": "keys", "paths": {"buckets": "bucket"}},
+    {"source": "unknown", "path": "tables"},
+]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_jsonl(workers):
+    stream = io.StringIO("\n".join(map(json.dumps, RECORDS)) + "\n\nnot json\n")
+    output = io.StringIO()
+    run(stream, output, "jsonl", workers=workers, chunk_size=2)
+
+    rows = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert rows[0] == {
+        "oddrn": "//postgresql/host/localhost/databases/db/schemas/public/tables/users",
+        "error": None,
+    }
+    assert [row["oddrn"] for row in rows[1:]] == [None] * 4
+    assert [row["error"].split(":")[0] for row in rows[1:]] == [
+        "WrongPathOrderException",
+        "EmptyPathValueException",
+        "ValueError",
+        "JSONDecodeError",
+    ]
+
+
+def test_csv(tmp_path, capsys):
+    path = tmp_path / "records.csv"
+    path.write_text(
+        "source,oddrn_path,host_settings,cloud_settings,databases,schemas,tables\n"
+        "postgresql,schemas,localhost,,db,public,\n"
+        'glue,databases,,"{""account"": ""1"", ""region"": ""eu""}",db,,\n'
+        "postgresql,tables,localhost,,db,public,\n"
+    )
+    main([str(path)])
+
+    rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+    assert rows == [
+        ["oddrn", "error"],
+        ["//postgresql/host/localhost/databases/db/schemas/public", ""],
+        ["//glue/cloud/aws/account/1/region/eu/databases/db", ""],
+        ["", "EmptyPathValueException: Path 'tables' is not set up"],
+    ]
+
+
+def test_csv_path_column(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.db").touch()
+    (tmp_path / "records.csv").write_text(
+        "source,oddrn_path,host_settings,path,tables\n"
+        "sqlite,tables,,data.db,users\n"
+        "sqlite,path,,data.db,\n"
+        "filesystem,path,localhost,data/file.csv,\n"
+    )
+    main(["records.csv"])
+
+    rows = list(csv.reader(io.StringIO(capsys.readouterr().out)))
+    assert rows == [
+        ["oddrn", "error"],
+        ["//sqlite//path/data.db/tables/users", ""],
+        ["//sqlite//path/data.db", ""],
+        ["//filesystem/host/localhost/path/data\\\\file.csv", ""],
+    ]
+
+
+def test_jsonl_record_shapes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.db").touch()
+    records = [
+        {
+            "source": "sqlite",
+            "path": "tables",
+            "paths": {"path": "data.db", "tables": "t"},
+        },
+        {"source": "glue", "path": "databases", "settings": {"cloud_settings": "x"}},
+        {
+            "source": "postgresql",
+            "settings": {"host_settings": "localhost", "databases": "a"},
+            "path": "databases",
+            "paths": {"databases": "b"},
+        },
+        {"source": ["postgresql"], "path": "databases"},
+    ]
+    stream = io.StringIO("\n".join(map(json.dumps, records)))
+    output = io.StringIO()
+    run(stream, output, "jsonl")
+
+    rows = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert rows[0] == {"oddrn": "//sqlite//path/data.db/tables/t", "error": None}
+    assert [row["error"] for row in rows[1:]] == [
+        "ValueError: Server setting 'cloud_settings' must be a mapping",
+        "ValueError: 'databases' is given in both settings and paths",
+        "ValueError: Record must have 'source' and 'path' strings",
+    ]
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from oddrn_generator.generators import PostgresqlGenerator, S3Generator
+from oddrn_generator.parser import parse
+from oddrn_generator.utils import (
+    escape,
+    escape_many,
+    escape_paths,
+    unescape,
+    unescape_many,
+)
+
+ALPHABET = "ab/\\. _"
+
+
+def random_values(seed, number=500):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 8)))
+        for _ in range(number)
+    ]
+
+
+def ambiguous(value):
+    # a backslash next to a slash or another backslash reads back as a slash
+    return "\\\\" in value or "\\/" in value or "/\\" in value
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_round_trip(seed):
+    values = [v for v in random_values(seed) if not ambiguous(v)]
+    assert len(values) > 100
+    for value in values:
+        assert unescape(escape(value)) == value
+    assert unescape_many(escape_many(values)) == values
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_batches_match_scalar(seed):
+    values = random_values(seed)
+    escaped = [escape(v) for v in values]
+    assert escape_many(values) == escaped
+    assert unescape_many(escaped) == [unescape(v) for v in escaped]
+
+    mixed = [*values[:20], None, 1, *values[20:40]]
+    assert escape_many(mixed) == [escape(v) for v in mixed]
+    paths = {f"path_{i}": v for i, v in enumerate(mixed)}
+    assert escape_paths(paths) == {k: escape(v) for k, v in paths.items()}
+
+
+def test_without_delimiter():
+    values = ["users", "orders", None]
+    assert escape_many(iter(values)) == values
+    assert unescape_many(["a\\b", "c"]) == ["a\\b", "c"]
+    assert escape_many([]) == []
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_generator_round_trip(seed):
+    values = [v for v in random_values(seed, 2000) if v and not ambiguous(v)]
+    rng = random.Random(seed)
+    for _ in range(100):
+        schema, table, key = rng.sample(values, 3)
+
+        generator = PostgresqlGenerator(
+            host_settings="localhost", databases="db", schemas=schema, tables=table
+        )
+        assert parse(generator.get_oddrn_by_path("tables")).paths == {
+            "databases": "db",
+            "schemas": schema,
+            "tables": table,
+        }
+        oddrn = S3Generator(buckets="bucket", keys=key).get_oddrn_by_path("keys")
+        assert parse(oddrn).paths == {"buckets": "bucket", "keys": key}
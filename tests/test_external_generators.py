@@ -0,0 +1,74 @@
+import pytest
+
+from oddrn_generator.exceptions import EmptyPathValueException
+from oddrn_generator.server_models import HostnameModel
+from oddrn_generator.utils import external_generators as external
+from oddrn_generator.utils.external_generators import (
+    DeepLvlGenerator,
+    ExternalDbGenerator,
+    ExternalDbSettings,
+    ShallowLvlGenerator,
+)
+
+
+def external_generators(cls=ExternalDbGenerator):
+    for subclass in cls.__subclasses__():
+        if subclass not in (DeepLvlGenerator, ShallowLvlGenerator):
+            yield subclass
+        yield from external_generators(subclass)
+
+
+# database level generators are built with host settings only
+hostname_generators = [
+    g for g in external_generators() if g.generator_cls.server_model is HostnameModel
+]
+
+
+@pytest.mark.parametrize("external_generator", hostname_generators)
+def test_table_oddrn_matches_table_lvl_generator(external_generator):
+    settings = ExternalDbSettings(host="localhost", port=5432, database_name="db")
+    generator = external_generator(settings)
+    pairs = [("public", "users"), ("public", "orders"), ("sales", "a/b")]
+
+    expected = [
+        generator.get_generator_for_table_lvl(schema, table).get_oddrn_by_path(
+            generator.table_path_name
+        )
+        for schema, table in pairs
+    ]
+    assert [generator.table_oddrn(schema, table) for schema, table in pairs] == (
+        expected
+    )
+    assert generator.table_oddrns(pairs) == expected
+
+
+def test_scopes_are_cached():
+    settings = ExternalDbSettings(host="localhost", port=5432, database_name="db")
+    generator = next(
+        g for g in external_generators() if g.__name__ == "ExternalPostgresGenerator"
+    )(settings)
+
+    assert generator.get_scope_for_database_lvl() is (
+        generator.get_scope_for_database_lvl()
+    )
+    assert generator.get_scope_for_schema_lvl("public") is (
+        generator.get_scope_for_schema_lvl("public")
+    )
+    with pytest.raises(EmptyPathValueException):
+        generator.table_oddrn("public", "")
+
+
+def test_schema_scopes_are_bounded(monkeypatch):
+    monkeypatch.setattr(external, "SCHEMA_SCOPE_CACHE_SIZE", 2)
+    settings = ExternalDbSettings(host="localhost", port=5432, database_name="db")
+    generator = next(
+        g for g in external_generators() if g.__name__ == "ExternalPostgresGenerator"
+    )(settings)
+
+    first = generator.get_scope_for_schema_lvl("first")
+    for schema in ("second", "third"):
+        generator.get_scope_for_schema_lvl(schema)
+    assert len(generator._schema_scopes) == 2
+    # the oldest scope was dropped, an equal one is built again
+    scope = generator.get_scope_for_schema_lvl("first")
+    assert scope is not first and scope.oddrn == first.oddrn
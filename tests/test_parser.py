@@ -0,0 +1,98 @@
+import pytest
+
+from oddrn_generator import parse, parse_many
+from oddrn_generator.exceptions import InvalidOddrnException
+from oddrn_generator.generators import (
+    AzureBlobStorageGenerator,
+    GCSGenerator,
+    S3CustomGenerator,
+    S3Generator,
+    TableauGenerator,
+    TrinoGenerator,
+)
+from tests.params import parameters_cloud, parameters_host
+
+
+@pytest.mark.parametrize("generator_class, settings", parameters_host)
+def test_parse_hostname_generators(generator_class, settings):
+    gen = generator_class(host_settings=settings["host_settings"], **settings["paths"])
+    for path in gen.available_paths:
+        parsed = parse(gen.get_oddrn_by_path(path))
+        assert parsed.generator is generator_class
+        assert parsed.server == {"host": settings["host_settings"]}
+        assert parsed.path == path
+        assert parsed.paths == {
+            dep: settings["paths"][dep] for dep in gen.paths_obj.get_dependency(path)
+        }
+
+
+@pytest.mark.parametrize("generator_class, settings", parameters_cloud)
+def test_parse_cloud_generators(generator_class, settings):
+    gen = generator_class(
+        cloud_settings=settings["cloud_settings"], **settings["paths"]
+    )
+    for path in gen.available_paths:
+        parsed = parse(gen.get_oddrn_by_path(path))
+        assert parsed.generator is generator_class
+        assert parsed.server == settings["cloud_settings"]
+        assert parsed.path == path
+
+
+def test_parse_other_servers():
+    s3 = S3Generator(buckets="bucket", keys="folder/file.csv")
+    parsed = parse(s3.get_oddrn_by_path("keys"))
+    assert parsed.server == {}
+    assert parsed.paths == {"buckets": "bucket", "keys": "folder/file.csv"}
+
+    s3_custom = S3CustomGenerator(endpoint="http://localhost:9000", buckets="bucket")
+    assert parse(s3_custom.get_data_source_oddrn()).server == {"endpoint": "localhost"}
+
+    gcs = GCSGenerator(google_cloud_settings={"project": "project"}, buckets="bucket")
+    assert parse(gcs.get_oddrn_by_path("buckets")).server == {"project": "project"}
+
+    blob = AzureBlobStorageGenerator(
+        azure_cloud_settings={"account": "account", "container": "container"},
+        keys="file.csv",
+    )
+    assert parse(blob.get_oddrn_by_path("keys")).server == {
+        "account": "account",
+        "container": "container",
+    }
+
+
+def test_parse_nested_generator_and_base_oddrn():
+    gen = TrinoGenerator(host_settings="localhost:8080")
+    parsed = parse(gen.base_oddrn)
+    assert parsed.generator is TrinoGenerator
+    assert parsed.path is None
+    assert parsed.paths == {}
+
+
+def test_parse_allowed_null():
+    gen = TableauGenerator(
+        host_settings="localhost", sites="site", databases="db", tables="table"
+    )
+    parsed = parse(gen.get_oddrn_by_path("tables"))
+    assert parsed.path == "tables"
+    assert parsed.paths == {"sites": "site", "databases": "db", "tables": "table"}
+
+
+def test_parse_many():
+    gen = S3Generator(buckets="bucket")
+    oddrns = gen.get_oddrns_by_path("keys", ["a.csv", "b/c.csv"])
+    assert [p.paths["keys"] for p in parse_many(oddrns)] == ["a.csv", "b/c.csv"]
+
+
+@pytest.mark.parametrize(
+    "oddrn",
+    [
+        "postgresql/host/localhost",
+        "//unknown/host/localhost",
+        "//postgresql/cloud/aws",
+        "//postgresql/host/localhost/databases",
+        "//postgresql/host/localhost/jobs/job",
+    ],
+)
+def test_parse_invalid(oddrn):
+    with pytest.raises(InvalidOddrnException):
+        parse(oddrn)
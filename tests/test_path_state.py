@@ -0,0 +1,100 @@
+import pickle
+
+import pytest
+from pydantic import ValidationError
+
+from oddrn_generator.exceptions import (
+    EmptyPathValueException,
+    WrongPathOrderException,
+)
+from oddrn_generator.generators import (
+    PostgresqlGenerator,
+    SQLiteGenerator,
+    TrinoGenerator,
+)
+from oddrn_generator.path_models import PathState, PostgresqlPathsModel
+
+
+def create_generator():
+    return PostgresqlGenerator(
+        host_settings="localhost", databases="db", schemas="public", tables="users"
+    )
+
+
+def test_generator_keeps_compact_state():
+    generator = create_generator()
+    assert isinstance(generator._paths, PathState)
+    assert not hasattr(generator._paths, "__dict__")
+    assert not hasattr(generator, "__dict__")
+    assert not hasattr(TrinoGenerator(host_settings="localhost"), "__dict__")
+
+
+def test_state_round_trip():
+    paths_obj = PostgresqlPathsModel(databases="db", schemas="public")
+    state = paths_obj.to_state()
+
+    assert type(state) is PostgresqlPathsModel.state_class
+    assert state.get("schemas") == "public"
+    assert state.get("tables") is None
+    assert state.get("unknown", "default") == "default"
+    assert repr(state) == "PostgresqlPathsModelState(databases='db', schemas='public')"
+
+    restored = PostgresqlPathsModel.from_state(state)
+    assert restored == paths_obj
+    assert restored.model_fields_set == {"databases", "schemas"}
+
+
+def test_state_pickle():
+    state = create_generator()._paths
+    restored = pickle.loads(pickle.dumps(state))
+    assert type(restored) is type(state)
+    assert repr(restored) == repr(state)
+
+
+def test_paths_obj_is_read_only():
+    generator = create_generator()
+    paths_obj = generator.paths_obj
+    with pytest.raises(ValidationError):
+        paths_obj.tables = "orders"
+    assert generator.get_oddrn_by_path("tables").endswith("/tables/users")
+    assert paths_obj == PostgresqlPathsModel(**paths_obj.model_dump())
+    assert pickle.loads(pickle.dumps(paths_obj)) == paths_obj
+
+    generator.paths_obj = paths_obj.model_copy(update={"tables": "orders"})
+    assert generator.get_oddrn_by_path("tables").endswith("/tables/orders")
+
+
+def test_update_state_keeps_state_on_error():
+    generator = create_generator()
+    state = generator._paths
+
+    with pytest.raises(WrongPathOrderException):
+        generator.set_oddrn_paths(schemas=None)
+    with pytest.raises(ValidationError):
+        generator.set_oddrn_paths(databases=None)
+    assert generator._paths is state
+    assert generator.get_oddrn_by_path("tables").endswith(
+        "/databases/db/schemas/public/tables/users"
+    )
+
+
+def test_update_state_validates_non_str_fields(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.db").touch()
+    generator = SQLiteGenerator(path="data.db", tables="users")
+
+    with pytest.raises(ValidationError):
+        generator.set_oddrn_paths(path="missing.db")
+    assert generator.get_oddrn_by_path("tables").endswith("/tables/users")
+
+
+def test_set_path_value():
+    paths_obj = PostgresqlPathsModel(databases="db")
+    paths_obj.set_path_value("schemas", "public")
+    paths_obj.check_if_path_is_set("schemas")
+    assert paths_obj.schemas == "public"
+
+    with pytest.raises(WrongPathOrderException):
+        paths_obj.set_path_value("tables_columns", "id")
+    with pytest.raises(EmptyPathValueException):
+        paths_obj.check_if_path_is_set("tables")
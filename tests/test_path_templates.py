@@ -0,0 +1,41 @@
+import pytest
+
+from oddrn_generator.generators import TableauGenerator
+from tests.params import parameters_cloud, parameters_host
+
+
+def dump_oddrn(gen, path):
+    dependency = gen.paths_obj.get_dependency(path)
+    paths_dict = gen.paths_obj.model_dump(
+        include=set(dependency), exclude_none=True, by_alias=True
+    )
+    return f"{gen.base_oddrn}/{'/'.join([f'{k}/{v}' for k, v in paths_dict.items()])}"
+
+
+@pytest.mark.parametrize(
+    "generator_class, settings", parameters_host + parameters_cloud
+)
+def test_templates_match_model_dump(generator_class, settings):
+    server = (
+        {"host_settings": settings["host_settings"]}
+        if "host_settings" in settings
+        else {"cloud_settings": settings["cloud_settings"]}
+    )
+    gen = generator_class(**server, **settings["paths"])
+    for path in gen.available_paths:
+        assert gen.get_oddrn_by_path(path) == dump_oddrn(gen, path)
+
+
+def test_templates_skip_allowed_null():
+    gen = TableauGenerator(
+        host_settings="dub01.online.tableau.com",
+        sites="some_site",
+        databases="some_database",
+        tables="some_table",
+        columns="some_column",
+    )
+    assert gen.get_oddrn_by_path("columns") == dump_oddrn(gen, "columns")
+    assert gen.get_oddrn_by_path("columns") == (
+        "//tableau/host/dub01.online.tableau.com/sites/some_site"
+        "/databases/some_database/tables/some_table/columns/some_column"
+    )
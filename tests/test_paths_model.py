@@ -0,0 +1,77 @@
+from typing import Optional
+
+import pytest
+from pydantic import Field
+
+from oddrn_generator.generators import Generator, PostgresqlGenerator, TableauGenerator
+from oddrn_generator.path_models import (
+    BasePathsModel,
+    DependenciesMap,
+    PostgresqlPathsModel,
+)
+from oddrn_generator.server_models import HostnameModel
+
+
+def test_dependency_metadata_is_class_level():
+    first = PostgresqlGenerator(host_settings="localhost", databases="first")
+    second = PostgresqlGenerator(host_settings="localhost", databases="second")
+
+    assert first.paths_obj.dependencies_map is second.paths_obj.dependencies_map
+    assert "dependencies_map" not in first.paths_obj.model_dump()
+    assert set(PostgresqlPathsModel.model_fields) == set(
+        PostgresqlPathsModel.dependencies_map
+    )
+
+
+def test_dependency_metadata_is_frozen():
+    with pytest.raises(TypeError):
+        PostgresqlPathsModel.dependencies_map["jobs"] = ("jobs",)
+
+
+def test_dependency_metadata_tables():
+    assert PostgresqlPathsModel.data_source_path == "databases"
+    assert PostgresqlPathsModel.required_fields == {"databases"}
+    assert PostgresqlPathsModel.aliases == {
+        "tables_columns": "columns",
+        "views_columns": "columns",
+    }
+    assert TableauGenerator.paths_model.allows_null == {"schemas"}
+
+
+def test_metadata_declared_as_fields():
+    # the way paths models were written before metadata became class variables
+    class FieldsPathsModel(BasePathsModel):
+        databases: Optional[str] = None
+        owners: Optional[str] = None
+        tables: Optional[str] = None
+
+        @classmethod
+        def _dependencies_map_factory(cls):
+            return {
+                "databases": ("databases",),
+                "owners": ("owners",),
+                "tables": ("databases", "owners", "tables"),
+            }
+
+        data_source_path: str = "databases"
+        allows_null: list = ["owners"]
+        dependencies_map: DependenciesMap = Field(
+            default_factory=lambda: FieldsPathsModel._dependencies_map_factory()
+        )
+
+    class FieldsGenerator(Generator):
+        source = "fields_paths_model"
+        paths_model = FieldsPathsModel
+        server_model = HostnameModel
+
+    assert set(FieldsPathsModel.model_fields) == {"databases", "owners", "tables"}
+    assert FieldsPathsModel.allows_null == {"owners"}
+    assert FieldsPathsModel.data_source_path == "databases"
+
+    generator = FieldsGenerator(host_settings="h", databases="a", tables="t")
+    assert generator.get_oddrn_by_path("tables") == (
+        "//fields_paths_model/host/h/databases/a/tables/t"
+    )
+    assert generator.get_data_source_oddrn() == (
+        "//fields_paths_model/host/h/databases/a"
+    )
@@ -0,0 +1,67 @@
+import pytest
+
+from oddrn_generator import Generator
+from oddrn_generator.generators import (
+    PostgresqlGenerator,
+    ScyllaDBGenerator,
+    TrinoGenerator,
+)
+
+
+def test_for_source():
+    assert Generator.for_source("postgresql") is PostgresqlGenerator
+    assert Generator.for_source("trino") is TrinoGenerator
+    assert Generator.for_source("scylladb") is ScyllaDBGenerator
+
+    with pytest.raises(ValueError):
+        Generator.for_source("unknown")
+
+
+def test_registry_is_read_only():
+    registry = Generator.registry()
+    assert registry["postgresql"] is PostgresqlGenerator
+    with pytest.raises(TypeError):
+        registry["postgresql"] = TrinoGenerator
+
+
+def test_data_source_argument():
+    generator = Generator(
+        data_source="trino", host_settings="localhost:8080", catalogs="catalog"
+    )
+    assert isinstance(generator, TrinoGenerator)
+    assert (
+        generator.get_oddrn_by_path("catalogs")
+        == "//trino/host/localhost:8080/catalogs/catalog"
+    )
+
+    with pytest.raises(ValueError, match="data_source is invalid"):
+        Generator(data_source="unknown", host_settings="localhost")
+
+
+def test_subclass_keeps_builtin_registration():
+    class CustomPostgresqlGenerator(PostgresqlGenerator):
+        pass
+
+    assert Generator.for_source("postgresql") is PostgresqlGenerator
+
+
+def test_duplicate_source():
+    class DuplicateGenerator(PostgresqlGenerator):
+        source = "postgresql"
+
+    assert Generator.for_source("postgresql") is PostgresqlGenerator
+
+
+def test_redefined_source(monkeypatch):
+    monkeypatch.setattr(Generator, "_registry", dict(Generator._registry))
+
+    class RedefinedGenerator(Generator):
+        source = "postgresql"
+        paths_model = PostgresqlGenerator.paths_model
+        server_model = PostgresqlGenerator.server_model
+
+    assert Generator.for_source("postgresql") is RedefinedGenerator
+    generator = Generator(
+        data_source="postgresql", host_settings="localhost", databases="db"
+    )
+    assert isinstance(generator, RedefinedGenerator)
@@ -0,0 +1,85 @@
+import pytest
+
+from oddrn_generator.exceptions import (
+    EmptyPathValueException,
+    PathDoesntExistException,
+    WrongPathOrderException,
+)
+from oddrn_generator.generators import (
+    GlueGenerator,
+    PostgresqlGenerator,
+    S3Generator,
+    TableauGenerator,
+)
+
+HOST = "//postgresql/host/localhost"
+
+
+def test_scope_matches_generator():
+    generator = PostgresqlGenerator(
+        host_settings="localhost",
+        databases="db",
+        schemas="public",
+        tables="users",
+        tables_columns="id",
+    )
+    scope = PostgresqlGenerator(host_settings="localhost", databases="db").scope(
+        tables_columns="id", databases="db", schemas="public", tables="users"
+    )
+
+    for path in ("databases", "schemas", "tables", "tables_columns"):
+        assert scope.get_oddrn_by_path(path) == generator.get_oddrn_by_path(path)
+    assert scope.oddrn == f"{HOST}/databases/db/schemas/public/tables/users/columns/id"
+
+
+def test_scope_is_immutable():
+    schema = PostgresqlGenerator(host_settings="localhost", databases="db").scope(
+        databases="db", schemas="public"
+    )
+    users = schema.scope(tables="users")
+    orders = schema.scope(tables="orders")
+
+    assert users.parent is schema and orders.parent is schema
+    assert schema.oddrn == f"{HOST}/databases/db/schemas/public"
+    assert users.oddrn == f"{HOST}/databases/db/schemas/public/tables/users"
+    assert orders.get_oddrn_by_path("tables_columns", "id") == (
+        f"{HOST}/databases/db/schemas/public/tables/orders/columns/id"
+    )
+    assert orders.get_oddrns_by_path("tables_columns", ["id", "name"]) == [
+        f"{HOST}/databases/db/schemas/public/tables/orders/columns/id",
+        f"{HOST}/databases/db/schemas/public/tables/orders/columns/name",
+    ]
+    with pytest.raises(EmptyPathValueException):
+        schema.get_oddrn_by_path("tables")
+
+    assert users.child_prefix("tables_columns") == f"{users.oddrn}/columns/"
+    with pytest.raises(WrongPathOrderException):
+        schema.child_prefix("tables_columns")
+
+
+def test_scope_escapes_values():
+    scope = S3Generator().scope(buckets="bucket", keys="folder/file.csv")
+    assert scope.oddrn == "//s3/cloud/aws/buckets/bucket/keys/folder\\\\file.csv"
+
+
+def test_scope_allowed_null():
+    scope = TableauGenerator(host_settings="localhost", sites="site").scope(
+        sites="site", databases="db", tables="table"
+    )
+    assert (
+        scope.oddrn == "//tableau/host/localhost/sites/site/databases/db/tables/table"
+    )
+
+
+def test_scope_errors():
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+    with pytest.raises(WrongPathOrderException, match="without 'schemas'"):
+        generator.scope(databases="db", tables="users")
+    with pytest.raises(PathDoesntExistException):
+        generator.scope(jobs="job")
+    with pytest.raises(EmptyPathValueException):
+        generator.scope(databases="")
+    with pytest.raises(WrongPathOrderException):
+        GlueGenerator(cloud_settings={"account": "a", "region": "r"}).scope(
+            databases="db", jobs="job"
+        )
@@ -0,0 +1,42 @@
+import pytest
+from pydantic import ValidationError
+
+from oddrn_generator.generators import (
+    GCSGenerator,
+    GlueGenerator,
+    PostgresqlGenerator,
+    S3Generator,
+)
+
+
+def test_server_objects_are_reused():
+    first = PostgresqlGenerator(host_settings="localhost", databases="first")
+    second = PostgresqlGenerator(host_settings="localhost", databases="second")
+    other = PostgresqlGenerator(host_settings="otherhost", databases="first")
+
+    assert first.server_obj is second.server_obj
+    assert first.server_obj is not other.server_obj
+    assert other.base_oddrn == "//postgresql/host/otherhost"
+
+    cloud_settings = {"account": "1", "region": "eu"}
+    assert (
+        GlueGenerator(cloud_settings=cloud_settings).server_obj
+        is GlueGenerator(
+            cloud_settings=dict(reversed(cloud_settings.items()))
+        ).server_obj
+    )
+    assert S3Generator().server_obj is S3Generator().server_obj
+
+
+@pytest.mark.parametrize("repeat", range(2))
+def test_validation_errors_are_unchanged(repeat):
+    with pytest.raises(ValueError, match="You must specify host settings"):
+        PostgresqlGenerator(databases="db")
+    with pytest.raises(ValidationError):
+        GlueGenerator(cloud_settings={"account": "1"})
+    with pytest.raises(ValidationError):
+        PostgresqlGenerator(
+            host_settings="localhost", cloud_settings={"account": "1"}, databases="db"
+        )
+    with pytest.raises(ValidationError):
+        GCSGenerator(google_cloud_settings={"project": ["unhashable"]})
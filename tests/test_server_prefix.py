@@ -0,0 +1,43 @@
+from oddrn_generator import server_models
+from oddrn_generator.generators import (
+    GlueGenerator,
+    MysqlGenerator,
+    PostgresqlGenerator,
+    SQLiteGenerator,
+)
+from oddrn_generator.server_models import get_server_prefix
+
+
+def test_base_oddrn_is_shared():
+    first = PostgresqlGenerator(host_settings="localhost:5432", databases="first")
+    second = PostgresqlGenerator(host_settings="localhost:5432", databases="second")
+
+    assert first.base_oddrn == "//postgresql/host/localhost:5432"
+    assert first.base_oddrn is second.base_oddrn
+
+
+def test_server_prefix_is_shared_across_sources():
+    postgres = PostgresqlGenerator(host_settings="localhost", databases="db")
+    mysql = MysqlGenerator(host_settings="localhost", databases="db")
+
+    assert get_server_prefix(postgres.server_obj) == "host/localhost"
+    assert get_server_prefix(postgres.server_obj) is get_server_prefix(mysql.server_obj)
+
+
+def test_server_prefix_depends_on_settings():
+    first = GlueGenerator(cloud_settings={"account": "1", "region": "eu"})
+    second = GlueGenerator(cloud_settings={"account": "2", "region": "eu"})
+
+    assert first.base_oddrn == "//glue/cloud/aws/account/1/region/eu"
+    assert second.base_oddrn == "//glue/cloud/aws/account/2/region/eu"
+    assert SQLiteGenerator().base_oddrn == "//sqlite/"
+
+
+def test_server_prefixes_are_bounded(monkeypatch):
+    monkeypatch.setattr(server_models, "SERVER_CACHE_SIZE", 3)
+    monkeypatch.setattr(server_models, "_server_prefixes", {})
+
+    for index in range(10):
+        generator = PostgresqlGenerator(host_settings=f"host_{index}", databases="db")
+        assert generator.base_oddrn == f"//postgresql/host/host_{index}"
+    assert len(server_models._server_prefixes) == 3
@@ -0,0 +1,111 @@
+import pytest
+from pydantic import ValidationError
+
+from oddrn_generator.exceptions import WrongPathOrderException
+from oddrn_generator.generators import (
+    CassandraGenerator,
+    KubeflowGenerator,
+    PostgresqlGenerator,
+)
+
+HOST = "//postgresql/host/localhost"
+
+
+def create_generator():
+    return PostgresqlGenerator(
+        host_settings="localhost",
+        databases="db",
+        schemas="public",
+        tables="users",
+        tables_columns="id",
+    )
+
+
+def test_set_oddrn_paths_updates_dependent_oddrns():
+    generator = create_generator()
+    assert (
+        generator.get_oddrn_by_path("tables_columns")
+        == f"{HOST}/databases/db/schemas/public/tables/users/columns/id"
+    )
+
+    generator.set_oddrn_paths(schemas="sales")
+    assert generator.get_oddrn_by_path("databases") == f"{HOST}/databases/db"
+    assert (
+        generator.get_oddrn_by_path("tables_columns")
+        == f"{HOST}/databases/db/schemas/sales/tables/users/columns/id"
+    )
+
+    generator.get_oddrn_by_path("tables", "orders")
+    assert (
+        generator.get_oddrn_by_path("tables_columns")
+        == f"{HOST}/databases/db/schemas/sales/tables/orders/columns/id"
+    )
+
+
+def test_set_oddrn_paths_escapes_values():
+    generator = create_generator()
+    generator.set_oddrn_paths(tables="a/b")
+    assert (
+        generator.get_oddrn_by_path("tables")
+        == f"{HOST}/databases/db/schemas/public/tables/a\\\\b"
+    )
+
+
+def test_set_oddrn_paths_wrong_order_leaves_paths_unchanged():
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+    with pytest.raises(WrongPathOrderException):
+        generator.set_oddrn_paths(tables="users")
+    assert generator.paths_obj.tables is None
+
+    generator = create_generator()
+    with pytest.raises(WrongPathOrderException):
+        generator.set_oddrn_paths(tables=None)
+    assert (
+        generator.get_oddrn_by_path("tables")
+        == f"{HOST}/databases/db/schemas/public/tables/users"
+    )
+
+
+def test_set_oddrn_paths_validation_error():
+    generator = create_generator()
+    with pytest.raises(ValidationError):
+        generator.set_oddrn_paths(databases=None)
+    with pytest.raises(ValidationError):
+        generator.set_oddrn_paths(tables="orders", unknown="value")
+    assert generator.paths_obj.databases == "db"
+    assert generator.paths_obj.tables == "users"
+
+
+def test_set_oddrn_paths_after_raw_value():
+    generator = create_generator()
+    # values given to get_oddrn_by_path are kept as they are
+    assert generator.get_oddrn_by_path("tables", "a/b") == (
+        f"{HOST}/databases/db/schemas/public/tables/a/b"
+    )
+    generator.set_oddrn_paths(tables_columns="name")
+    assert generator.get_oddrn_by_path("tables_columns") == (
+        f"{HOST}/databases/db/schemas/public/tables/a\\\\b/columns/name"
+    )
+
+
+def test_set_oddrn_paths_after_failed_value():
+    generator = KubeflowGenerator(host_settings="localhost")
+    with pytest.raises(WrongPathOrderException):
+        generator.get_oddrn_by_path("runs", "run")
+    # the failed value is kept and set_oddrn_paths validates it again
+    with pytest.raises(WrongPathOrderException, match="'runs' can not be without"):
+        generator.set_oddrn_paths(pipelines="pipeline")
+
+
+def test_set_oddrn_paths_shared_alias():
+    generator = CassandraGenerator(
+        host_settings="localhost", keyspaces="k", tables="t", views="v"
+    )
+    # "columns" sets tables_columns and views_columns, like in the constructor
+    generator.set_oddrn_paths(columns="c")
+    assert generator.get_oddrn_by_path("views_columns") == (
+        "//cassandra/host/localhost/keyspaces/k/views/v/columns/c"
+    )
+    assert generator.get_oddrn_by_path("tables_columns") == (
+        "//cassandra/host/localhost/keyspaces/k/tables/t/columns/c"
+    )
@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from oddrn_generator import path_models
+from oddrn_generator.generators import SQLiteGenerator
+from oddrn_generator.path_models import SQLitePathsModel
+
+
+@pytest.fixture
+def stats(tmp_path, monkeypatch):
+    """Count is_file calls in a directory with a data.db file."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.db").touch()
+
+    calls = []
+    is_file = Path.is_file
+
+    def counting_is_file(path):
+        calls.append(path)
+        return is_file(path)
+
+    monkeypatch.setattr(Path, "is_file", counting_is_file)
+    return calls
+
+
+def walk(tables=3, columns=2):
+    oddrns = []
+    for table in range(tables):
+        for column in range(columns):
+            generator = SQLiteGenerator(
+                path="data.db", tables=f"t{table}", tables_columns=f"c{column}"
+            )
+            oddrns.append(generator.get_oddrn_by_path("tables_columns"))
+    return oddrns
+
+
+def test_strict_checks_every_validation(stats):
+    walk()
+    assert len(stats) == 6
+
+    with pytest.raises(ValidationError, match="Path does not point to a file"):
+        SQLiteGenerator(path="missing.db")
+
+
+def test_cached_checks_once_per_path(stats):
+    with SQLitePathsModel.file_check("cached"):
+        oddrns = walk()
+        assert len(stats) == 1
+        assert oddrns[0] == "//sqlite//path/data.db/tables/t0/columns/c0"
+
+        # missing files are not cached
+        for _ in range(2):
+            with pytest.raises(ValidationError):
+                SQLiteGenerator(path="missing.db")
+        assert len(stats) == 3
+
+    # every block starts with an empty cache, strict is back after it
+    with SQLitePathsModel.file_check("cached"):
+        walk()
+    assert len(stats) == 4
+    walk()
+    assert len(stats) == 10
+
+
+def test_cache_is_bounded(stats, tmp_path, monkeypatch):
+    monkeypatch.setattr(path_models, "FILE_CHECK_CACHE_SIZE", 2)
+    for name in ("a.db", "b.db", "c.db"):
+        (tmp_path / name).touch()
+
+    with SQLitePathsModel.file_check("cached"):
+        for name in ("a.db", "b.db", "c.db", "c.db", "a.db"):
+            SQLiteGenerator(path=name)
+    # a.db was dropped for c.db and checked again
+    assert len(stats) == 4
+
+
+def test_skip_never_checks(stats):
+    with SQLitePathsModel.file_check("skip"):
+        generator = SQLiteGenerator(path="offline.db", tables="users")
+        generator.set_oddrn_paths(path="other.db")
+    assert (
+        generator.get_oddrn_by_path("tables") == "//sqlite//path/other.db/tables/users"
+    )
+    assert stats == []
+
+
+def test_file_check_is_not_shared_between_threads(stats):
+    with SQLitePathsModel.file_check("skip"):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(SQLiteGenerator, path="offline.db")
+        with pytest.raises(ValidationError):
+            future.result()
+        SQLiteGenerator(path="offline.db")
+
+
+def test_unknown_file_check():
+    with pytest.raises(ValueError, match="file_check must be one of"):
+        with SQLitePathsModel.file_check("sometimes"):
+            pass
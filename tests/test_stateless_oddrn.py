@@ -0,0 +1,165 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+from oddrn_generator.exceptions import (
+    EmptyPathValueException,
+    PathDoesntExistException,
+    WrongPathOrderException,
+)
+from oddrn_generator.generators import (
+    CassandraGenerator,
+    ElasticSearchGenerator,
+    OracleGenerator,
+    PostgresqlGenerator,
+    S3Generator,
+    SQLiteGenerator,
+)
+from tests.params import parameters_cloud, parameters_host
+
+
+@pytest.mark.parametrize("generator_class, settings", parameters_host)
+def test_oddrn_matches_generator_hostname(generator_class, settings):
+    gen = generator_class(host_settings=settings["host_settings"], **settings["paths"])
+    for path in gen.available_paths:
+        assert generator_class.oddrn(
+            path, host_settings=settings["host_settings"], **settings["paths"]
+        ) == gen.get_oddrn_by_path(path)
+
+
+@pytest.mark.parametrize("generator_class, settings", parameters_cloud)
+def test_oddrn_matches_generator_cloud(generator_class, settings):
+    gen = generator_class(
+        cloud_settings=settings["cloud_settings"], **settings["paths"]
+    )
+    for path in gen.available_paths:
+        assert generator_class.oddrn(
+            path, cloud_settings=settings["cloud_settings"], **settings["paths"]
+        ) == gen.get_oddrn_by_path(path)
+
+
+def test_oddrn_escapes_values():
+    assert (
+        S3Generator.oddrn("keys", buckets="bucket", keys="folder/file.csv")
+        == "//s3/cloud/aws/buckets/bucket/keys/folder\\\\file.csv"
+    )
+
+
+@pytest.mark.parametrize(
+    "path, paths, exception",
+    [
+        ("jobs", {"databases": "db"}, PathDoesntExistException),
+        ("databases", {"databases": "db", "unknown": "x"}, ValidationError),
+        ("databases", {"databases": 5}, ValidationError),
+        ("schemas", {"schemas": "public"}, ValidationError),
+        ("tables", {"databases": "db", "schemas": "public"}, EmptyPathValueException),
+        ("tables", {"databases": "db", "tables": "users"}, WrongPathOrderException),
+    ],
+)
+def test_oddrn_errors(path, paths, exception):
+    with pytest.raises(exception):
+        PostgresqlGenerator.oddrn(path, host_settings="localhost", **paths)
+
+
+def test_oddrn_errors_match_constructor():
+    for paths in ({"databases": 5}, {"databases": "db", "unknown": "x"}, {}):
+        with pytest.raises(ValidationError):
+            PostgresqlGenerator(host_settings="localhost", **paths)
+
+
+def outcome(build):
+    try:
+        return build()
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize(
+    "generator_class, path, paths",
+    [
+        (
+            CassandraGenerator,
+            "views",
+            {
+                "keyspaces": "v",
+                "tables": "a/b",
+                "views": "v",
+                "columns": "a/b",
+                "views_columns": "v",
+            },
+        ),
+        (CassandraGenerator, "keyspaces", {"keyspaces": "a/b", "columns": "a/b"}),
+        (
+            CassandraGenerator,
+            "views_columns",
+            {"keyspaces": "k", "tables": "t", "views": "v", "columns": "c"},
+        ),
+        (
+            CassandraGenerator,
+            "tables_columns",
+            {"keyspaces": "k", "tables": "t", "tables_columns": "c"},
+        ),
+        (ElasticSearchGenerator, "indices", {"indices": "i", "fields": "f"}),
+        (
+            ElasticSearchGenerator,
+            "templates_fields",
+            {"indices": "i", "templates": "t", "fields": "f"},
+        ),
+        (OracleGenerator, "schemas", {"schemas": "s", "columns": "c"}),
+        (
+            OracleGenerator,
+            "tables_columns",
+            {
+                "schemas": "s",
+                "databases": "d",
+                "tables": "t",
+                "views": "v",
+                "columns": "c",
+            },
+        ),
+    ],
+)
+def test_oddrn_matches_constructor_with_shared_aliases(generator_class, path, paths):
+    # "columns" is a field and the alias of tables_columns and views_columns
+    expected = outcome(
+        lambda: generator_class(host_settings="h", **paths).get_oddrn_by_path(path)
+    )
+    assert (
+        outcome(lambda: generator_class.oddrn(path, host_settings="h", **paths))
+        == expected
+    )
+
+
+def test_sqlite_oddrn(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "data.db").touch()
+
+    generator = SQLiteGenerator(path="data.db", tables="users")
+    assert SQLiteGenerator.oddrn(
+        "tables", path="data.db", tables="users"
+    ) == generator.get_oddrn_by_path("tables")
+    assert SQLiteGenerator.oddrn("path", path="data.db") == "//sqlite//path/data.db"
+    # the path is checked like in the constructor
+    with pytest.raises(ValidationError, match="Path does not point to a file"):
+        SQLiteGenerator.oddrn("tables", path="missing.db", tables="users")
+
+
+def test_oddrn_from_many_threads():
+    def build(i: int) -> str:
+        return PostgresqlGenerator.oddrn(
+            "tables_columns",
+            host_settings=f"host{i % 7}:5432",
+            databases=f"db{i % 5}",
+            schemas=f"schema{i % 3}",
+            tables=f"table{i}",
+            tables_columns=f"column{i}",
+        )
+
+    expected = [
+        f"//postgresql/host/host{i % 7}:5432/databases/db{i % 5}"
+        f"/schemas/schema{i % 3}/tables/table{i}/columns/column{i}"
+        for i in range(20000)
+    ]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(build, range(20000), chunksize=64)) == expected
@@ -0,0 +1,142 @@
+import random
+import sys
+
+import pytest
+
+from oddrn_generator.exceptions import InvalidOddrnException
+from oddrn_generator.generators import PostgresqlGenerator, SQLiteGenerator
+from oddrn_generator.trie import OddrnTrie
+
+TABLE = "//postgresql/host/localhost/databases/db/schemas/public/tables/users"
+
+
+def postgres_oddrns():
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+    tree = {
+        "databases": {
+            "db": {
+                "schemas": {
+                    schema: {
+                        "tables": {
+                            table: {"tables_columns": ["id", "name", "a/b"]}
+                            for table in ("users", "orders", "users_old")
+                        },
+                        "views": ["active"],
+                    }
+                    for schema in ("public", "sales")
+                }
+            }
+        }
+    }
+    return [oddrn for _, _, oddrn in generator.walk(tree)]
+
+
+def sqlite_oddrns():
+    generator = SQLiteGenerator()
+    tree = {"path": {"data.db": {"tables": {"users": {"tables_columns": ["id"]}}}}}
+    return [oddrn for _, _, oddrn in generator.walk(tree)]
+
+
+ODDRNS = postgres_oddrns() + sqlite_oddrns() + ["//source", "//source/odd"]
+
+
+def test_set_operations():
+    trie = OddrnTrie(ODDRNS)
+    assert len(trie) == len(set(ODDRNS))
+    assert list(trie) == ODDRNS
+    assert all(oddrn in trie for oddrn in ODDRNS)
+
+    assert f"{TABLE}/columns" not in trie
+    assert "//postgresql/host/localhost/databases" not in trie
+    assert "//postgresql/host/other" not in trie
+    assert "not an oddrn" not in trie
+    assert None not in trie
+
+    trie.add(ODDRNS[0])
+    assert len(trie) == len(ODDRNS)
+
+    trie.remove(TABLE)
+    assert TABLE not in trie
+    assert f"{TABLE}/columns/id" in trie
+    with pytest.raises(KeyError):
+        trie.remove(TABLE)
+    assert not trie.discard(TABLE)
+    assert trie.discard(f"{TABLE}/columns/id")
+    assert len(trie) == len(ODDRNS) - 2
+
+    trie.clear()
+    assert len(trie) == 0
+    assert list(trie) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_matches_set(seed):
+    rng = random.Random(seed)
+    trie, expected = OddrnTrie(), set()
+    for _ in range(2000):
+        oddrn = rng.choice(ODDRNS)
+        operation = rng.random()
+        if operation < 0.5:
+            trie.add(oddrn)
+            expected.add(oddrn)
+        elif operation < 0.8:
+            assert trie.discard(oddrn) == (oddrn in expected)
+            expected.discard(oddrn)
+        else:
+            assert (oddrn in trie) == (oddrn in expected)
+        assert len(trie) == len(expected)
+    assert sorted(trie) == sorted(expected)
+
+    for oddrn in list(expected):
+        trie.remove(oddrn)
+    # nothing is left behind once every oddrn is removed
+    assert trie._root == {}
+
+
+@pytest.mark.parametrize(
+    "prefix",
+    [
+        TABLE,
+        "//postgresql/host/localhost/databases/db/schemas/public",
+        "//postgresql/host/localhost",
+        "//postgresql/host",
+        "//postgresql",
+        "//sqlite//path/data.db/tables/users",
+        "//sqlite//path",
+        "//source",
+        "//missing/host/x",
+    ],
+)
+def test_iter_prefix(prefix):
+    trie = OddrnTrie(ODDRNS)
+    expected = [
+        oddrn for oddrn in ODDRNS if oddrn == prefix or oddrn.startswith(f"{prefix}/")
+    ]
+    assert list(trie.iter_prefix(prefix)) == expected
+
+
+def test_invalid_oddrn():
+    with pytest.raises(InvalidOddrnException):
+        OddrnTrie().add("postgresql/host/localhost")
+
+
+def test_memory_usage():
+    oddrns = [
+        f"//postgresql/host/localhost/databases/db/schemas/public/tables/t{table}"
+        f"/columns/c{column}"
+        for table in range(20)
+        for column in range(50)
+    ]
+    trie = OddrnTrie(oddrns)
+    oddrns_set = set(oddrns)
+    set_size = sys.getsizeof(oddrns_set) + sum(map(sys.getsizeof, oddrns_set))
+    assert 0 < trie.memory_usage() < set_size / 2
+
+    # equal segments of different tables are one string
+    first, second = (
+        trie._root["postgresql"]["host/localhost"]["databases/db"]["schemas/public"][
+            f"tables/t{table}"
+        ]
+        for table in (0, 1)
+    )
+    assert next(iter(first)) is next(iter(second))
@@ -0,0 +1,57 @@
+from oddrn_generator.generators import (
+    GlueGenerator,
+    PostgresqlGenerator,
+    TableauGenerator,
+)
+
+
+def test_try_get_oddrn_by_path():
+    generator = PostgresqlGenerator(
+        host_settings="localhost", databases="db", schemas="public"
+    )
+
+    assert generator.try_get_oddrn_by_path("schemas") == (
+        generator.get_oddrn_by_path("schemas")
+    )
+    assert generator.try_get_oddrn_by_path("tables") is None
+    assert generator.try_get_oddrn_by_path("jobs") is None
+
+    generator.set_oddrn_paths(tables="users")
+    assert generator.try_get_oddrn_by_path("tables") == (
+        "//postgresql/host/localhost/databases/db/schemas/public/tables/users"
+    )
+
+
+def test_try_get_oddrn_by_path_allowed_null():
+    generator = TableauGenerator(
+        host_settings="localhost", sites="site", databases="db", tables="table"
+    )
+    assert generator.try_get_oddrn_by_path("tables") == (
+        "//tableau/host/localhost/sites/site/databases/db/tables/table"
+    )
+    assert generator.try_get_oddrn_by_path("schemas") is None
+
+
+def test_try_get_oddrns_by_path():
+    generator = GlueGenerator(
+        cloud_settings={"account": "1", "region": "eu"},
+        databases="db",
+        tables="table",
+    )
+    columns = ["id", None, "", "a/b"]
+
+    assert generator.try_get_oddrns_by_path("columns", columns) == [
+        generator.get_oddrn_by_path("columns", "id"),
+        None,
+        None,
+        "//glue/cloud/aws/account/1/region/eu/databases/db/tables/table/columns/a\\\\b",
+    ]
+    assert generator.try_get_oddrns_by_path("unknown", ["id"]) == [None]
+
+
+def test_try_get_oddrns_by_path_parents_not_set():
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+    assert generator.try_get_oddrns_by_path("tables", ["users", "orders"]) == [
+        None,
+        None,
+    ]
@@ -0,0 +1,57 @@
+import inspect
+import random
+import types
+
+import pytest
+
+from oddrn_generator import path_models
+from oddrn_generator.exceptions import WrongPathOrderException
+from oddrn_generator.generators import PostgresqlGenerator, TableauGenerator
+from oddrn_generator.path_models import BasePathsModel
+
+PATHS_MODELS = [
+    model
+    for model in vars(path_models).values()
+    # dict[...] aliases pass isinstance(model, type) on Python 3.9
+    if inspect.isclass(model)
+    and not isinstance(model, types.GenericAlias)
+    and issubclass(model, BasePathsModel)
+    and model is not BasePathsModel
+]
+
+
+def full_check(model, values: dict, field: str) -> bool:
+    for deps in reversed(model.dependencies_map[field]):
+        value = values.get(deps)
+        if value is None and deps in model.allows_null:
+            return True
+        if not value:
+            return False
+    return True
+
+
+@pytest.mark.parametrize("model", PATHS_MODELS, ids=lambda m: m.__name__)
+def test_plan_matches_full_check(model):
+    rng = random.Random(model.__name__)
+    fields = list(model.dependencies_map)
+    for _ in range(300):
+        values = {field: rng.choice([None, "", "value"]) for field in fields}
+        suspects = set(model.validation_plan.invalid_fields(values, fields))
+        assert suspects == {f for f in fields if not full_check(model, values, f)}
+
+
+def test_error_messages_are_unchanged():
+    with pytest.raises(
+        WrongPathOrderException,
+        match="'tables_columns' can not be without 'tables' attribute",
+    ):
+        PostgresqlGenerator(
+            host_settings="localhost",
+            databases="db",
+            schemas="public",
+            tables_columns="id",
+        )
+    with pytest.raises(
+        WrongPathOrderException, match="'schemas' can not be without 'databases'"
+    ):
+        TableauGenerator(host_settings="localhost", sites="site", schemas="public")
@@ -0,0 +1,73 @@
+import pytest
+
+from oddrn_generator.exceptions import PathDoesntExistException, WrongPathOrderException
+from oddrn_generator.generators import PostgresqlGenerator
+
+HOST = "//postgresql/host/localhost"
+
+
+def test_walk():
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+    tree = {
+        "databases": {
+            "db": {
+                "schemas": {
+                    "public": {
+                        "tables": {
+                            "users": {"tables_columns": ["id", "name"]},
+                            "orders": None,
+                        },
+                        "views": ["active/users"],
+                    }
+                }
+            }
+        }
+    }
+
+    assert list(generator.walk(tree)) == [
+        ("databases", ("db",), f"{HOST}/databases/db"),
+        ("schemas", ("db", "public"), f"{HOST}/databases/db/schemas/public"),
+        (
+            "tables",
+            ("db", "public", "users"),
+            f"{HOST}/databases/db/schemas/public/tables/users",
+        ),
+        (
+            "tables_columns",
+            ("db", "public", "users", "id"),
+            f"{HOST}/databases/db/schemas/public/tables/users/columns/id",
+        ),
+        (
+            "tables_columns",
+            ("db", "public", "users", "name"),
+            f"{HOST}/databases/db/schemas/public/tables/users/columns/name",
+        ),
+        (
+            "tables",
+            ("db", "public", "orders"),
+            f"{HOST}/databases/db/schemas/public/tables/orders",
+        ),
+        (
+            "views",
+            ("db", "public", "active/users"),
+            f"{HOST}/databases/db/schemas/public/views/active\\\\users",
+        ),
+    ]
+
+
+def test_walk_matches_generator():
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+    tree = {"databases": {"db": {"schemas": {"public": {"tables": ["users"]}}}}}
+
+    for path, values, oddrn in generator.walk(tree):
+        paths = dict(zip(generator.paths_obj.get_dependency(path), values))
+        expected = PostgresqlGenerator(host_settings="localhost", **paths)
+        assert oddrn == expected.get_oddrn_by_path(path)
+
+
+def test_walk_errors():
+    generator = PostgresqlGenerator(host_settings="localhost", databases="db")
+    with pytest.raises(WrongPathOrderException, match="without 'schemas'"):
+        list(generator.walk({"databases": {"db": {"tables": ["users"]}}}))
+    with pytest.raises(PathDoesntExistException):
+        list(generator.walk({"jobs": ["job"]}))